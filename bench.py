@@ -0,0 +1,346 @@
+"""
+에너지 데이터 시뮬레이터 벤치마크
+
+생성(generate_random_test_cases), SQL 직렬화(generate_sql_insert_statements),
+적재(insert_data_to_postgresql) 단계의 테이블별 처리량(rows/s)과 최대 메모리(tracemalloc)를
+1일/30일/365일 분량에 대해 측정하고 결과를 JSON으로 저장합니다.
+
+적재 단계는 임시 로컬 PostgreSQL 클러스터(initdb/pg_ctl)를 띄워서 측정하고,
+initdb를 찾지 못하면 .env/환경변수(DB_HOST 등)의 데이터베이스를 사용합니다.
+
+사용법:
+    python bench.py                                   # 전체 측정 (1, 30, 365일 × 모든 엔진 × 모든 적재 방식)
+    python bench.py --days 1,30 --engines numpy       # 일부만 측정
+    python bench.py --loaders copy --no-memory        # tracemalloc 측정 생략
+    python bench.py --no-db                           # 생성/직렬화만 측정
+    python bench.py --compare bench_results_old.json  # 이전 결과와 rows/s 비교
+"""
+import contextlib
+import datetime
+import json
+import os
+import platform
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import energy_data_simulator as sim
+
+# (테이블 라벨, 테이블명) - TABLE_SPECS 순서
+BENCH_TABLES = tuple((spec.label, name) for name, spec in sim.TABLE_SPECS.items())
+
+BENCH_START_DATE = datetime.date(2025, 8, 1)
+BENCH_SEED = 0
+
+class CountingSink:
+    """
+    print 출력을 버리면서 글자 수만 세는 stdout 대체 객체
+    """
+
+    def __init__(self):
+        self.chars = 0
+
+    def write(self, text):
+        self.chars += len(text)
+        return len(text)
+
+    def flush(self):
+        pass
+
+def measure(func, with_memory):
+    """
+    func()의 실행 시간을 재고, with_memory이면 tracemalloc으로 한 번 더 실행하여 최대 메모리를 잼
+    (tracemalloc은 실행을 느리게 하므로 시간 측정과 따로 실행)
+
+    Returns:
+        tuple: (첫 실행의 반환값, 소요 시간(초), 최대 메모리(바이트) 또는 None)
+    """
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+
+    peak = None
+    if with_memory:
+        tracemalloc.start()
+        try:
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return result, elapsed, peak
+
+def make_result(stage, table, days, rows, elapsed, peak, engine=None, loader=None, **extra):
+    """
+    측정 결과 한 건 (JSON 레코드)
+    """
+    result = {
+        'stage': stage,
+        'engine': engine,
+        'loader': loader,
+        'days': days,
+        'table': table,
+        'rows': rows,
+        'seconds': round(elapsed, 6),
+        'rows_per_sec': round(rows / elapsed, 1) if elapsed > 0 else None,
+        'peak_memory_bytes': peak,
+    }
+    result.update(extra)
+    return result
+
+def print_result(result):
+    """
+    측정 결과 한 줄 출력
+    """
+    variant = '/'.join(v for v in (result['engine'], result['loader']) if v)
+    peak = f"{result['peak_memory_bytes'] / 1024 / 1024:,.1f} MiB" if result['peak_memory_bytes'] is not None else "-"
+    rows_per_sec = f"{result['rows_per_sec']:,.0f}" if result['rows_per_sec'] is not None else "-"
+    print(f"  {result['stage']:<9} {variant:<18} {result['days']:>4}일 {result['table']:<8} "
+          f"{result['rows']:>9,}행 {result['seconds']:>9.3f}초 {rows_per_sec:>12} rows/s  최대 메모리 {peak}")
+
+def generate_table(label, engine, days):
+    """
+    BENCH_START_DATE부터 days일 동안 테이블 하나의 데이터를 생성하여 하나의 TableData로 모음
+    """
+    index = [l for l, _ in BENCH_TABLES].index(label)
+    collected = None
+    for offset in range(days):
+        day = BENCH_START_DATE + datetime.timedelta(days=offset)
+        tables = sim.generate_random_test_cases(only_tables=[label], engine=engine, target_date=day, seed=BENCH_SEED)
+        if collected is None:
+            collected = tables[index]
+        else:
+            collected.extend(tables[index])
+    return collected
+
+def only_table_args(label, table_data):
+    """
+    테이블 하나만 채우고 나머지는 빈 TableData인 7개 인자 목록
+    """
+    return [table_data if l == label else sim.TableData(table_name) for l, table_name in BENCH_TABLES]
+
+def serialize_table(label, table_data):
+    """
+    generate_sql_insert_statements로 테이블 하나의 INSERT 문을 만들고 출력 글자 수를 반환
+    """
+    sink = CountingSink()
+    with contextlib.redirect_stdout(sink):
+        sim.generate_sql_insert_statements(*only_table_args(label, table_data))
+    return sink.chars
+
+def find_pg_bin(argv):
+    """
+    initdb/pg_ctl이 있는 디렉터리 (--pg-bin, PG_BIN 환경변수, PATH 순으로 찾음, 없으면 None)
+    """
+    candidates = [sim.get_cli_option(argv, "--pg-bin"), os.getenv('PG_BIN')]
+    initdb = shutil.which('initdb')
+    if initdb:
+        candidates.append(os.path.dirname(initdb))
+    for candidate in candidates:
+        if candidate and os.path.exists(os.path.join(candidate, 'initdb')) and os.path.exists(os.path.join(candidate, 'pg_ctl')):
+            return candidate
+    return None
+
+def start_local_cluster(pg_bin):
+    """
+    임시 디렉터리에 PostgreSQL 클러스터를 만들고 시작한 뒤 DB_* 환경변수를 그 클러스터로 맞춤
+    (TCP는 열지 않고 데이터 디렉터리 안의 유닉스 소켓으로만 접속)
+
+    Returns:
+        str: 데이터 디렉터리 (stop_local_cluster에 전달)
+    
+    Raises:
+        RuntimeError: initdb 또는 pg_ctl 실패 (root로 실행한 경우 등)
+    """
+    data_dir = tempfile.mkdtemp(prefix='energy_bench_pg_')
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        port = s.getsockname()[1]
+    commands = [
+        [os.path.join(pg_bin, 'initdb'), '-D', data_dir, '-U', 'postgres', '-A', 'trust', '--no-sync'],
+        [os.path.join(pg_bin, 'pg_ctl'), '-D', data_dir, '-l', os.path.join(data_dir, 'server.log'), '-w',
+         '-o', f"-p {port} -k {data_dir} -c listen_addresses=''", 'start'],
+    ]
+    for command in commands:
+        completed = subprocess.run(command, capture_output=True, text=True)
+        if completed.returncode != 0:
+            shutil.rmtree(data_dir, ignore_errors=True)
+            message = (completed.stderr or completed.stdout).strip().splitlines()
+            raise RuntimeError(f"{os.path.basename(command[0])} 실패: {message[0] if message else completed.returncode}")
+    os.environ.update({'DB_HOST': data_dir, 'DB_PORT': str(port), 'DB_NAME': 'postgres', 'DB_USER': 'postgres', 'DB_PASSWORD': ''})
+    return data_dir
+
+def stop_local_cluster(pg_bin, data_dir):
+    """
+    임시 클러스터를 멈추고 데이터 디렉터리를 삭제
+    """
+    subprocess.run([os.path.join(pg_bin, 'pg_ctl'), '-D', data_dir, '-m', 'fast', '-w', 'stop'],
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    shutil.rmtree(data_dir, ignore_errors=True)
+
+def prepare_schema(connection):
+    """
+    벤치마크용 테이블 생성
+    일반 PostgreSQL에는 SYSDATE가 없으므로 기본값을 CURRENT_TIMESTAMP로 바꿔서 생성합니다.
+    """
+    with connection.cursor() as cursor:
+        for ddl in sim.TABLE_DDL.values():
+            cursor.execute(ddl.replace('DEFAULT SYSDATE', 'DEFAULT CURRENT_TIMESTAMP'))
+    connection.commit()
+    sim._schema_ready = True
+
+def truncate_table(table_name):
+    """
+    측정 전에 테이블을 비움
+    """
+    with sim.db_session() as connection:
+        with connection.cursor() as cursor:
+            cursor.execute(f"TRUNCATE {table_name}")
+        connection.commit()
+
+def load_table(label, table_name, table_data, loader):
+    """
+    테이블을 비운 뒤 insert_data_to_postgresql로 적재 (출력은 버림)
+    """
+    truncate_table(table_name)
+    with contextlib.redirect_stdout(CountingSink()):
+        if not sim.insert_data_to_postgresql(*only_table_args(label, table_data), loader=loader):
+            raise RuntimeError(f"{label} 적재 실패 ({loader})")
+
+def git_commit():
+    """
+    현재 git 커밋 해시 (git 저장소가 아니면 None)
+    """
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare_results(old_path, results):
+    """
+    이전 결과 파일과 rows/s를 비교하여 출력
+    """
+    with open(old_path, encoding='utf-8') as f:
+        old = json.load(f)
+    key = lambda r: (r['stage'], r['engine'], r['loader'], r['days'], r['table'])
+    old_by_key = {key(r): r for r in old['results']}
+    print(f"\n{'='*60}")
+    print(f"이전 결과와 비교: {old_path} (커밋 {old['meta'].get('git_commit')})")
+    print(f"{'='*60}")
+    for result in results:
+        previous = old_by_key.get(key(result))
+        if not previous or not previous['rows_per_sec'] or not result['rows_per_sec']:
+            continue
+        change = (result['rows_per_sec'] / previous['rows_per_sec'] - 1) * 100
+        mark = "⚠️" if change <= -10 else "  "
+        variant = '/'.join(v for v in (result['engine'], result['loader']) if v)
+        print(f"{mark} {result['stage']:<9} {variant:<18} {result['days']:>4}일 {result['table']:<8} "
+              f"{previous['rows_per_sec']:>12,.0f} → {result['rows_per_sec']:>12,.0f} rows/s ({change:+.1f}%)")
+
+def main(argv):
+    try:
+        days_list = [int(d) for d in sim.get_cli_option(argv, "--days", "1,30,365").split(',')]
+    except ValueError:
+        print("❌ --days는 쉼표로 구분한 정수입니다. (예: --days 1,30,365)")
+        return 1
+    engines = [e.strip().lower() for e in sim.get_cli_option(argv, "--engines", ','.join(sim.ENGINES)).split(',')]
+    loaders = [l.strip().lower() for l in sim.get_cli_option(argv, "--loaders", ','.join(sim.LOADERS)).split(',')]
+    tables = [t.strip().upper() for t in sim.get_cli_option(argv, "--only", ','.join(l for l, _ in BENCH_TABLES)).split(',')]
+    output_path = sim.get_cli_option(argv, "--output", "bench_results.json")
+    compare_path = sim.get_cli_option(argv, "--compare")
+    with_memory = "--no-memory" not in argv
+    with_db = "--no-db" not in argv
+
+    unknown = [e for e in engines if e not in sim.ENGINES] + [l for l in loaders if l not in sim.LOADERS] + \
+              [t for t in tables if t not in [l for l, _ in BENCH_TABLES]]
+    if unknown:
+        print(f"❌ 알 수 없는 값: {', '.join(unknown)} (엔진: {', '.join(sim.ENGINES)}, 적재 방식: {', '.join(sim.LOADERS)})")
+        return 1
+    if 'numpy' in engines and sim.np is None:
+        print("⚠️ numpy가 설치되어 있지 않아 numpy 엔진은 건너뜁니다.")
+        engines.remove('numpy')
+
+    pg_bin = find_pg_bin(argv) if with_db else None
+    data_dir = None
+    db_label = None
+    if with_db:
+        if pg_bin:
+            try:
+                data_dir = start_local_cluster(pg_bin)
+                db_label = f"local cluster ({pg_bin})"
+                print(f"임시 PostgreSQL 클러스터 시작: {data_dir}")
+            except RuntimeError as e:
+                print(f"⚠️ 임시 클러스터를 시작하지 못했습니다: {e}")
+                pg_bin = None
+        if not pg_bin:
+            db_label = f"env ({sim.get_db_config()['host']}:{sim.get_db_config()['port']}/{sim.get_db_config()['database']})"
+            print(f"⚠️ initdb를 찾지 못해 환경변수의 데이터베이스를 사용합니다: {db_label}")
+
+    results = []
+    meta = {
+        'created_at': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'git_commit': git_commit(),
+        'python': platform.python_version(),
+        'numpy': sim.np.__version__ if sim.np is not None else None,
+        'platform': platform.platform(),
+        'days': days_list,
+        'engines': engines,
+        'loaders': loaders if with_db else [],
+        'memory': with_memory,
+        'database': db_label,
+        'batch_size': sim.get_batch_size(),
+        'upsert': sim.is_upsert_mode(),
+    }
+
+    try:
+        if with_db:
+            with sim.db_session(retries=0) as connection:
+                if not connection:
+                    raise RuntimeError("데이터베이스 연결 실패")
+                prepare_schema(connection)
+                with connection.cursor() as cursor:
+                    cursor.execute("SHOW server_version")
+                    meta['postgres'] = cursor.fetchone()[0]
+
+        print(f"\n{'='*60}")
+        print(f"벤치마크 시작: {', '.join(map(str, days_list))}일 × 엔진 {', '.join(engines)}" + (f" × 적재 {', '.join(loaders)}" if with_db else ""))
+        print(f"{'='*60}")
+
+        for days in days_list:
+            for engine in engines:
+                for label in tables:
+                    table_name = dict(BENCH_TABLES)[label]
+                    table_data, elapsed, peak = measure(lambda: generate_table(label, engine, days), with_memory)
+                    results.append(make_result('generate', label, days, len(table_data), elapsed, peak, engine=engine))
+                    print_result(results[-1])
+
+                    chars, elapsed, peak = measure(lambda: serialize_table(label, table_data), with_memory)
+                    results.append(make_result('serialize', label, days, len(table_data), elapsed, peak, engine=engine, output_chars=chars))
+                    print_result(results[-1])
+
+                    if not with_db:
+                        continue
+                    for loader in loaders:
+                        _, elapsed, peak = measure(lambda: load_table(label, table_name, table_data, loader), with_memory)
+                        results.append(make_result('load', label, days, len(table_data), elapsed, peak, engine=engine, loader=loader))
+                        print_result(results[-1])
+                        truncate_table(table_name)
+    finally:
+        sim.close_connection_pool()
+        if data_dir:
+            stop_local_cluster(pg_bin, data_dir)
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump({'meta': meta, 'results': results}, f, ensure_ascii=False, indent=2)
+    print(f"\n✅ 벤치마크 결과 {len(results)}건을 {output_path}에 저장했습니다.")
+
+    if compare_path:
+        compare_results(compare_path, results)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
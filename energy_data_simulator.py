@@ -3,188 +3,813 @@ import datetime
 import argparse
 from decimal import Decimal, ROUND_HALF_UP
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2 import pool as pg_pool
+from psycopg2.extras import RealDictCursor, execute_batch
 import os
+import io
+import re
+from array import array
 from dotenv import load_dotenv
 import time
 import threading
+import queue
+import contextlib
+import itertools
+import json
+import csv
+import glob
+import heapq
+import functools
+import bisect
+import hashlib
+import asyncio
+import signal
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import numpy as np
+except ImportError:  # numpy 엔진(--engine numpy)을 사용하지 않으면 없어도 동작
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet 내보내기(--format parquet)를 사용하지 않으면 없어도 동작
+    pa = pc = pq = None
 
 # 환경변수 로드 (선택사항)
 load_dotenv()
 
+class PipelineMetrics:
+    """
+    파이프라인 단계별 지표 수집기
+
+    (단계, 대상)마다 실행 횟수, 소요 시간, 행 수, 거부 행 수, 재시도, 오류 횟수를 누적하고
+    마지막 실행의 소요 시간/행 수/시각과 마지막 성공 시각을 기록합니다.
+    단계는 'generate', 'connect', 'ddl', 'insert', 'commit', 'export', 'job'이며,
+    대상은 테이블 라벨('LFD', 'GEN', ...) 또는 스케줄러 작업 이름입니다. (없으면 빈 문자열)
+    스케줄러 작업 스레드에서 동시에 기록해도 안전합니다.
+    """
+
+    COUNTERS = ('runs', 'seconds', 'rows', 'rejected', 'retries', 'errors')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages = {}
+        self.started_at = time.time()
+
+    def _entry(self, stage, target):
+        key = (stage, target or '')
+        entry = self._stages.get(key)
+        if entry is None:
+            entry = dict.fromkeys(self.COUNTERS, 0)
+            entry.update(seconds=0.0, last_seconds=None, last_rows=None, last_status=None, last_timestamp=None, last_success_timestamp=None)
+            self._stages[key] = entry
+        return entry
+
+    def record(self, stage, target='', seconds=None, rows=0, rejected=0, retries=0, errors=0):
+        """
+        단계 실행 한 번을 기록
+        seconds가 None이면 실행 횟수와 마지막 실행 정보는 그대로 두고 카운터만 더합니다.
+        """
+        with self._lock:
+            entry = self._entry(stage, target)
+            entry['rows'] += rows
+            entry['rejected'] += rejected
+            entry['retries'] += retries
+            entry['errors'] += errors
+            if seconds is None:
+                return
+            now = time.time()
+            entry['runs'] += 1
+            entry['seconds'] += seconds
+            entry['last_seconds'] = seconds
+            entry['last_rows'] = rows
+            entry['last_status'] = 'error' if errors else 'ok'
+            entry['last_timestamp'] = now
+            if not errors:
+                entry['last_success_timestamp'] = now
+
+    @contextlib.contextmanager
+    def stage(self, stage, target=''):
+        """
+        with 블록의 소요 시간을 단계 실행 한 번으로 기록하는 컨텍스트 매니저
+
+        블록 안에서 돌려받은 dict의 rows/rejected/retries/errors 값을 채우면 함께 기록되고,
+        블록에서 예외가 나면 오류 한 번으로 기록한 뒤 예외를 그대로 전달합니다.
+
+        사용 예:
+            with METRICS.stage('insert', 'LFD') as observation:
+                observation['rows'] = load(...)
+        """
+        observation = {'rows': 0, 'rejected': 0, 'retries': 0, 'errors': 0}
+        started = time.perf_counter()
+        try:
+            yield observation
+        except Exception:
+            observation['errors'] += 1
+            self.record(stage, target, time.perf_counter() - started, **observation)
+            raise
+        self.record(stage, target, time.perf_counter() - started, **observation)
+
+    def reset(self):
+        """
+        누적한 지표를 모두 지움
+        """
+        with self._lock:
+            self._stages = {}
+
+    def snapshot(self, reset=False):
+        """
+        현재까지의 지표를 JSON으로 바꿀 수 있는 dict로 반환 (reset=True이면 반환 후 초기화)
+        """
+        with self._lock:
+            stages = [dict(stage=stage, target=target, **entry) for (stage, target), entry in sorted(self._stages.items())]
+            if reset:
+                self._stages = {}
+        return {
+            'started_at': self.started_at,
+            'generated_at': time.time(),
+            'pid': os.getpid(),
+            'stages': stages,
+        }
+
+    def merge(self, snapshot):
+        """
+        다른 프로세스(백필 워커)의 snapshot을 합침
+        카운터는 더하고, 마지막 실행 정보는 더 최근 것을 사용합니다.
+        """
+        with self._lock:
+            for item in snapshot['stages']:
+                entry = self._entry(item['stage'], item['target'])
+                for counter in self.COUNTERS:
+                    entry[counter] += item[counter]
+                if item['last_timestamp'] and (entry['last_timestamp'] or 0) <= item['last_timestamp']:
+                    for field in ('last_seconds', 'last_rows', 'last_status', 'last_timestamp'):
+                        entry[field] = item[field]
+                if item['last_success_timestamp'] and (entry['last_success_timestamp'] or 0) < item['last_success_timestamp']:
+                    entry['last_success_timestamp'] = item['last_success_timestamp']
+
+    def to_prometheus(self):
+        """
+        Prometheus 텍스트 형식(exposition format 0.0.4)으로 변환
+        """
+        snapshot = self.snapshot()
+        metrics = (
+            ('runs', 'energy_sim_stage_runs_total', 'counter', '단계 실행 횟수'),
+            ('seconds', 'energy_sim_stage_duration_seconds_total', 'counter', '단계 누적 소요 시간 (초)'),
+            ('rows', 'energy_sim_stage_rows_total', 'counter', '단계에서 생성/적재한 누적 행 수'),
+            ('rejected', 'energy_sim_stage_rejected_rows_total', 'counter', '적재가 거부되어 dead-letter 파일에 기록된 누적 행 수'),
+            ('retries', 'energy_sim_stage_retries_total', 'counter', '재시도 횟수 (재연결, 행 단위 재적재, 작업 재시도)'),
+            ('errors', 'energy_sim_stage_errors_total', 'counter', '실패한 단계 실행 횟수'),
+            ('last_seconds', 'energy_sim_stage_last_duration_seconds', 'gauge', '마지막 실행의 소요 시간 (초)'),
+            ('last_rows', 'energy_sim_stage_last_rows', 'gauge', '마지막 실행의 행 수'),
+            ('last_timestamp', 'energy_sim_stage_last_run_timestamp_seconds', 'gauge', '마지막 실행 시각 (유닉스 시간)'),
+            ('last_success_timestamp', 'energy_sim_stage_last_success_timestamp_seconds', 'gauge', '마지막 성공 시각 (유닉스 시간)'),
+        )
+        lines = [
+            '# HELP energy_sim_start_time_seconds 시뮬레이터 프로세스 시작 시각 (유닉스 시간)',
+            '# TYPE energy_sim_start_time_seconds gauge',
+            f"energy_sim_start_time_seconds {snapshot['started_at']:.3f}",
+        ]
+        for field, name, metric_type, help_text in metrics:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for item in snapshot['stages']:
+                value = item[field]
+                if value is None:
+                    continue
+                value_text = str(value) if isinstance(value, int) else f"{value:.6f}"
+                lines.append(f'{name}{{stage="{item["stage"]}",target="{item["target"]}"}} {value_text}')
+        return '\n'.join(lines) + '\n'
+
+# 프로세스 전역 지표 (--metrics-file / --metrics-port로 내보냄)
+METRICS = PipelineMetrics()
+
+def get_metrics_path():
+    """
+    지표 파일 경로 (METRICS_FILE 환경변수, 없으면 None - 파일로 내보내지 않음)
+    확장자가 .prom 또는 .txt이면 Prometheus 텍스트, 그 외에는 JSON으로 기록합니다.
+    """
+    return os.getenv('METRICS_FILE') or None
+
+def write_metrics_file(path=None):
+    """
+    현재 지표를 파일에 기록 (임시 파일에 쓴 뒤 교체하므로 읽는 쪽이 반쯤 쓰인 파일을 보지 않음)
+    node_exporter의 textfile collector가 .prom 파일을 그대로 수집할 수 있습니다.
+
+    Returns:
+        str: 기록한 경로 (경로가 없거나 실패하면 None)
+    """
+    path = path or get_metrics_path()
+    if not path:
+        return None
+    if path.endswith(('.prom', '.txt')):
+        content = METRICS.to_prometheus()
+    else:
+        content = json.dumps(METRICS.snapshot(), ensure_ascii=False, indent=2) + '\n'
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as metrics_file:
+            metrics_file.write(content)
+        os.replace(temp_path, path)
+    except OSError as e:
+        print(f"⚠️ 지표 파일 기록 실패 ({path}): {e}")
+        return None
+    return path
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    """
+    /metrics (Prometheus 텍스트)와 /metrics.json (JSON)을 제공하는 HTTP 핸들러
+    """
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0]
+        if path == '/metrics':
+            body = METRICS.to_prometheus().encode('utf-8')
+            content_type = 'text/plain; version=0.0.4; charset=utf-8'
+        elif path == '/metrics.json':
+            body = json.dumps(METRICS.snapshot(), ensure_ascii=False).encode('utf-8')
+            content_type = 'application/json; charset=utf-8'
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # 스크레이프마다 접근 로그를 출력하지 않음
+
+def start_metrics_server(port, host='0.0.0.0'):
+    """
+    지표 HTTP 서버를 데몬 스레드로 시작
+
+    Returns:
+        ThreadingHTTPServer: 실행 중인 서버 (shutdown()으로 종료, 시작에 실패하면 None)
+    """
+    try:
+        server = ThreadingHTTPServer((host, port), _MetricsRequestHandler)
+    except OSError as e:
+        print(f"⚠️ 지표 서버를 시작하지 못했습니다 ({host}:{port}): {e}")
+        return None
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='metrics-server', daemon=True).start()
+    print(f"📈 지표 서버 시작: http://{host}:{server.server_address[1]}/metrics")
+    return server
+
+def get_db_config():
+    """
+    환경변수에서 PostgreSQL 접속 정보를 읽음 (없으면 기본값 사용)
+    """
+    return {
+        'host': os.getenv('DB_HOST', '192.168.0.3'),
+        'port': os.getenv('DB_PORT', '15432'),
+        'database': os.getenv('DB_NAME', 'megacitydb'),
+        'user': os.getenv('DB_USER', 'postgres'),
+        'password': os.getenv('DB_PASSWORD', 'tef123!@#'),
+    }
+
 def get_db_connection():
     """
-    PostgreSQL 데이터베이스 연결
+    PostgreSQL 데이터베이스 연결 (풀을 거치지 않는 단독 연결)
     """
     try:
-        # 환경변수에서 설정을 가져오거나 기본값 사용
-        host = os.getenv('DB_HOST', '192.168.0.3')
-        port = os.getenv('DB_PORT', '15432')
-        database = os.getenv('DB_NAME', 'megacitydb')
-        user = os.getenv('DB_USER', 'postgres')
-        password = os.getenv('DB_PASSWORD', 'tef123!@#')
-        
-        connection = psycopg2.connect(
-            host=host,
-            port=port,
-            database=database,
-            user=user,
-            password=password
-        )
+        connection = psycopg2.connect(**get_db_config())
         return connection
     except psycopg2.Error as e:
         print(f"데이터베이스 연결 오류: {e}")
         return None
 
-def create_table_if_not_exists(connection):
+# 프로세스별 커넥션 풀과 스키마(DDL) 실행 여부 캐시
+_connection_pool = None
+_connection_pool_pid = None
+_connection_pool_lock = threading.Lock()
+_schema_ready = False
+
+def get_connection_pool():
     """
-    테이블이 존재하지 않으면 생성
+    프로세스 전용 커넥션 풀을 반환 (없으면 생성)
+    fork된 자식 프로세스에서는 부모의 풀을 쓰지 않고 새로 만듭니다.
+    풀 크기는 DB_POOL_MIN/DB_POOL_MAX 환경변수로 조정합니다. (기본값: 1/5, 테이블 동시 적재 수보다 작으면 그만큼 늘림)
+    """
+    global _connection_pool, _connection_pool_pid, _schema_ready
+    with _connection_pool_lock:
+        if _connection_pool is None or _connection_pool_pid != os.getpid():
+            if _connection_pool_pid != os.getpid():
+                _schema_ready = False
+            minconn = int(os.getenv('DB_POOL_MIN', '1'))
+            maxconn = max(int(os.getenv('DB_POOL_MAX', '5')), get_load_concurrency())
+            _connection_pool = pg_pool.ThreadedConnectionPool(minconn, max(minconn, maxconn), **get_db_config())
+            _connection_pool_pid = os.getpid()
+        return _connection_pool
+
+def close_connection_pool():
+    """
+    커넥션 풀의 모든 연결을 닫음 (프로세스 종료 또는 fork 전에 호출)
+    """
+    global _connection_pool, _connection_pool_pid
+    with _connection_pool_lock:
+        if _connection_pool is not None and _connection_pool_pid == os.getpid():
+            _connection_pool.closeall()
+        _connection_pool = None
+        _connection_pool_pid = None
+
+def acquire_connection(retries=3, backoff=1.0):
+    """
+    풀에서 연결을 빌려옴
+    
+    빌린 연결은 SELECT 1로 상태를 확인하고, 끊어진 연결은 버린 뒤 다시 연결합니다.
+    연결에 실패하면 backoff초부터 두 배씩 늘려가며 retries번까지 재시도합니다.
+    
+    Returns:
+        connection: 사용 가능한 연결 (끝까지 실패하면 None)
+    """
+    started = time.perf_counter()
+    for attempt in range(retries + 1):
+        connection = None
+        try:
+            connection_pool = get_connection_pool()
+            connection = connection_pool.getconn()
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            connection.rollback()
+            METRICS.record('connect', seconds=time.perf_counter() - started, retries=attempt)
+            return connection
+        except (psycopg2.Error, pg_pool.PoolError) as e:
+            if connection is not None:
+                try:
+                    _connection_pool.putconn(connection, close=True)
+                except (psycopg2.Error, pg_pool.PoolError):
+                    pass
+            if attempt >= retries:
+                print(f"데이터베이스 연결 오류: {e}")
+                METRICS.record('connect', seconds=time.perf_counter() - started, retries=attempt, errors=1)
+                return None
+            wait_seconds = backoff * (2 ** attempt)
+            print(f"⚠️ 데이터베이스 연결 실패, {wait_seconds:.1f}초 후 다시 연결합니다 ({attempt + 1}/{retries}): {str(e).strip()}")
+            time.sleep(wait_seconds)
+    return None
+
+def release_connection(connection):
+    """
+    빌린 연결을 풀에 반납 (진행 중인 트랜잭션은 롤백, 끊어진 연결은 폐기)
+    """
+    if connection is None or _connection_pool is None or _connection_pool_pid != os.getpid():
+        return
+    try:
+        if connection.closed:
+            _connection_pool.putconn(connection, close=True)
+            return
+        if connection.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+            connection.rollback()
+        _connection_pool.putconn(connection)
+    except (psycopg2.Error, pg_pool.PoolError):
+        try:
+            _connection_pool.putconn(connection, close=True)
+        except (psycopg2.Error, pg_pool.PoolError):
+            pass
+
+@contextlib.contextmanager
+def db_session(retries=3, backoff=1.0):
+    """
+    풀에서 빌린 연결을 with 블록 동안 사용하고 반납하는 세션
+    연결에 실패하면 None을 돌려주므로 호출하는 쪽에서 확인해야 합니다.
+    
+    사용 예:
+        with db_session() as connection:
+            if connection:
+                ensure_schema(connection)
+    """
+    connection = acquire_connection(retries=retries, backoff=backoff)
+    try:
+        yield connection
+    finally:
+        release_connection(connection)
+
+def commit_transaction(connection):
+    """
+    현재 트랜잭션을 커밋하고 소요 시간을 METRICS의 'commit' 단계로 기록
+    """
+    with METRICS.stage('commit'):
+        connection.commit()
+
+def ensure_schema(connection):
+    """
+    테이블 생성(DDL)을 프로세스당 한 번만 실행
+    """
+    global _schema_ready
+    if _schema_ready:
+        return True
+    with METRICS.stage('ddl') as observation:
+        _schema_ready = create_table_if_not_exists(connection)
+        observation['errors'] = 0 if _schema_ready else 1
+    return _schema_ready
+
+class ColumnSpec:
+    """
+    테이블 컬럼 선언 (이름, SQL 타입, 제약, 출력 단위)
+    insert가 False이면 DB가 채우는 컬럼(SERIAL id, created_at 등)으로 적재 컬럼에서 제외합니다.
+    """
+    __slots__ = ('name', 'sql_type', 'constraint', 'unit', 'insert', 'base_type', 'scale')
+    
+    def __init__(self, name, sql_type, constraint='', unit=None, insert=True):
+        self.name = name
+        self.sql_type = sql_type
+        self.constraint = constraint
+        self.unit = unit
+        self.insert = insert
+        self.base_type = sql_type.split('(')[0].strip().upper()
+        match = re.match(r"DECIMAL\s*\(\s*(\d+)\s*,\s*(\d+)\s*\)", sql_type, re.IGNORECASE)
+        self.scale = (int(match.group(1)), int(match.group(2))) if match else None
+    
+    @property
+    def definition(self):
+        """
+        CREATE TABLE / ADD COLUMN에 쓰는 컬럼 정의 ('FCST_QG01 DECIMAL(13,6)')
+        """
+        return ' '.join(part for part in (self.name, self.sql_type, self.constraint) if part)
+
+class TableSpec:
+    """
+    테이블 하나의 선언 (라벨, 컬럼, 기본키, 병합 방식, 통계 모델 학습 기준)
+    
+    DDL, 마이그레이션, 적재 컬럼 순서, INSERT/COPY 문, 결과 출력과 SQL 문 형식은 모두 이 선언에서
+    import 시점에 한 번 만들어집니다. 테이블이나 컬럼을 추가할 때는 TABLE_SPECS의 선언만 고칩니다.
+    
+    Args:
+        name (str): 테이블명
+        label (str): 테이블 라벨 (--only 옵션, 적재 결과 출력, 지표 대상)
+        title (str): 결과 출력 제목
+        columns (list): ColumnSpec 목록 (DDL 순서)
+        primary_key (tuple): 기본키 컬럼
+        natural_key (tuple): 대리키(SERIAL id)만 있는 테이블의 자연키 - 유니크 제약이 없으므로 DELETE 후 INSERT로 병합
+        indexes (dict): 추가 인덱스 {인덱스명: 컬럼 튜플}
+        added_columns (tuple): 나중에 추가된 컬럼 - 이전 DDL로 만든 테이블에는 ADD COLUMN IF NOT EXISTS로 맞춤
+        model (tuple): 통계 모델(--engine model) 학습 기준 (시간대 기준 컬럼, 범주 컬럼 튜플), 없으면 None
+        always_merge (bool): upsert 모드가 아니어도 항상 기본키로 덮어쓰는 테이블
+    """
+    
+    def __init__(self, name, label, title, columns, primary_key, natural_key=None, indexes=None, added_columns=(), model=None, always_merge=False):
+        self.name = name
+        self.label = label
+        self.title = title
+        self.columns = tuple(columns)
+        self.primary_key = tuple(primary_key)
+        self.natural_key = tuple(natural_key) if natural_key else None
+        self.indexes = dict(indexes or {})
+        self.added_columns = tuple(added_columns)
+        self.model = model
+        self.always_merge = always_merge
+        
+        by_name = {column.name: column for column in self.columns}
+        self.insert_columns = tuple(column.name for column in self.columns if column.insert)
+        self.column_types = [(column.name, column.base_type) for column in self.columns]
+        self.numeric_columns = frozenset(column.name for column in self.columns if column.base_type == 'DECIMAL')
+        self.decimal_scales = {column.name: column.scale for column in self.columns if column.scale}
+        self.units = {column.name: column.unit for column in self.columns if column.unit}
+        # 기준 시각 컬럼 (예측 테이블은 생성시각 CRTN_TM, 실측 테이블은 TM) - 재생 순서와 증분 생성 워터마크의 기준
+        self.time_column = 'CRTN_TM' if 'CRTN_TM' in self.insert_columns else 'TM'
+        # 병합(upsert) 키 - 자연키가 있으면 자연키, 없으면 기본키
+        self.merge_keys = self.natural_key or self.primary_key
+        if not self.merge_keys or not set(self.merge_keys) <= set(self.insert_columns):
+            raise RuntimeError(f"{name}: 병합 키 {self.merge_keys}가 적재 컬럼에 없습니다.")
+        
+        self.ddl = self._create_sql(self.primary_key)
+        # 기준 시각 컬럼으로 범위 분할한 테이블 (DB_PARTITION) - 분할 테이블의 기본키에는 분할 키가 들어가야 하므로
+        # 기본키에 기준 시각 컬럼이 없는 테이블(LFD의 SERIAL id)은 (id, CRTN_TM)이 됩니다.
+        partition_key = self.primary_key if self.time_column in self.primary_key else self.primary_key + (self.time_column,)
+        self.partitioned_ddl = self._create_sql(partition_key, f" PARTITION BY RANGE ({self.time_column})")
+        self.migrations = [f"ALTER TABLE {name} ADD COLUMN IF NOT EXISTS {by_name[column].definition}" for column in self.added_columns]
+        
+        self.column_list = ', '.join(self.insert_columns)
+        self.insert_sql = f"INSERT INTO {name} ({self.column_list}) VALUES ({', '.join(['%s'] * len(self.insert_columns))})"
+        if always_merge:
+            update_list = ', '.join(f"{column} = EXCLUDED.{column}" for column in self.insert_columns if column not in self.primary_key)
+            self.insert_sql += f"\nON CONFLICT ({', '.join(self.primary_key)})\nDO UPDATE SET {update_list}"
+        self.copy_sql = f"COPY {name} ({self.column_list}) FROM STDIN"
+        
+        # generate_sql_insert_statements의 값 형식 (문자열은 따옴표, TIMESTAMP는 TO_TIMESTAMP, 숫자는 그대로)
+        literal_formats = {
+            'VARCHAR': "'{}'".format,
+            'TIMESTAMP': "TO_TIMESTAMP('{}', 'YYYY-MM-DD HH24:MI:SS')".format,
+        }
+        self._literals = tuple(literal_formats.get(by_name[column].base_type, str) for column in self.insert_columns)
+    
+    def _create_sql(self, primary_key, suffix=''):
+        """
+        CREATE TABLE 문과 인덱스 (primary_key를 기본키로, suffix는 PARTITION BY 절)
+        """
+        definitions = [column.definition for column in self.columns] + [f"PRIMARY KEY ({', '.join(primary_key)})"]
+        sql = f"CREATE TABLE IF NOT EXISTS {self.name} (\n    " + ',\n    '.join(definitions) + f"\n){suffix};"
+        for index_name, index_columns in self.indexes.items():
+            sql += f"\nCREATE INDEX IF NOT EXISTS {index_name} ON {self.name} ({', '.join(index_columns)});"
+        return sql
+    
+    def sql_literals(self, values):
+        """
+        적재 컬럼 순서의 값 튜플을 SQL 리터럴 목록으로 변환 (None은 NULL)
+        """
+        return ['NULL' if value is None else literal(value) for literal, value in zip(self._literals, values)]
+    
+    def format_field(self, column, value):
+        """
+        결과 출력용 한 줄 ('FCST_QG01    :    61234.567890 MWh')
+        """
+        unit = self.units.get(column)
+        if unit is None or value is None:
+            return f"{column:12} : {value}"
+        return f"{column:12} : {value:>15.{self.decimal_scales[column][1]}f} {unit}"
+
+# 일곱 테이블 선언 (DDL, 적재, 출력, 내보내기, 재생의 기준)
+TABLE_SPECS = {spec.name: spec for spec in (
+    TableSpec(
+        'REP_DATA_RE_FCST_LFD_DA', 'LFD', '수요예측 데이터',
+        [
+            ColumnSpec('id', 'SERIAL', insert=False),
+            ColumnSpec('CRTN_TM', 'VARCHAR(12)', 'NOT NULL'),
+            ColumnSpec('FCST_TM', 'VARCHAR(12)', 'NOT NULL'),
+            ColumnSpec('LEAD_TM', 'VARCHAR(5)', 'NOT NULL'),
+            ColumnSpec('FCST_PROD_CD', 'VARCHAR(2)', 'NOT NULL'),
+            ColumnSpec('FCST_QG01', 'DECIMAL(13,6)', unit='MWh'),
+            ColumnSpec('FCST_QG02', 'DECIMAL(13,6)', unit='MWh'),
+            ColumnSpec('FCST_QG03', 'DECIMAL(13,6)', unit='MWh'),
+            ColumnSpec('FCST_QG04', 'DECIMAL(13,6)', unit='MWh'),
+            ColumnSpec('FCST_QG05', 'DECIMAL(13,6)', unit='MWh'),
+            ColumnSpec('FCST_QG06', 'DECIMAL(13,6)', unit='MWh'),
+            ColumnSpec('FCST_QGEN', 'DECIMAL(13,6)', unit='MWh'),
+            ColumnSpec('FCST_QGMX', 'DECIMAL(13,6)', unit='MWh'),
+            ColumnSpec('FCST_QGMN', 'DECIMAL(13,6)', unit='MWh'),
+            ColumnSpec('REG_DATE', 'TIMESTAMP'),
+            ColumnSpec('UPD_DATE', 'TIMESTAMP'),
+            ColumnSpec('created_at', 'TIMESTAMP', 'DEFAULT CURRENT_TIMESTAMP', insert=False),
+        ],
+        primary_key=('id',),
+        natural_key=('CRTN_TM', 'FCST_TM'),
+        # upsert 모드에서 자연키(CRTN_TM, FCST_TM)로 기존 행을 찾을 때 사용
+        indexes={'IX_REP_DATA_RE_FCST_LFD_DA_TM': ('CRTN_TM', 'FCST_TM')},
+        model=('FCST_TM', ()),
+    ),
+    TableSpec(
+        'REP_DATA_RE_FCST_GEN_DA', 'GEN', '신재생 예측 발전량 데이터',
+        [
+            ColumnSpec('PWR_EXC_TP_CD', 'VARCHAR(2)', 'NOT NULL'),
+            ColumnSpec('FUEL_TP_CD', 'VARCHAR(20)', 'NOT NULL'),
+            ColumnSpec('CRTN_TM', 'VARCHAR(12)', 'NOT NULL'),
+            ColumnSpec('FCST_TM', 'VARCHAR(12)', 'NOT NULL'),
+            ColumnSpec('LEAD_TM', 'VARCHAR(5)'),
+            ColumnSpec('FCST_PROD_CD', 'VARCHAR(2)'),
+            ColumnSpec('FCST_QG01', 'DECIMAL(13,6)', unit='MWh'),
+            ColumnSpec('FCST_QG02', 'DECIMAL(13,6)', unit='MWh'),
+            ColumnSpec('FCST_QG03', 'DECIMAL(13,6)', unit='MWh'),
+            ColumnSpec('FCST_QG04', 'DECIMAL(13,6)', unit='MWh'),
+            ColumnSpec('FCST_QG05', 'DECIMAL(13,6)', unit='MWh'),
+            ColumnSpec('FCST_QG06', 'DECIMAL(13,6)', unit='MWh'),
+            ColumnSpec('FCST_QGEN', 'DECIMAL(13,6)', unit='MWh'),
+            ColumnSpec('FCST_QGMX', 'DECIMAL(13,6)', unit='MWh'),
+            ColumnSpec('FCST_QGMN', 'DECIMAL(13,6)', unit='MWh'),
+            ColumnSpec('FCST_CAPA', 'DECIMAL(13,6)', unit='MWh'),
+            ColumnSpec('ESS_CHRG', 'DECIMAL(13,6)', unit='MWh'),
+            ColumnSpec('ESS_DISC', 'DECIMAL(13,6)', unit='MWh'),
+            ColumnSpec('ESS_CAPA', 'DECIMAL(13,6)', unit='MWh'),
+            ColumnSpec('REG_DATE', 'TIMESTAMP', 'DEFAULT SYSDATE'),
+            ColumnSpec('UPD_DATE', 'TIMESTAMP', 'DEFAULT SYSDATE'),
+        ],
+        primary_key=('PWR_EXC_TP_CD', 'FUEL_TP_CD', 'CRTN_TM', 'FCST_TM'),
+        model=('FCST_TM', ('PWR_EXC_TP_CD', 'FUEL_TP_CD')),
+    ),
+    TableSpec(
+        'REP_DATA_HG_FCST_NWP_DA', 'NWP', '수소 생산단지 기상 예측 데이터',
+        [
+            ColumnSpec('PWR_EXC_TP_CD', 'VARCHAR(2)', 'NOT NULL'),
+            ColumnSpec('AREA_GRP_CD', 'VARCHAR(20)', 'NOT NULL'),
+            ColumnSpec('AREA_GRP_ID', 'VARCHAR(20)', 'NOT NULL'),
+            ColumnSpec('CRTN_TM', 'VARCHAR(12)', 'NOT NULL'),
+            ColumnSpec('FCST_TM', 'VARCHAR(12)', 'NOT NULL'),
+            ColumnSpec('LEAD_TM', 'VARCHAR(5)'),
+            ColumnSpec('FCST_PROD_CD', 'VARCHAR(2)'),
+            ColumnSpec('FCST_SRAD', 'DECIMAL(10,6)', unit='W/m²'),
+            ColumnSpec('FCST_TEMP', 'DECIMAL(10,6)', unit='°C'),
+            ColumnSpec('FCST_HUMI', 'DECIMAL(10,6)', unit='%'),
+            ColumnSpec('FCST_WSPD', 'DECIMAL(10,6)', unit='m/s'),
+            ColumnSpec('FCST_WDIR', 'DECIMAL(10,6)', unit='°'),
+            ColumnSpec('FCST_WSL2', 'DECIMAL(10,6)', unit='m/s'),
+            ColumnSpec('FCST_WDL2', 'DECIMAL(10,6)', unit='°'),
+            ColumnSpec('FCST_PSFC', 'DECIMAL(10,6)', unit='hPa'),
+            ColumnSpec('REG_DATE', 'TIMESTAMP', 'DEFAULT SYSDATE'),
+            ColumnSpec('UPD_DATE', 'TIMESTAMP', 'DEFAULT SYSDATE'),
+        ],
+        primary_key=('PWR_EXC_TP_CD', 'AREA_GRP_CD', 'AREA_GRP_ID', 'CRTN_TM', 'FCST_TM'),
+        added_columns=('FCST_WDIR', 'FCST_WSL2', 'FCST_WDL2'),
+        model=('FCST_TM', ()),
+    ),
+    TableSpec(
+        'REP_DATA_RE_KPX_JEJU_SUKUB_M', 'KPX', '제주 계통 운영 정보 데이터',
+        [
+            ColumnSpec('TM', 'VARCHAR(12)', 'NOT NULL'),
+            ColumnSpec('SUPP_ABILITY', 'DECIMAL(18,5)', unit='MW'),
+            ColumnSpec('CURR_PWR_TOT', 'DECIMAL(18,5)', unit='MW'),
+            ColumnSpec('RENEW_PWR_TOT', 'DECIMAL(18,5)', unit='MW'),
+            ColumnSpec('RENEW_PWR_SOLAR', 'DECIMAL(18,5)', unit='MW'),
+            ColumnSpec('RENEW_PWR_WIND', 'DECIMAL(18,5)', unit='MW'),
+            ColumnSpec('REG_DATE', 'TIMESTAMP', 'DEFAULT SYSDATE'),
+            ColumnSpec('UPD_DATE', 'TIMESTAMP', 'DEFAULT SYSDATE'),
+        ],
+        primary_key=('TM',),
+        model=('TM', ()),
+    ),
+    TableSpec(
+        'REP_DATA_P2H_FCST_CURT_DA', 'CURT', '제주전체 예측 출력제어량 데이터',
+        [
+            ColumnSpec('CRTN_TM', 'VARCHAR(12)', 'NOT NULL'),
+            ColumnSpec('FCST_TM', 'VARCHAR(12)', 'NOT NULL'),
+            ColumnSpec('LEAD_TM', 'VARCHAR(5)', 'NOT NULL'),
+            ColumnSpec('FCST_MINPW', 'DECIMAL(7,2)', unit='MW/m²'),
+            ColumnSpec('FCST_CURT', 'DECIMAL(7,2)', unit='MW/m²'),
+            ColumnSpec('REG_DATE', 'TIMESTAMP', 'DEFAULT SYSDATE'),
+            ColumnSpec('UPD_DATE', 'TIMESTAMP', 'DEFAULT SYSDATE'),
+        ],
+        primary_key=('CRTN_TM', 'FCST_TM'),
+        model=('FCST_TM', ()),
+        always_merge=True,
+    ),
+    TableSpec(
+        'REP_DATA_HG_FCST_GEN_GENT_DA', 'HG_GEN', '수소발전단지 수소 예측 생산량 데이터',
+        [
+            ColumnSpec('AREA_GRP_CD', 'VARCHAR(20)', 'NOT NULL'),
+            ColumnSpec('AREA_GRP_ID', 'VARCHAR(20)', 'NOT NULL'),
+            ColumnSpec('CRTN_TM', 'VARCHAR(12)', 'NOT NULL'),
+            ColumnSpec('FCST_TM', 'VARCHAR(12)', 'NOT NULL'),
+            ColumnSpec('LEAD_TM', 'VARCHAR(5)'),
+            ColumnSpec('FCST_PROD_CD', 'VARCHAR(2)'),
+            ColumnSpec('FCST_QGEN', 'DECIMAL(13,6)', unit='MWh'),
+            ColumnSpec('FCST_CAPA', 'DECIMAL(13,6)', unit='MWh'),
+            ColumnSpec('REG_DATE', 'TIMESTAMP', 'DEFAULT SYSDATE'),
+            ColumnSpec('UPD_DATE', 'TIMESTAMP', 'DEFAULT SYSDATE'),
+        ],
+        primary_key=('AREA_GRP_CD', 'AREA_GRP_ID', 'CRTN_TM', 'FCST_TM'),
+    ),
+    TableSpec(
+        'REP_DATA_HG_MEAS_GEM_GENT_DA', 'HG_MEAS', '수소발전단지 수소 생산량 정보 데이터',
+        [
+            ColumnSpec('TM', 'VARCHAR(12)', 'NOT NULL'),
+            ColumnSpec('AREA_GRP_CD', 'VARCHAR(20)', 'NOT NULL'),
+            ColumnSpec('AREA_GRP_ID', 'VARCHAR(20)', 'NOT NULL'),
+            ColumnSpec('HGEN_PROD', 'DECIMAL(18,5)', unit='KG'),
+            ColumnSpec('HGEN_CAPA', 'DECIMAL(18,5)', unit='KG'),
+            ColumnSpec('REG_DATE', 'TIMESTAMP', 'DEFAULT SYSDATE'),
+            ColumnSpec('UPD_DATE', 'TIMESTAMP', 'DEFAULT SYSDATE'),
+        ],
+        primary_key=('TM', 'AREA_GRP_CD', 'AREA_GRP_ID'),
+    ),
+)}
+
+# TABLE_SPECS에서 만든 테이블별 조회표 (테이블명 → 값)
+TABLE_DDL = {name: spec.ddl for name, spec in TABLE_SPECS.items()}
+TABLE_MIGRATIONS = [sql for spec in TABLE_SPECS.values() for sql in spec.migrations]
+TABLE_COLUMN_TYPES = {name: spec.column_types for name, spec in TABLE_SPECS.items()}
+TABLE_DECIMAL_SCALES = {name: spec.decimal_scales for name, spec in TABLE_SPECS.items()}
+TABLE_PRIMARY_KEYS = {name: spec.primary_key for name, spec in TABLE_SPECS.items()}
+TABLE_INSERT_COLUMNS = {name: spec.insert_columns for name, spec in TABLE_SPECS.items()}
+TABLE_MERGE_KEYS = {name: spec.merge_keys for name, spec in TABLE_SPECS.items()}
+TABLE_LABELS = {name: spec.label for name, spec in TABLE_SPECS.items()}
+TABLE_TIME_COLUMNS = {name: spec.time_column for name, spec in TABLE_SPECS.items()}
+# 테이블 라벨 → 테이블명
+LABEL_TABLES = {spec.label: name for name, spec in TABLE_SPECS.items()}
+
+class TableData:
     """
-    # REP_DATA_RE_FCST_LFD_DA 테이블 생성
-    create_table_lfd_sql = """
-    CREATE TABLE IF NOT EXISTS REP_DATA_RE_FCST_LFD_DA (
-        id SERIAL PRIMARY KEY,
-        CRTN_TM VARCHAR(12) NOT NULL,
-        FCST_TM VARCHAR(12) NOT NULL,
-        LEAD_TM VARCHAR(5) NOT NULL,
-        FCST_PROD_CD VARCHAR(2) NOT NULL,
-        FCST_QG01 DECIMAL(13,6),
-        FCST_QG02 DECIMAL(13,6),
-        FCST_QG03 DECIMAL(13,6),
-        FCST_QG04 DECIMAL(13,6),
-        FCST_QG05 DECIMAL(13,6),
-        FCST_QG06 DECIMAL(13,6),
-        FCST_QGEN DECIMAL(13,6),
-        FCST_QGMX DECIMAL(13,6),
-        FCST_QGMN DECIMAL(13,6),
-        REG_DATE TIMESTAMP,
-        UPD_DATE TIMESTAMP,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    );
-    """
-    
-    # REP_DATA_RE_FCST_GEN_DA 테이블 생성
-    create_table_gen_sql = """
-    CREATE TABLE IF NOT EXISTS REP_DATA_RE_FCST_GEN_DA (
-        PWR_EXC_TP_CD VARCHAR(2) NOT NULL,
-        FUEL_TP_CD VARCHAR(20) NOT NULL,
-        CRTN_TM VARCHAR(12) NOT NULL,
-        FCST_TM VARCHAR(12) NOT NULL,
-        LEAD_TM VARCHAR(5),
-        FCST_PROD_CD VARCHAR(2),
-        FCST_QG01 DECIMAL(13,6),
-        FCST_QG02 DECIMAL(13,6),
-        FCST_QG03 DECIMAL(13,6),
-        FCST_QG04 DECIMAL(13,6),
-        FCST_QG05 DECIMAL(13,6),
-        FCST_QG06 DECIMAL(13,6),
-        FCST_QGEN DECIMAL(13,6),
-        FCST_QGMX DECIMAL(13,6),
-        FCST_QGMN DECIMAL(13,6),
-        FCST_CAPA DECIMAL(13,6),
-        ESS_CHRG DECIMAL(13,6),
-        ESS_DISC DECIMAL(13,6),
-        ESS_CAPA DECIMAL(13,6),
-        REG_DATE TIMESTAMP DEFAULT SYSDATE,
-        UPD_DATE TIMESTAMP DEFAULT SYSDATE,
-        PRIMARY KEY (PWR_EXC_TP_CD, FUEL_TP_CD, CRTN_TM, FCST_TM)
-    );
-    """
-    
-    # REP_DATA_HG_FCST_NWP_DA 테이블 생성
-    create_table_nwp_sql = """
-    CREATE TABLE IF NOT EXISTS REP_DATA_HG_FCST_NWP_DA (
-        PWR_EXC_TP_CD VARCHAR(2) NOT NULL,
-        AREA_GRP_CD VARCHAR(20) NOT NULL,
-        AREA_GRP_ID VARCHAR(20) NOT NULL,
-        CRTN_TM VARCHAR(12) NOT NULL,
-        FCST_TM VARCHAR(12) NOT NULL,
-        LEAD_TM VARCHAR(5),
-        FCST_PROD_CD VARCHAR(2),
-        FCST_SRAD DECIMAL(10,6),
-        FCST_TEMP DECIMAL(10,6),
-        FCST_HUMI DECIMAL(10,6),
-        FCST_WSPD DECIMAL(10,6),
-        FCST_PSFC DECIMAL(10,6),
-        REG_DATE TIMESTAMP DEFAULT SYSDATE,
-        UPD_DATE TIMESTAMP DEFAULT SYSDATE,
-        PRIMARY KEY (PWR_EXC_TP_CD, AREA_GRP_CD, AREA_GRP_ID, CRTN_TM, FCST_TM)
-    );
-    """
-    
-    # REP_DATA_RE_KPX_JEJU_SUKUB_M 테이블 생성
-    create_table_kpx_sql = """
-    CREATE TABLE IF NOT EXISTS REP_DATA_RE_KPX_JEJU_SUKUB_M (
-        TM VARCHAR(12) NOT NULL PRIMARY KEY,
-        SUPP_ABILITY DECIMAL(18,5),
-        CURR_PWR_TOT DECIMAL(18,5),
-        RENEW_PWR_TOT DECIMAL(18,5),
-        RENEW_PWR_SOLAR DECIMAL(18,5),
-        RENEW_PWR_WIND DECIMAL(18,5),
-        REG_DATE TIMESTAMP DEFAULT SYSDATE,
-        UPD_DATE TIMESTAMP DEFAULT SYSDATE
-    );
-    """
-    
-    # REP_DATA_P2H_FCST_CURT_DA 테이블 생성
-    create_table_curt_sql = """
-    CREATE TABLE IF NOT EXISTS REP_DATA_P2H_FCST_CURT_DA (
-        CRTN_TM VARCHAR(12) NOT NULL,
-        FCST_TM VARCHAR(12) NOT NULL,
-        LEAD_TM VARCHAR(5) NOT NULL,
-        FCST_MINPW DECIMAL(7,2),
-        FCST_CURT DECIMAL(7,2),
-        REG_DATE TIMESTAMP DEFAULT SYSDATE,
-        UPD_DATE TIMESTAMP DEFAULT SYSDATE,
-        PRIMARY KEY (CRTN_TM, FCST_TM)
-    );
-    """
-    
-    # REP_DATA_HG_FCST_GEN_GENT_DA 테이블 생성
-    create_table_hg_gen_sql = """
-    CREATE TABLE IF NOT EXISTS REP_DATA_HG_FCST_GEN_GENT_DA (
-        AREA_GRP_CD VARCHAR(20) NOT NULL,
-        AREA_GRP_ID VARCHAR(20) NOT NULL,
-        CRTN_TM VARCHAR(12) NOT NULL,
-        FCST_TM VARCHAR(12) NOT NULL,
-        LEAD_TM VARCHAR(5),
-        FCST_PROD_CD VARCHAR(2),
-        FCST_QGEN DECIMAL(13,6),
-        FCST_CAPA DECIMAL(13,6),
-        REG_DATE TIMESTAMP DEFAULT SYSDATE,
-        UPD_DATE TIMESTAMP DEFAULT SYSDATE,
-        PRIMARY KEY (AREA_GRP_CD, AREA_GRP_ID, CRTN_TM, FCST_TM)
-    );
-    """
-    
-    # REP_DATA_HG_MEAS_GEM_GENT_DA 테이블 생성
-    create_table_hg_meas_sql = """
-    CREATE TABLE IF NOT EXISTS REP_DATA_HG_MEAS_GEM_GENT_DA (
-        TM VARCHAR(12) NOT NULL,
-        AREA_GRP_CD VARCHAR(20) NOT NULL,
-        AREA_GRP_ID VARCHAR(20) NOT NULL,
-        HGEN_PROD DECIMAL(18,5),
-        HGEN_CAPA DECIMAL(18,5),
-        REG_DATE TIMESTAMP DEFAULT SYSDATE,
-        UPD_DATE TIMESTAMP DEFAULT SYSDATE,
-        PRIMARY KEY (TM, AREA_GRP_CD, AREA_GRP_ID)
-    );
+    테이블 하나의 데이터를 컬럼 단위로 저장하는 컨테이너
+    
+    행마다 dict를 두는 대신 컬럼별로 값을 모아서 저장합니다.
+    DECIMAL 컬럼은 array('d'), 나머지 컬럼은 list에 저장하며 DECIMAL의 NULL은 NaN으로 표현합니다.
+    순회하면 기존과 같이 행 dict를 하나씩 만들어서 돌려주므로 print/SQL 출력 코드는 그대로 사용할 수 있습니다.
     """
+    __slots__ = ('table_name', 'columns', 'numeric_columns', '_data')
+    
+    def __init__(self, table_name, columns=None):
+        self.table_name = table_name
+        self.columns = tuple(columns or TABLE_INSERT_COLUMNS[table_name])
+        column_types = dict(TABLE_COLUMN_TYPES.get(table_name, []))
+        self.numeric_columns = frozenset(c for c in self.columns if column_types.get(c) == 'DECIMAL')
+        self._data = {c: array('d') if c in self.numeric_columns else [] for c in self.columns}
+    
+    @classmethod
+    def from_rows(cls, table_name, rows):
+        """
+        dict 목록(기존 형식)을 컬럼형 컨테이너로 변환
+        """
+        table_data = cls(table_name)
+        for row in rows:
+            table_data.append(row)
+        return table_data
+    
+    def __len__(self):
+        return len(self._data[self.columns[0]])
+    
+    def __iter__(self):
+        columns = self.columns
+        for values in self.rows():
+            yield dict(zip(columns, values))
+    
+    def __repr__(self):
+        return f"TableData({self.table_name}, {len(self)} rows)"
+    
+    def column(self, name):
+        """
+        컬럼 하나의 값 배열
+        """
+        return self._data[name]
+    
+    def append(self, row):
+        """
+        행 dict 하나 추가 (DECIMAL 컬럼의 None은 NaN으로 저장)
+        """
+        for column in self.columns:
+            value = row[column]
+            if value is None and column in self.numeric_columns:
+                value = float('nan')
+            self._data[column].append(value)
     
+    def extend_columns(self, values_by_column):
+        """
+        컬럼별 값 묶음을 한 번에 추가 (numpy 배열도 그대로 받음)
+        모든 컬럼의 길이가 같아야 합니다.
+        """
+        lengths = {len(values_by_column[column]) for column in self.columns}
+        if len(lengths) != 1:
+            raise ValueError(f"{self.table_name}: 컬럼 길이가 서로 다릅니다 {sorted(lengths)}")
+        for column in self.columns:
+            values = values_by_column[column]
+            if column in self.numeric_columns and np is not None and isinstance(values, np.ndarray):
+                self._data[column].frombytes(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+            else:
+                self._data[column].extend(values)
+    
+    def slice(self, start, stop):
+        """
+        start번째부터 stop번째 앞까지의 행을 담은 새 컨테이너
+        """
+        table_data = TableData(self.table_name, self.columns)
+        table_data.extend_columns({column: self._data[column][start:stop] for column in self.columns})
+        return table_data
+    
+    def extend(self, other):
+        """
+        같은 테이블의 다른 컨테이너 데이터를 뒤에 이어 붙임
+        """
+        self.extend_columns(other._data)
+    
+    def rows(self, columns=None):
+        """
+        지정한 컬럼 순서의 튜플을 행 단위로 반환 (NaN은 None으로 변환)
+        """
+        columns = columns or self.columns
+        column_values = []
+        for column in columns:
+            values = self._data[column]
+            if column in self.numeric_columns:
+                values = [None if v != v else v for v in values]
+            column_values.append(values)
+        return zip(*column_values)
+
+def as_table_data(table_name, cases):
+    """
+    dict 목록이 들어오면 TableData로 변환하고 TableData는 그대로 반환
+    """
+    if isinstance(cases, TableData):
+        return cases
+    return TableData.from_rows(table_name, cases or [])
+
+def create_table_if_not_exists(connection):
+    """
+    테이블이 존재하지 않으면 생성
+    """
+    granularity = get_partition_granularity()
     try:
         cursor = connection.cursor()
-        cursor.execute(create_table_lfd_sql)
-        cursor.execute(create_table_gen_sql)
-        cursor.execute(create_table_nwp_sql)
-        cursor.execute(create_table_kpx_sql)
-        cursor.execute(create_table_curt_sql)
-        cursor.execute(create_table_hg_gen_sql)
-        cursor.execute(create_table_hg_meas_sql)
+        for spec in TABLE_SPECS.values():
+            cursor.execute(spec.partitioned_ddl if granularity else spec.ddl)
+        for add_column_sql in TABLE_MIGRATIONS:
+            cursor.execute(add_column_sql)
+        if granularity:
+            partitioned = partitioned_tables(cursor)
+            for table_name in TABLE_SPECS:
+                if table_name not in partitioned:
+                    print(f"⚠️ {table_name}: 분할하지 않은 기존 테이블이 있어 파티션 없이 사용합니다. (분할하려면 테이블을 삭제한 뒤 다시 생성)")
+            create_upcoming_partitions(cursor, granularity=granularity)
         connection.commit()
         cursor.close()
-        print("일곱 테이블이 성공적으로 생성되었습니다.")
+        print("일곱 테이블이 성공적으로 생성되었습니다." + (f" (파티션 단위: {PARTITION_GRANULARITIES[granularity]})" if granularity else ""))
+        return True
     except psycopg2.Error as e:
         print(f"테이블 생성 오류: {e}")
+        connection.rollback()
+        return False
 
 def truncate_all_tables(connection):
     """
@@ -198,28 +823,27 @@ def truncate_all_tables(connection):
         cursor = connection.cursor()
         
         # 모든 테이블 목록
-        tables = [
-            'REP_DATA_RE_FCST_LFD_DA',
-            'REP_DATA_RE_FCST_GEN_DA', 
-            'REP_DATA_HG_FCST_NWP_DA',
-            'REP_DATA_RE_KPX_JEJU_SUKUB_M',
-            'REP_DATA_P2H_FCST_CURT_DA',
-            'REP_DATA_HG_FCST_GEN_GENT_DA',
-            'REP_DATA_HG_MEAS_GEM_GENT_DA'
-        ]
+        tables = list(TABLE_SPECS)
         
         print(f"\n{'='*60}")
         print("테이블 데이터 삭제 시작")
         print(f"{'='*60}")
         
+        # 테이블마다 커밋하므로 한 테이블에서 실패해도(트랜잭션 중단) 다른 테이블은 계속 삭제
+        failed = []
         for table in tables:
             try:
                 cursor.execute(f"TRUNCATE TABLE {table}")
+                connection.commit()
                 print(f"✅ {table} 테이블 데이터 삭제 완료")
             except psycopg2.Error as e:
+                connection.rollback()
+                failed.append(table)
                 print(f"⚠️ {table} 테이블 데이터 삭제 실패: {e}")
         
-        connection.commit()
+        if failed:
+            print(f"\n⚠️ {len(failed)}개 테이블의 데이터 삭제에 실패했습니다: {', '.join(failed)} - {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            return False
         print(f"\n✅ 모든 테이블 데이터 삭제가 완료되었습니다! - {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         return True
         
@@ -231,304 +855,1603 @@ def truncate_all_tables(connection):
         if cursor:
             cursor.close()
 
-def insert_data_to_postgresql(test_cases_lfd, test_cases_gen, test_cases_nwp, test_cases_kpx, test_cases_curt, test_cases_hg_gen, test_cases_hg_meas, only_tables=None):
+# 파티션 단위 (DB_PARTITION 환경변수 또는 --partition 옵션) → 출력용 이름
+PARTITION_GRANULARITIES = {'day': '일', 'month': '월'}
+
+def get_partition_granularity():
     """
-    PostgreSQL에 데이터 삽입 (일곱 테이블)
+    테이블 분할 단위 - DB_PARTITION 환경변수로 조정 ('day' | 'month', 기본값: 없음 - 분할하지 않음)
+    지정하면 일곱 테이블을 기준 시각 컬럼(CRTN_TM/TM)으로 범위 분할하여 생성하고, 적재할 때 필요한 파티션을 만듭니다.
+    """
+    granularity = os.getenv('DB_PARTITION', '').strip().lower()
+    if granularity and granularity not in PARTITION_GRANULARITIES:
+        raise ValueError(f"지원하지 않는 파티션 단위입니다: {granularity} (가능한 값: {', '.join(PARTITION_GRANULARITIES)})")
+    return granularity or None
+
+def get_partition_ahead():
+    """
+    미리 만들어 둘 앞으로의 파티션 수 - DB_PARTITION_AHEAD 환경변수로 조정 (기본값: 3, 현재 파티션 제외)
+    """
+    return max(0, int(os.getenv('DB_PARTITION_AHEAD', '3')))
+
+def get_retention_days():
+    """
+    파티션 보존 일수 - DB_RETENTION_DAYS 환경변수로 조정 (기본값: 없음 - 삭제하지 않음)
+    """
+    value = os.getenv('DB_RETENTION_DAYS', '').strip()
+    return int(value) if value else None
+
+def partition_range(day, granularity):
+    """
+    day가 속한 파티션의 (이름 접미사, 시작일, 다음 파티션 시작일)
+    """
+    if granularity == 'day':
+        return f"P{day:%Y%m%d}", day, day + datetime.timedelta(days=1)
+    first = day.replace(day=1)
+    following = (first + datetime.timedelta(days=32)).replace(day=1)
+    return f"P{first:%Y%m}", first, following
+
+def partitioned_tables(cursor):
+    """
+    범위 분할로 만들어진 테이블명 집합 (분할 전 DDL로 만든 기존 테이블은 제외)
+    """
+    cursor.execute("SELECT c.relname FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid")
+    partitioned = {row[0].lower() for row in cursor.fetchall()}
+    return {table_name for table_name in TABLE_SPECS if table_name.lower() in partitioned}
+
+def ensure_partitions(cursor, table_name, first_day, last_day, granularity=None):
+    """
+    first_day부터 last_day까지(양 끝 포함) 행을 받을 파티션을 없으면 생성
     
-    Args:
-        only_tables (list): None이면 모든 테이블에 삽입, 리스트가 있으면 해당 테이블만 삽입
+    이미 파티션이 있는 날짜는 카탈로그 조회만 하므로 적재마다 불러도 DDL이나 잠금이 생기지 않습니다.
+    다른 단위로 만든 파티션이 이미 있으면 그 범위와 겹치지 않게 잘라서 만듭니다.
+    분할하지 않은 기존 테이블이면 아무것도 하지 않습니다.
+    
+    Returns:
+        list: 새로 만든 파티션명
     """
-    connection = get_db_connection()
-    if not connection:
-        print("데이터베이스 연결에 실패했습니다. 데이터 생성만 진행합니다.")
-        return False
+    granularity = granularity or get_partition_granularity()
+    if not granularity:
+        return []
+    existing = list_partitions(cursor, table_name)
+    if not existing and table_name not in partitioned_tables(cursor):
+        return []
+    created = []
+    day = first_day
+    while day <= last_day:
+        start = f"{day:%Y%m%d}0000"
+        covering = next((partition for partition in existing if partition[1] <= start < partition[2]), None)
+        if covering:
+            day = datetime.datetime.strptime(covering[2][:8], "%Y%m%d").date()
+            continue
+        suffix, lower, upper = partition_range(day, granularity)
+        lower_bound = max([f"{lower:%Y%m%d}0000"] + [partition[2] for partition in existing if partition[2] <= start])
+        upper_bound = min([f"{upper:%Y%m%d}0000"] + [partition[1] for partition in existing if partition[1] > start])
+        if lower_bound != f"{lower:%Y%m%d}0000":
+            suffix = f"P{lower_bound[:8]}"
+        partition_name = f"{table_name}_{suffix}"
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS {partition_name} PARTITION OF {table_name} "
+            f"FOR VALUES FROM ('{lower_bound}') TO ('{upper_bound}')"
+        )
+        existing.append((partition_name, lower_bound, upper_bound))
+        created.append(partition_name)
+        day = datetime.datetime.strptime(upper_bound[:8], "%Y%m%d").date()
+    return created
+
+def create_upcoming_partitions(cursor, today=None, granularity=None, ahead=None):
+    """
+    모든 테이블에 오늘이 속한 파티션과 앞으로의 파티션 ahead개를 미리 생성
+    
+    Returns:
+        list: 새로 만든 파티션명
+    """
+    granularity = granularity or get_partition_granularity()
+    if not granularity:
+        return []
+    today = today or datetime.date.today()
+    ahead = get_partition_ahead() if ahead is None else ahead
+    last_day = today
+    for _ in range(ahead):
+        last_day = partition_range(last_day, granularity)[2]
+    created = []
+    for table_name in TABLE_SPECS:
+        created.extend(ensure_partitions(cursor, table_name, today, last_day, granularity))
+    return created
+
+def list_partitions(cursor, table_name):
+    """
+    테이블의 파티션 목록
+    
+    Returns:
+        list: (파티션명, 시작 'YYYYMMDDHHMI', 끝 'YYYYMMDDHHMI') - 시작 순서
+    """
+    cursor.execute(
+        "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = to_regclass(%s)",
+        (table_name,)
+    )
+    partitions = []
+    for partition_name, bound in cursor.fetchall():
+        match = re.search(r"FROM \('(\d+)'\) TO \('(\d+)'\)", bound or '')
+        if match:
+            partitions.append((partition_name, match.group(1), match.group(2)))
+    return sorted(partitions, key=lambda partition: partition[1])
+
+def drop_expired_partitions(connection, retention_days, only_tables=None, today=None):
+    """
+    보존 기간이 지난 파티션을 DROP하여 오래된 데이터를 삭제 (TRUNCATE/DELETE 없이 파티션 단위로 즉시 삭제)
+    
+    파티션의 끝(다음 파티션 시작)이 (오늘 - retention_days)일 0시 이전이면 삭제합니다.
+    테이블마다 커밋하므로 한 테이블에서 실패해도 다른 테이블의 삭제는 유지됩니다.
     
+    Args:
+        connection: 데이터베이스 연결
+        retention_days (int): 보존 일수
+        only_tables (list): None이면 모든 테이블, 리스트가 있으면 해당 테이블 라벨만
+        today (date): 기준일 (None이면 오늘)
+    
+    Returns:
+        dict: 테이블 라벨별 삭제한 파티션 수 (실패한 테이블은 제외)
+    """
+    today = today or datetime.date.today()
+    cutoff = f"{today - datetime.timedelta(days=retention_days):%Y%m%d}0000"
+    selected = {t.upper() for t in only_tables} if only_tables else None
+    dropped = {}
+    cursor = connection.cursor()
     try:
-        # 테이블 생성 확인
-        create_table_if_not_exists(connection)
-        
-        cursor = connection.cursor()
-        
-        # REP_DATA_RE_FCST_LFD_DA 테이블 데이터 삽입
-        insert_lfd_sql = """
-        INSERT INTO REP_DATA_RE_FCST_LFD_DA (
-            CRTN_TM, FCST_TM, LEAD_TM, FCST_PROD_CD,
-            FCST_QG01, FCST_QG02, FCST_QG03, FCST_QG04, FCST_QG05, FCST_QG06,
-            FCST_QGEN, FCST_QGMX, FCST_QGMN, REG_DATE, UPD_DATE
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-        )
-        """
-        
-        # REP_DATA_RE_FCST_GEN_DA 테이블 데이터 삽입
-        insert_gen_sql = """
-        INSERT INTO REP_DATA_RE_FCST_GEN_DA (
-            PWR_EXC_TP_CD, FUEL_TP_CD, CRTN_TM, FCST_TM, LEAD_TM, FCST_PROD_CD,
-            FCST_QG01, FCST_QG02, FCST_QG03, FCST_QG04, FCST_QG05, FCST_QG06,
-            FCST_QGEN, FCST_QGMX, FCST_QGMN, FCST_CAPA, ESS_CHRG, ESS_DISC, ESS_CAPA,
-            REG_DATE, UPD_DATE
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-        )
-        """
-        
-        # REP_DATA_HG_FCST_NWP_DA 테이블 데이터 삽입
-        insert_nwp_sql = """
-        INSERT INTO REP_DATA_HG_FCST_NWP_DA (
-            PWR_EXC_TP_CD, AREA_GRP_CD, AREA_GRP_ID, CRTN_TM, FCST_TM, LEAD_TM, FCST_PROD_CD,
-            FCST_SRAD, FCST_TEMP, FCST_HUMI, FCST_WSPD, FCST_PSFC,
-            REG_DATE, UPD_DATE
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-        )
-        """
-        
-        # REP_DATA_RE_KPX_JEJU_SUKUB_M 테이블 데이터 삽입
-        insert_kpx_sql = """
-        INSERT INTO REP_DATA_RE_KPX_JEJU_SUKUB_M (
-            TM, SUPP_ABILITY, CURR_PWR_TOT, RENEW_PWR_TOT, RENEW_PWR_SOLAR, RENEW_PWR_WIND,
-            REG_DATE, UPD_DATE
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s
-        )
-        """
-        
-        # REP_DATA_P2H_FCST_CURT_DA 테이블 데이터 삽입
-        # On Conflict 추가
-        insert_curt_sql = """
-        INSERT INTO REP_DATA_P2H_FCST_CURT_DA (
-            CRTN_TM, FCST_TM, LEAD_TM, FCST_MINPW, FCST_CURT,
-            REG_DATE, UPD_DATE
-        )
-        VALUES (
-            %s, %s, %s, %s, %s, %s, %s
-        )
-        ON CONFLICT (CRTN_TM, FCST_TM)
-        DO UPDATE SET 
-            LEAD_TM = EXCLUDED.LEAD_TM,
-            FCST_MINPW = EXCLUDED.FCST_MINPW,
-            FCST_CURT = EXCLUDED.FCST_CURT,
-            REG_DATE = EXCLUDED.REG_DATE,
-            UPD_DATE = EXCLUDED.UPD_DATE
-        """
-        
-        # REP_DATA_HG_FCST_GEN_GENT_DA 테이블 데이터 삽입
-        insert_hg_gen_sql = """
-        INSERT INTO REP_DATA_HG_FCST_GEN_GENT_DA (
-            AREA_GRP_CD, AREA_GRP_ID, CRTN_TM, FCST_TM, LEAD_TM, FCST_PROD_CD,
-            FCST_QGEN, FCST_CAPA, REG_DATE, UPD_DATE
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-        )
-        """
-        
-        # REP_DATA_HG_MEAS_GEM_GENT_DA 테이블 데이터 삽입
-        insert_hg_meas_sql = """
-        INSERT INTO REP_DATA_HG_MEAS_GEM_GENT_DA (
-            TM, AREA_GRP_CD, AREA_GRP_ID, HGEN_PROD, HGEN_CAPA,
-            REG_DATE, UPD_DATE
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s
-        )
-        """
-        
-        # LFD 테이블 데이터 삽입
-        inserted_lfd_count = 0
-        for i, case in enumerate(test_cases_lfd, 1):
-            try:
-                cursor.execute(insert_lfd_sql, (
-                    case['CRTN_TM'],
-                    case['FCST_TM'],
-                    case['LEAD_TM'],
-                    case['FCST_PROD_CD'],
-                    case['FCST_QG01'],
-                    case['FCST_QG02'],
-                    case['FCST_QG03'],
-                    case['FCST_QG04'],
-                    case['FCST_QG05'],
-                    case['FCST_QG06'],
-                    case['FCST_QGEN'],
-                    case['FCST_QGMX'],
-                    case['FCST_QGMN'],
-                    case['REG_DATE'],
-                    case['UPD_DATE']
-                ))
-                inserted_lfd_count += 1
-                # print(f"LFD 데이터 {i} 삽입 완료")
-                
-            except psycopg2.Error as e:
-                print(f"LFD 데이터 {i} 삽입 실패: {e}")
-                connection.rollback()
+        for table_name, spec in TABLE_SPECS.items():
+            if selected and spec.label not in selected:
                 continue
-        
-        # GEN 테이블 데이터 삽입
-        inserted_gen_count = 0
-        for i, case in enumerate(test_cases_gen, 1):
             try:
-                cursor.execute(insert_gen_sql, (
-                    case['PWR_EXC_TP_CD'],
-                    case['FUEL_TP_CD'],
-                    case['CRTN_TM'],
-                    case['FCST_TM'],
-                    case['LEAD_TM'],
-                    case['FCST_PROD_CD'],
-                    case['FCST_QG01'],
-                    case['FCST_QG02'],
-                    case['FCST_QG03'],
-                    case['FCST_QG04'],
-                    case['FCST_QG05'],
-                    case['FCST_QG06'],
-                    case['FCST_QGEN'],
-                    case['FCST_QGMX'],
-                    case['FCST_QGMN'],
-                    case['FCST_CAPA'],
-                    case['ESS_CHRG'],
-                    case['ESS_DISC'],
-                    case['ESS_CAPA'],
-                    case['REG_DATE'],
-                    case['UPD_DATE']
-                ))
-                inserted_gen_count += 1
-                # print(f"GEN 데이터 {i} 삽입 완료")
-                
+                expired = [partition for partition in list_partitions(cursor, table_name) if partition[2] <= cutoff]
+                for partition_name, lower, upper in expired:
+                    cursor.execute(f"DROP TABLE {partition_name}")
+                    print(f"✅ {partition_name} 파티션 삭제 ({lower[:8]} ~ {upper[:8]})")
+                connection.commit()
+                dropped[spec.label] = len(expired)
             except psycopg2.Error as e:
-                print(f"GEN 데이터 {i} 삽입 실패: {e}")
                 connection.rollback()
+                print(f"⚠️ {table_name} 파티션 삭제 실패: {str(e).strip()}")
+    finally:
+        cursor.close()
+    return dropped
+
+def purge_tables(connection, only_tables=None, start_date=None, end_date=None, batch_size=None):
+    """
+    선택한 테이블에서 기준 시각(CRTN_TM/TM)이 start_date~end_date(양 끝 포함)인 행만 삭제
+    
+    - 기간을 지정하지 않으면 테이블 전체를 TRUNCATE합니다.
+    - 분할 테이블에서 기간 안에 완전히 들어가는 파티션은 DROP합니다.
+    - 나머지 행은 한 번의 스캔으로 찾은 뒤 batch_size행씩 DELETE하고 배치마다 커밋합니다.
+      큰 트랜잭션이나 긴 잠금 없이 진행하며, 1초마다 진행률을 출력합니다.
+    테이블마다 따로 커밋/롤백하므로 한 테이블에서 실패해도 다른 테이블은 계속 삭제합니다.
+    
+    Args:
+        connection: 데이터베이스 연결
+        only_tables (list): None이면 모든 테이블, 리스트가 있으면 해당 테이블 라벨만
+        start_date (date): 시작일 (None이면 처음부터)
+        end_date (date): 종료일 (포함, None이면 끝까지)
+        batch_size (int): 한 번에 삭제할 행 수 (None이면 DB_BATCH_SIZE)
+    
+    Returns:
+        dict: 테이블 라벨별 삭제 행 수 (TRUNCATE한 테이블은 None, 실패한 테이블은 제외)
+    """
+    batch_size = batch_size or get_batch_size()
+    lower = f"{start_date:%Y%m%d}0000" if start_date else None
+    upper = f"{end_date + datetime.timedelta(days=1):%Y%m%d}0000" if end_date else None
+    selected = {t.upper() for t in only_tables} if only_tables else None
+    purged = {}
+    cursor = connection.cursor()
+    try:
+        for table_name, spec in TABLE_SPECS.items():
+            if selected and spec.label not in selected:
                 continue
-        
-        # NWP 테이블 데이터 삽입
-        inserted_nwp_count = 0
-        for i, case in enumerate(test_cases_nwp, 1):
+            started = time.perf_counter()
+            scan = None
             try:
-                cursor.execute(insert_nwp_sql, (
-                    case['PWR_EXC_TP_CD'],
-                    case['AREA_GRP_CD'],
-                    case['AREA_GRP_ID'],
-                    case['CRTN_TM'],
-                    case['FCST_TM'],
-                    case['LEAD_TM'],
-                    case['FCST_PROD_CD'],
-                    case['FCST_SRAD'],
-                    case['FCST_TEMP'],
-                    case['FCST_HUMI'],
-                    case['FCST_WSPD'],
-                    case['FCST_PSFC'],
-                    case['REG_DATE'],
-                    case['UPD_DATE']
-                ))
-                inserted_nwp_count += 1
-                # print(f"NWP 데이터 {i} 삽입 완료")
+                if lower is None and upper is None:
+                    cursor.execute(f"TRUNCATE TABLE {table_name}")
+                    connection.commit()
+                    purged[spec.label] = None
+                    print(f"✅ {table_name} 테이블 데이터 삭제 완료 (TRUNCATE)")
+                    continue
+                
+                deleted = 0
+                dropped = 0
+                for partition_name, partition_lower, partition_upper in list_partitions(cursor, table_name):
+                    if (lower is None or lower <= partition_lower) and (upper is None or partition_upper <= upper):
+                        cursor.execute(f"SELECT count(*) FROM {partition_name}")
+                        deleted += cursor.fetchone()[0]
+                        cursor.execute(f"DROP TABLE {partition_name}")
+                        connection.commit()
+                        dropped += 1
+                
+                conditions = []
+                params = []
+                if lower is not None:
+                    conditions.append(f"{spec.time_column} >= %s")
+                    params.append(lower)
+                if upper is not None:
+                    conditions.append(f"{spec.time_column} < %s")
+                    params.append(upper)
+                where = ' AND '.join(conditions)
                 
+                # 대상 행 위치(파티션, ctid)를 한 번만 스캔하고, 커밋 후에도 유지되는 커서(WITH HOLD)에서 배치씩 꺼내 삭제
+                # 삭제할 때도 기간 조건을 다시 확인하므로 그 사이 자리가 재사용된 행은 기간 밖이면 지우지 않음
+                scan = connection.cursor(name=f"purge_{spec.label.lower()}", withhold=True)
+                scan.execute(f"SELECT tableoid::regclass::text, ctid::text FROM {table_name} WHERE {where}", params)
+                reported = time.perf_counter()
+                while True:
+                    batch = scan.fetchmany(batch_size)
+                    if not batch:
+                        break
+                    ctids_by_relation = {}
+                    for relation, ctid in batch:
+                        ctids_by_relation.setdefault(relation, []).append(ctid)
+                    for relation, ctids in ctids_by_relation.items():
+                        cursor.execute(f"DELETE FROM {relation} WHERE ctid = ANY(%s::tid[]) AND {where}", [ctids] + params)
+                        deleted += cursor.rowcount
+                    connection.commit()
+                    if time.perf_counter() - reported >= 1.0:
+                        reported = time.perf_counter()
+                        elapsed = reported - started
+                        print(f"  {table_name}: {deleted:,}행 삭제 중 ({deleted / max(elapsed, 1e-9):,.0f} rows/s)")
+                scan.close()
+                scan = None
+                connection.commit()
+                
+                purged[spec.label] = deleted
+                elapsed = time.perf_counter() - started
+                partition_label = f", 파티션 {dropped}개 DROP" if dropped else ""
+                print(f"✅ {table_name}: {deleted:,}행 삭제{partition_label} ({elapsed:.1f}초)")
             except psycopg2.Error as e:
-                print(f"NWP 데이터 {i} 삽입 실패: {e}")
                 connection.rollback()
-                continue
-        
-        # KPX 테이블 데이터 삽입
-        inserted_kpx_count = 0
-        for i, case in enumerate(test_cases_kpx, 1):
-            try:
-                cursor.execute(insert_kpx_sql, (
-                    case['TM'],
-                    case['SUPP_ABILITY'],
-                    case['CURR_PWR_TOT'],
-                    case['RENEW_PWR_TOT'],
-                    case['RENEW_PWR_SOLAR'],
-                    case['RENEW_PWR_WIND'],
-                    case['REG_DATE'],
-                    case['UPD_DATE']
-                ))
-                inserted_kpx_count += 1
-                # print(f"KPX 데이터 {i} 삽입 완료")
-                
-            except psycopg2.Error as e:
-                print(f"KPX 데이터 {i} 삽입 실패: {e}")
-                connection.rollback()
-                continue
-        
-        # CURT 테이블 데이터 삽입
-        inserted_curt_count = 0
-        for i, case in enumerate(test_cases_curt, 1):
+                print(f"⚠️ {table_name} 데이터 삭제 실패: {str(e).strip()}")
+            finally:
+                # 실패한 경우 남은 커서를 닫음 (정상 종료하면 위에서 이미 닫음)
+                if scan is not None and not connection.closed:
+                    try:
+                        scan.close()
+                        connection.rollback()
+                    except psycopg2.Error:
+                        connection.rollback()
+    finally:
+        cursor.close()
+    return purged
+
+# upsert 모드가 아니어도 항상 ON CONFLICT로 덮어쓰는 테이블의 충돌 키 (COPY 로더는 임시 테이블을 거쳐 병합)
+TABLE_CONFLICT_KEYS = {name: spec.merge_keys for name, spec in TABLE_SPECS.items() if spec.always_merge}
+
+def is_upsert_mode():
+    """
+    upsert 모드 여부 - DB_UPSERT 환경변수로 조정 (기본값: 꺼짐, --upsert 옵션으로 켬)
+    켜면 모든 테이블을 TABLE_MERGE_KEYS 기준으로 병합하므로 같은 날짜를 다시 적재해도 결과가 같습니다.
+    """
+    return os.getenv('DB_UPSERT', '').lower() in ('1', 'true', 'yes', 'on')
+
+def build_merge_sql(table_name, staging_table, merge_keys):
+    """
+    임시 테이블의 행을 대상 테이블에 병합하는 SQL 목록
+    
+    같은 키가 여러 번 들어오면 행 단위 적재와 동일하게 마지막 행을 반영합니다 (ctid DESC).
+    기본키가 병합 키이면 INSERT ... ON CONFLICT 한 문장, 자연키(유니크 제약 없음)이면 DELETE 후 INSERT입니다.
+    """
+    columns = TABLE_INSERT_COLUMNS[table_name]
+    column_list = ', '.join(columns)
+    key_list = ', '.join(merge_keys)
+    select_sql = f"""
+        INSERT INTO {table_name} ({column_list})
+        SELECT DISTINCT ON ({key_list}) {column_list}
+        FROM {staging_table}
+        ORDER BY {key_list}, ctid DESC"""
+    
+    if tuple(merge_keys) == TABLE_PRIMARY_KEYS[table_name]:
+        update_columns = [column for column in columns if column not in merge_keys]
+        if not update_columns:
+            return [f"{select_sql}\n        ON CONFLICT ({key_list}) DO NOTHING"]
+        update_list = ', '.join(f"{column} = EXCLUDED.{column}" for column in update_columns)
+        return [f"{select_sql}\n        ON CONFLICT ({key_list})\n        DO UPDATE SET {update_list}"]
+    
+    match_list = ' AND '.join(f"target.{key} = staging.{key}" for key in merge_keys)
+    return [
+        f"DELETE FROM {table_name} AS target USING {staging_table} AS staging WHERE {match_list}",
+        select_sql,
+    ]
+
+# 지원하는 적재 방식
+LOADERS = ('copy', 'executemany', 'row')
+
+def _format_copy_value(value):
+    """
+    COPY 텍스트 포맷에 맞게 값을 변환
+    """
+    if value is None:
+        return '\\N'
+    if isinstance(value, float):
+        return repr(value)
+    text = str(value)
+    return text.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+def get_batch_size():
+    """
+    적재 청크 크기 (행 수) - DB_BATCH_SIZE 환경변수로 조정 (기본값: 5000)
+    청크마다 세이브포인트를 잡고, 실패한 청크만 행 단위로 다시 적재합니다.
+    """
+    return max(1, int(os.getenv('DB_BATCH_SIZE', '5000')))
+
+def get_load_concurrency():
+    """
+    테이블 동시 적재 수 - DB_LOAD_CONCURRENCY 환경변수로 조정 (기본값: 1, 한 연결에서 순차 적재)
+    2 이상이면 테이블마다 풀에서 별도 연결을 빌려 동시에 적재합니다.
+    """
+    return max(1, int(os.getenv('DB_LOAD_CONCURRENCY', '1')))
+
+def get_dead_letter_path():
+    """
+    적재에 실패한 행을 기록할 파일 경로 - DEAD_LETTER_FILE 환경변수로 조정 (기본값: dead_letter.jsonl)
+    """
+    return os.getenv('DEAD_LETTER_FILE', 'dead_letter.jsonl')
+
+# 여러 스레드(스케줄러 작업)가 같은 파일에 기록할 때 줄이 섞이지 않도록 보호
+_dead_letter_lock = threading.Lock()
+
+def write_dead_letters(path, table_name, rejected_rows):
+    """
+    거부된 행을 dead-letter 파일에 JSON Lines 형식으로 추가
+    
+    Args:
+        path (str): 파일 경로
+        table_name (str): 테이블명
+        rejected_rows (list): (행 dict, 오류 메시지) 목록
+    """
+    rejected_at = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    lines = [
+        json.dumps({'table': table_name, 'rejected_at': rejected_at, 'error': error, 'row': row}, ensure_ascii=False, default=str)
+        for row, error in rejected_rows
+    ]
+    with _dead_letter_lock:
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+
+def _build_copy_buffer(rows):
+    """
+    행 튜플 목록을 COPY FROM STDIN용 메모리 버퍼로 변환
+    """
+    buffer = io.StringIO()
+    for values in rows:
+        buffer.write('\t'.join([_format_copy_value(value) for value in values]))
+        buffer.write('\n')
+    buffer.seek(0)
+    return buffer
+
+def _copy_row_tuples(cursor, table_name, rows, row_count):
+    """
+    TABLE_INSERT_COLUMNS 순서의 행 튜플들을 COPY로 적재 (load_table_chunked의 청크마다 호출)
+    충돌 키가 정의된 테이블은 임시 테이블을 거쳐 병합합니다.
+    """
+    conflict_keys = TABLE_CONFLICT_KEYS.get(table_name)
+    if conflict_keys:
+        return merge_row_tuples(cursor, table_name, rows, row_count, conflict_keys)
+    
+    cursor.copy_expert(TABLE_SPECS[table_name].copy_sql, _build_copy_buffer(rows))
+    return row_count
+
+def _create_staging_table(cursor, table_name):
+    """
+    upsert용 임시 테이블(TMP_<테이블명>)을 새로 만들고 이름을 돌려줌 (트랜잭션이 커밋되면 삭제)
+    """
+    staging_table = f"TMP_{table_name}"
+    cursor.execute(f"DROP TABLE IF EXISTS {staging_table}")
+    cursor.execute(f"CREATE TEMP TABLE {staging_table} ON COMMIT DROP AS SELECT {TABLE_SPECS[table_name].column_list} FROM {table_name} WITH NO DATA")
+    return staging_table
+
+def _fill_staging_table(cursor, table_name, staging_table, rows, loader):
+    """
+    행 튜플들을 loader 방식으로 임시 테이블에 채움
+    """
+    spec = TABLE_SPECS[table_name]
+    column_list = spec.column_list
+    if loader == 'copy':
+        cursor.copy_expert(f"COPY {staging_table} ({column_list}) FROM STDIN", _build_copy_buffer(rows))
+        return
+    staging_insert_sql = f"INSERT INTO {staging_table} ({column_list}) VALUES ({', '.join(['%s'] * len(spec.insert_columns))})"
+    if loader == 'executemany':
+        execute_batch(cursor, staging_insert_sql, rows, page_size=1000)
+    else:
+        for values in rows:
+            cursor.execute(staging_insert_sql, values)
+
+def merge_row_tuples(cursor, table_name, rows, row_count, merge_keys, loader='copy'):
+    """
+    행 튜플들을 임시 테이블에 채운 뒤 대상 테이블에 한 번에 병합 (upsert)
+    
+    임시 테이블은 loader 방식으로 채웁니다 ('copy' - COPY, 'executemany' - execute_batch, 'row' - 행마다 INSERT).
+    병합은 테이블당 한 문장(자연키 테이블은 DELETE + INSERT 두 문장)입니다.
+    
+    Returns:
+        int: 병합한 행 수 (입력 행 기준)
+    """
+    staging_table = _create_staging_table(cursor, table_name)
+    _fill_staging_table(cursor, table_name, staging_table, rows, loader)
+    for merge_sql in build_merge_sql(table_name, staging_table, merge_keys):
+        cursor.execute(merge_sql)
+    return row_count
+
+def _insert_rows_isolated(connection, cursor, insert_sql, rows, table_name=None, merge_keys=None):
+    """
+    행마다 세이브포인트를 잡고 INSERT(merge_keys가 있으면 병합)하여 실패한 행만 골라냄
+    
+    병합할 때는 임시 테이블을 청크당 한 번만 만들고, 행마다 비운 뒤 그 행만 채워 병합합니다.
+    
+    Returns:
+        tuple: (적재 행 수, [(행 튜플, 오류 메시지), ...])
+    """
+    inserted = 0
+    rejected = []
+    if merge_keys:
+        staging_table = _create_staging_table(cursor, table_name)
+        merge_sqls = build_merge_sql(table_name, staging_table, merge_keys)
+    for values in rows:
+        cursor.execute("SAVEPOINT load_row")
+        try:
+            if merge_keys:
+                cursor.execute(f"DELETE FROM {staging_table}")
+                _fill_staging_table(cursor, table_name, staging_table, [values], 'row')
+                for merge_sql in merge_sqls:
+                    cursor.execute(merge_sql)
+            else:
+                cursor.execute(insert_sql, values)
+        except psycopg2.Error as e:
+            if connection.closed:
+                raise
+            cursor.execute("ROLLBACK TO SAVEPOINT load_row")
+            rejected.append((values, str(e).strip()))
+        else:
+            cursor.execute("RELEASE SAVEPOINT load_row")
+            inserted += 1
+    return inserted, rejected
+
+def load_table_chunked(connection, cursor, table_name, insert_sql, cases, loader='copy', batch_size=None, commit_chunks=False, dead_letter_path=None, upsert=None):
+    """
+    테이블 데이터를 batch_size행 청크 단위로 적재
+    
+    청크마다 세이브포인트를 잡고 loader 방식으로 한 번에 적재합니다.
+    청크가 실패하면 그 청크만 세이브포인트로 되돌린 뒤 행 단위로 다시 적재하여,
+    문제가 있는 행만 거부하고 앞서 적재한 행은 그대로 유지합니다.
+    거부된 행은 dead-letter 파일에 기록합니다.
+    
+    Args:
+        connection: psycopg2 연결
+        cursor: 연결의 커서
+        table_name (str): 테이블명
+        insert_sql (str): 행 단위 INSERT 문 (TABLE_INSERT_COLUMNS 순서의 %s 자리표시자)
+        cases (TableData): 적재할 데이터
+        loader (str): 적재 방식 ('copy', 'executemany', 'row')
+        batch_size (int): 청크 크기 (None이면 get_batch_size())
+        commit_chunks (bool): True이면 청크마다 커밋 (청크 단위 트랜잭션)
+        dead_letter_path (str): 거부 행 기록 파일 (None이면 get_dead_letter_path())
+        upsert (bool): True이면 임시 테이블을 거쳐 TABLE_MERGE_KEYS 기준으로 병합 (None이면 is_upsert_mode())
+    
+    소요 시간, 적재/거부 행 수, 행 단위 재적재로 넘어간 청크 수는 METRICS의 'insert' 단계로 기록합니다.
+    
+    Returns:
+        tuple: (적재 행 수, 거부 행 수)
+    """
+    batch_size = batch_size or get_batch_size()
+    if upsert is None:
+        upsert = is_upsert_mode()
+    merge_keys = TABLE_MERGE_KEYS[table_name] if upsert else None
+    columns = TABLE_INSERT_COLUMNS[table_name]
+    if len(cases) and get_partition_granularity():
+        # 적재할 행의 기준 시각 범위에 해당하는 파티션이 없으면 먼저 생성
+        time_values = cases.column(TABLE_TIME_COLUMNS[table_name])
+        first_day, last_day = (datetime.datetime.strptime(value[:8], "%Y%m%d").date() for value in (min(time_values), max(time_values)))
+        ensure_partitions(cursor, table_name, first_day, last_day)
+    rows = cases.rows(columns)
+    inserted = 0
+    rejected_rows = []
+    with METRICS.stage('insert', TABLE_LABELS[table_name]) as observation:
+        while True:
+            chunk = list(itertools.islice(rows, batch_size))
+            if not chunk:
+                break
+            
+            cursor.execute("SAVEPOINT load_chunk")
             try:
-                cursor.execute(insert_curt_sql, (
-                    case['CRTN_TM'],
-                    case['FCST_TM'],
-                    case['LEAD_TM'],
-                    case['FCST_MINPW'],
-                    case['FCST_CURT'],
-                    case['REG_DATE'],
-                    case['UPD_DATE']
-                ))
-                inserted_curt_count += 1
-                # print(f"CURT 데이터 {i} 삽입 완료")
-                
-            except psycopg2.Error as e:
-                print(f"CURT 데이터 {i} 삽입 실패: {e}")
-                connection.rollback()
-                continue
+                if merge_keys:
+                    merge_row_tuples(cursor, table_name, chunk, len(chunk), merge_keys, loader=loader)
+                elif loader == 'copy':
+                    _copy_row_tuples(cursor, table_name, chunk, len(chunk))
+                elif loader == 'executemany':
+                    execute_batch(cursor, insert_sql, chunk, page_size=1000)
+                else:
+                    for values in chunk:
+                        cursor.execute(insert_sql, values)
+                chunk_inserted, chunk_rejected = len(chunk), []
+            except psycopg2.Error:
+                if connection.closed:
+                    raise
+                cursor.execute("ROLLBACK TO SAVEPOINT load_chunk")
+                observation['retries'] += 1
+                chunk_inserted, chunk_rejected = _insert_rows_isolated(connection, cursor, insert_sql, chunk, table_name, merge_keys)
+            cursor.execute("RELEASE SAVEPOINT load_chunk")
+            if commit_chunks:
+                connection.commit()
+            
+            inserted += chunk_inserted
+            rejected_rows.extend((dict(zip(columns, values)), error) for values, error in chunk_rejected)
+        observation['rows'] = inserted
+        observation['rejected'] = len(rejected_rows)
+    
+    if rejected_rows:
+        dead_letter_path = dead_letter_path or get_dead_letter_path()
+        write_dead_letters(dead_letter_path, table_name, rejected_rows)
+        print(f"⚠️ {table_name}: {len(rejected_rows)}행 거부 → {dead_letter_path} (첫 오류: {rejected_rows[0][1].splitlines()[0]})")
+    return inserted, len(rejected_rows)
+
+def load_test_cases(connection, test_cases_lfd, test_cases_gen, test_cases_nwp, test_cases_kpx, test_cases_curt, test_cases_hg_gen, test_cases_hg_meas, only_tables=None, loader='copy', batch_size=None, commit_chunks=False, upsert=None):
+    """
+    열린 연결에 일곱 테이블 데이터를 적재
+    
+    테이블마다 load_table_chunked로 청크 단위 적재하므로 실패한 행만 거부되고 나머지는 유지됩니다.
+    commit_chunks가 False이면 커밋은 호출하는 쪽에서 수행합니다.
+    
+    Args:
+        connection: psycopg2 연결
+        only_tables (list): None이면 모든 테이블에 삽입, 리스트가 있으면 해당 테이블만 삽입
+        loader (str): 적재 방식 ('copy', 'executemany', 'row')
+        batch_size (int): 청크 크기 (None이면 DB_BATCH_SIZE 환경변수)
+        commit_chunks (bool): True이면 청크마다 커밋
+        upsert (bool): True이면 모든 테이블을 병합(upsert)으로 적재 (None이면 DB_UPSERT 환경변수)
+    
+    Returns:
+        tuple: (테이블 라벨('LFD', 'GEN', ...)별 적재 행 수 dict, 테이블 라벨별 거부 행 수 dict)
+    """
+    if loader not in LOADERS:
+        raise ValueError(f"지원하지 않는 적재 방식입니다: {loader} (가능한 값: {', '.join(LOADERS)})")
+    
+    # dict 목록이 들어와도 동작하도록 TableData로 통일
+    test_cases = [
+        as_table_data(table_name, cases)
+        for table_name, cases in zip(TABLE_SPECS, (test_cases_lfd, test_cases_gen, test_cases_nwp, test_cases_kpx, test_cases_curt, test_cases_hg_gen, test_cases_hg_meas))
+    ]
+    
+    cursor = connection.cursor()
+    
+    inserted_counts = {}
+    rejected_counts = {}
+    selected = {t.upper() for t in only_tables} if only_tables else None
+    for cases in test_cases:
+        spec = TABLE_SPECS[cases.table_name]
+        inserted_counts[spec.label] = 0
+        rejected_counts[spec.label] = 0
+        if selected and spec.label not in selected:
+            continue
+        if not cases:
+            continue
+        # 행 단위 INSERT 문은 TABLE_SPECS에서 미리 만든 것 (CURT는 ON CONFLICT 포함)
+        inserted_counts[spec.label], rejected_counts[spec.label] = load_table_chunked(
+            connection, cursor, spec.name, spec.insert_sql, cases,
+            loader=loader, batch_size=batch_size, commit_chunks=commit_chunks, upsert=upsert
+        )
+    
+    cursor.close()
+    
+    return inserted_counts, rejected_counts
+
+def _load_table_on_own_connection(test_cases, label, loader='copy'):
+    """
+    테이블 하나를 풀에서 빌린 전용 연결로 적재하고 커밋 (동시 적재 작업 하나)
+    
+    Args:
+        test_cases (list): 일곱 테이블의 TableData (TABLE_LABELS 순서)
+        label (str): 적재할 테이블 라벨
+        loader (str): 적재 방식 ('copy', 'executemany', 'row')
+    
+    Returns:
+        tuple: (테이블 라벨, 적재 행 수, 거부 행 수, 소요 시간(초), 오류 메시지 또는 None)
+    """
+    started = time.perf_counter()
+    tables = [cases if TABLE_LABELS[cases.table_name] == label else TableData(cases.table_name) for cases in test_cases]
+    with db_session() as connection:
+        if not connection:
+            return label, 0, 0, time.perf_counter() - started, "데이터베이스 연결 실패"
+        try:
+            counts, rejected = load_test_cases(connection, *tables, loader=loader, commit_chunks=True)
+            commit_transaction(connection)
+        except psycopg2.Error as e:
+            connection.rollback()
+            return label, 0, 0, time.perf_counter() - started, str(e).strip()
+    return label, counts[label], rejected[label], time.perf_counter() - started, None
+
+def load_tables_concurrently(test_cases, only_tables=None, loader='copy', concurrency=None):
+    """
+    테이블마다 별도 연결로 동시에 적재 (스레드 풀)
+    
+    테이블은 서로 독립적이므로 큰 NWP 적재가 끝나기를 기다리지 않고 작은 KPX/CURT가 먼저 커밋되며,
+    테이블마다 끝나는 대로 결과를 출력합니다. 한 테이블이 실패해도 나머지 테이블은 그대로 적재됩니다.
+    
+    Args:
+        test_cases (list): 일곱 테이블의 TableData 또는 dict 목록 (TABLE_LABELS 순서)
+        only_tables (list): None이면 모든 테이블에 삽입, 리스트가 있으면 해당 테이블만 삽입
+        loader (str): 적재 방식 ('copy', 'executemany', 'row')
+        concurrency (int): 동시에 적재할 테이블 수 (None이면 DB_LOAD_CONCURRENCY 환경변수)
+    
+    Returns:
+        dict: 테이블 라벨별 (적재 행 수, 거부 행 수, 소요 시간(초), 오류 메시지 또는 None)
+    """
+    concurrency = concurrency or get_load_concurrency()
+    test_cases = [as_table_data(table_name, cases) for table_name, cases in zip(TABLE_LABELS, test_cases)]
+    selected = {t.upper() for t in only_tables} if only_tables else None
+    labels = [TABLE_LABELS[cases.table_name] for cases in test_cases if cases and (selected is None or TABLE_LABELS[cases.table_name] in selected)]
+    
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(labels)))) as executor:
+        futures = [executor.submit(_load_table_on_own_connection, test_cases, label, loader) for label in labels]
+        for future in as_completed(futures):
+            label, inserted, rejected, seconds, error = future.result()
+            results[label] = (inserted, rejected, seconds, error)
+            if error:
+                print(f"❌ {label}: 적재 실패 ({seconds:.2f}초): {error}")
+            else:
+                rejected_label = f", 거부 {rejected:,}행" if rejected else ""
+                print(f"✅ {label}: {inserted:,}행 커밋{rejected_label} ({seconds:.2f}초)")
+    return results
+
+def insert_data_to_postgresql(test_cases_lfd, test_cases_gen, test_cases_nwp, test_cases_kpx, test_cases_curt, test_cases_hg_gen, test_cases_hg_meas, only_tables=None, loader='copy', concurrency=None):
+    """
+    PostgreSQL에 데이터 삽입 (일곱 테이블)
+    
+    Args:
+        only_tables (list): None이면 모든 테이블에 삽입, 리스트가 있으면 해당 테이블만 삽입
+        loader (str): 적재 방식
+                      'copy'        - 테이블별 COPY ... FROM STDIN (메모리 버퍼)
+                      'executemany' - execute_batch로 여러 행을 묶어서 전송
+                      'row'         - 행마다 cursor.execute (기존 방식)
+        concurrency (int): 동시에 적재할 테이블 수 (None이면 DB_LOAD_CONCURRENCY 환경변수, 1이면 한 연결에서 순차 적재)
+    
+    DB_BATCH_SIZE행 청크마다 커밋하며, 실패한 행은 dead-letter 파일에 기록하고 건너뜁니다.
+    concurrency가 2 이상이면 테이블마다 별도 연결로 동시에 적재하고 테이블별 결과를 따로 출력합니다.
+    """
+    if loader not in LOADERS:
+        raise ValueError(f"지원하지 않는 적재 방식입니다: {loader} (가능한 값: {', '.join(LOADERS)})")
+    
+    concurrency = concurrency or get_load_concurrency()
+    if concurrency > 1:
+        # 작업 스레드들이 동시에 DDL을 실행하지 않도록 먼저 한 번만 확인
+        with db_session() as connection:
+            if not connection:
+                print("데이터베이스 연결에 실패했습니다. 데이터 생성만 진행합니다.")
+                return False
+            ensure_schema(connection)
+        results = load_tables_concurrently(
+            (test_cases_lfd, test_cases_gen, test_cases_nwp, test_cases_kpx, test_cases_curt, test_cases_hg_gen, test_cases_hg_meas),
+            only_tables=only_tables, loader=loader, concurrency=concurrency
+        )
+        failed = [label for label, result in results.items() if result[3]]
+        total_rows = sum(result[0] for result in results.values())
+        print(f"\n총 {total_rows:,}행을 {len(results)}개 테이블에 동시 적재했습니다. (동시 적재 수: {concurrency})")
+        if any(result[1] for result in results.values()):
+            print(f"⚠️ 거부된 행은 {get_dead_letter_path()}에 기록되었습니다.")
+        if failed:
+            print(f"⚠️ 적재에 실패한 테이블: {', '.join(failed)}")
+        return not failed
+    
+    with db_session() as connection:
+        if not connection:
+            print("데이터베이스 연결에 실패했습니다. 데이터 생성만 진행합니다.")
+            return False
         
-        # HG_GEN 테이블 데이터 삽입
-        inserted_hg_gen_count = 0
-        if not only_tables or 'HG_GEN' in [t.upper() for t in only_tables]:
-            for i, case in enumerate(test_cases_hg_gen, 1):
-                try:
-                    cursor.execute(insert_hg_gen_sql, (
-                        case['AREA_GRP_CD'],
-                        case['AREA_GRP_ID'],
-                        case['CRTN_TM'],
-                        case['FCST_TM'],
-                        case['LEAD_TM'],
-                        case['FCST_PROD_CD'],
-                        case['FCST_QGEN'],
-                        case['FCST_CAPA'],
-                        case['REG_DATE'],
-                        case['UPD_DATE']
-                    ))
-                    inserted_hg_gen_count += 1
-                    # print(f"HG_GEN 데이터 {i} 삽입 완료")
-                    
-                except psycopg2.Error as e:
-                    print(f"HG_GEN 데이터 {i} 삽입 실패: {e}")
-                    connection.rollback()
-                    continue
+        try:
+            # 테이블 생성 확인 (프로세스당 한 번)
+            ensure_schema(connection)
+            
+            # 청크 단위 트랜잭션 (DB_BATCH_SIZE행마다 커밋)
+            counts, rejected = load_test_cases(connection, test_cases_lfd, test_cases_gen, test_cases_nwp, test_cases_kpx, test_cases_curt, test_cases_hg_gen, test_cases_hg_meas, only_tables=only_tables, loader=loader, commit_chunks=True)
+            
+            commit_transaction(connection)
+            
+            print(f"\n총 {counts['LFD']}개의 LFD 데이터, {counts['GEN']}개의 GEN 데이터, {counts['NWP']}개의 NWP 데이터, {counts['KPX']}개의 KPX 데이터, {counts['CURT']}개의 CURT 데이터, {counts['HG_GEN']}개의 HG_GEN 데이터, {counts['HG_MEAS']}개의 HG_MEAS 데이터가 PostgreSQL에 성공적으로 삽입되었습니다.")
+            if any(rejected.values()):
+                rejected_summary = ', '.join(f"{label} {count}행" for label, count in rejected.items() if count)
+                print(f"⚠️ 거부된 행: {rejected_summary} (dead-letter: {get_dead_letter_path()})")
+            return True
+            
+        except psycopg2.Error as e:
+            print(f"데이터 삽입 중 오류 발생: {e}")
+            connection.rollback()
+            return False
+
+# 지원하는 데이터 생성 엔진
+ENGINES = ('python', 'numpy', 'model')
+
+# 난수 스트림 - 테이블 라벨마다 하나, 여러 테이블이 함께 쓰는 값(선행시간, 기준 수요량 등)은 COMMON
+# (시드, 날짜, 스트림)마다 독립된 생성기를 쓰므로 테이블을 추가하거나 일부만 생성해도 다른 테이블의 값은 바뀌지 않고,
+# 날짜를 어떤 순서/프로세스로 나눠 생성해도 같은 값이 나옵니다.
+RNG_COMMON_STREAM = 'COMMON'
+
+def parse_seed(value):
+    """
+    --seed 옵션 값을 시드로 변환 (None이면 None, 0 이상의 정수가 아니면 ValueError)
+    """
+    if value is None:
+        return None
+    seed = int(value)
+    if seed < 0:
+        raise ValueError(f"시드는 0 이상의 정수여야 합니다: {value}")
+    return seed
+
+def new_seed():
+    """
+    시드를 지정하지 않은 실행의 시드 (현재 시각) - 출력해 두면 같은 실행을 --seed로 재현할 수 있습니다.
+    """
+    return int(time.time())
+
+def _rng_stream_key(name):
+    """
+    스트림 이름의 고정 정수 키 (이름의 SHA-256 앞 4바이트 - 스트림 순서/개수와 무관)
+    """
+    return int.from_bytes(hashlib.sha256(name.encode()).digest()[:4], 'big')
+
+def table_rngs(seed, day, engine='python', slot=0):
+    """
+    (시드, 날짜, 시점)의 스트림별 난수 생성기
+    numpy/model 엔진은 SeedSequence(seed, spawn_key=(날짜 서수, 시점, 스트림 키))로 만든 numpy Generator,
+    python 엔진은 numpy 없이도 같은 값이 나오도록 (seed, 날짜 서수, 시점, 스트림)의 SHA-256으로 시드한 random.Random을 사용합니다.
+    
+    Args:
+        seed (int): 기준 시드 (None이면 매번 새 엔트로피)
+        day (date): 생성 날짜
+        engine (str): 생성 엔진 ('python'이면 random.Random, 그 외는 numpy Generator)
+        slot (int): 하루 안의 시점 구분 (실시간 피드는 자정부터의 분, 일 단위 생성은 0)
+    
+    Returns:
+        dict: 스트림 이름(COMMON, 테이블 라벨) → 난수 생성기
+    """
+    names = (RNG_COMMON_STREAM,) + tuple(TABLE_LABELS.values())
+    if engine == 'python':
+        if seed is None:
+            return {name: random.Random() for name in names}
+        return {
+            name: random.Random(int.from_bytes(hashlib.sha256(f"{seed}:{day.toordinal()}:{slot}:{name}".encode()).digest()[:8], 'big'))
+            for name in names
+        }
+    if np is None:
+        raise RuntimeError(f"{engine} 엔진을 사용하려면 numpy가 설치되어 있어야 합니다. (pip install numpy)")
+    entropy = seed if seed is not None else np.random.SeedSequence().entropy
+    return {
+        name: np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=(day.toordinal(), slot, _rng_stream_key(name))))
+        for name in names
+    }
+
+# 시간대별 범위 (시작시, 종료시, 하한, 상한) - HOUR_PROFILE_RANGES로 시간대 프로파일을 만드는 기본값
+DEMAND_HOUR_RANGES = [(0, 5, 30000, 45000), (6, 9, 60000, 80000), (10, 16, 50000, 70000), (17, 20, 65000, 85000), (21, 23, 40000, 60000)]
+SRAD_HOUR_RANGES = [(0, 5, 0, 50), (6, 9, 200, 600), (10, 16, 600, 1000), (17, 20, 300, 700), (21, 23, 0, 200)]
+TEMP_HOUR_RANGES = [(0, 5, 10, 18), (6, 9, 15, 25), (10, 16, 20, 30), (17, 20, 18, 28), (21, 23, 15, 22)]
+HUMI_HOUR_RANGES = [(0, 5, 70, 90), (6, 9, 60, 80), (10, 16, 40, 60), (17, 20, 50, 70), (21, 23, 60, 80)]
+WSPD_HOUR_RANGES = [(0, 5, 1, 3), (6, 9, 2, 5), (10, 16, 3, 7), (17, 20, 2, 6), (21, 23, 1, 4)]
+# 수소 예측 생산량/설비용량과 실측 생산량/용량 - 주간(06~18시)에 생산 활발
+HG_GEN_QGEN_HOUR_RANGES = [(0, 5, 20, 80), (6, 18, 50, 200), (19, 23, 20, 80)]
+HG_GEN_CAPA_HOUR_RANGES = [(0, 5, 50, 150), (6, 18, 100, 300), (19, 23, 50, 150)]
+HG_MEAS_PROD_HOUR_RANGES = [(0, 5, 500, 2000), (6, 18, 1000, 5000), (19, 23, 500, 2000)]
+HG_MEAS_CAPA_HOUR_RANGES = [(0, 5, 1000, 4000), (6, 18, 2000, 8000), (19, 23, 1000, 4000)]
+
+# 개별 예측량 QG01..QG06의 변동폭 (±5% ~ ±10%)
+QG_SPREADS = (0.05, 0.06, 0.07, 0.08, 0.09, 0.10)
+
+# CURT(출력제어량 예측) 발표 구조 - 참조 데이터와 동일하게 03/09/15/21시에 발표하고
+# 다음날 00시부터 49시간(LEAD_TM 02100..06900 등)을 예측
+CURT_ISSUE_HOURS = (3, 9, 15, 21)
+CURT_HORIZON_HOURS = 49
+CURT_REG_LEAD_MINUTES = 10  # 발표 시각보다 10분 먼저 등록 (02:50 등록 → 03:00 발표)
+
+# 예측 시각별 최소 수요(FCST_MINPW, 50MW 단위로 반올림)와 출력제어량(FCST_CURT) 범위
+CURT_MINPW_HOUR_RANGES = [(0, 6, 550, 750), (7, 12, 600, 850), (13, 16, 400, 900), (17, 21, 650, 1000), (22, 23, 550, 850)]
+CURT_HOUR_RANGES = [(0, 23, -15, 40)]
+# 오후 태양광 과잉 시간대에는 가끔 큰 출력제어(음수)가 발생
+CURT_EVENT_HOURS = (13, 19)
+CURT_EVENT_PROBABILITY = 0.1
+CURT_EVENT_RANGE = (-800, -100)
+
+# 시간대 프로파일 이름 → 기본 시간대별 범위
+# 생성 코드는 시간대를 분기하지 않고 hour_profiles()의 슬롯별 (하한, 상한) 표를 슬롯 번호로 찾습니다.
+HOUR_PROFILE_RANGES = {
+    'DEMAND': DEMAND_HOUR_RANGES,
+    'SRAD': SRAD_HOUR_RANGES,
+    'TEMP': TEMP_HOUR_RANGES,
+    'HUMI': HUMI_HOUR_RANGES,
+    'WSPD': WSPD_HOUR_RANGES,
+    'CURT_MINPW': CURT_MINPW_HOUR_RANGES,
+    'CURT': CURT_HOUR_RANGES,
+    'HG_GEN_QGEN': HG_GEN_QGEN_HOUR_RANGES,
+    'HG_GEN_CAPA': HG_GEN_CAPA_HOUR_RANGES,
+    'HG_MEAS_PROD': HG_MEAS_PROD_HOUR_RANGES,
+    'HG_MEAS_CAPA': HG_MEAS_CAPA_HOUR_RANGES,
+}
+MINUTES_PER_DAY = 24 * 60
+
+# NWP(기상 예측) 발표 구조 - 참조 데이터와 동일하게 03/09/15/21시에 발표하고
+# 발표마다 다음날 00시부터 발표 시각 + 42시간(LEAD_TM 04200)까지 1시간 간격으로 지점(AREA_GRP_ID)별 예측
+# (37개 지점 기준 하루 4588행 = 37 × (22 + 28 + 34 + 40))
+NWP_ISSUE_HOURS = (3, 9, 15, 21)
+NWP_MAX_LEAD_HOURS = 42
+NWP_PWR_EXC_TP_CD = '09'
+NWP_AREA_GRP_CD = '01'
+NWP_FCST_PROD_CD = '03'
+# 지점마다 순서대로 등록 (발표 9분 전부터 약 39분에 걸쳐 등록, 02:51 → 03:30)
+NWP_REG_LEAD_MINUTES = 9
+NWP_REG_WINDOW_MINUTES = 39
+
+# 참조 덤프의 NWP 지점 (AREA_GRP_ID = 격자 그룹 번호_지점 번호)
+NWP_REFERENCE_SITES = (
+    '1968_005', '1969_016',
+    '4593_001', '4593_002', '4593_003', '4593_004', '4593_005', '4593_006', '4593_007', '4593_008',
+    '4593_009', '4593_010', '4593_011', '4593_012', '4593_013', '4593_014', '4593_015',
+    '8711_001', '8711_002', '8711_003', '8711_004', '8711_005', '8711_006', '8711_007', '8711_008',
+    '8711_009', '8711_010', '8711_011', '8711_012', '8711_013',
+    '8931_002', '9581_001', '9581_002', '9861_011', '9861_013', '9861_014', '9861_015',
+)
+# 참조 덤프의 격자 그룹별 평균 기압(hPa) - 지점 고도 차이를 반영 (가상 격자 그룹은 NWP_PSFC_RANGE에서 고름)
+NWP_GROUP_PSFC = {'1968': 995.0, '1969': 987.8, '4593': 974.4, '8711': 968.0, '8931': 1005.9, '9581': 986.0, '9861': 991.4}
+NWP_PSFC_RANGE = (965, 1010)
+NWP_SITES_PER_GROUP = 15  # 가상 지점을 덧붙일 때 격자 그룹 하나당 지점 수
+NWP_GRID_SEED = 20250801  # 지점 배치(가상 격자 그룹 번호, 지점별 기압)는 날짜/시드와 관계없이 고정
+
+# 공간 상관 - 같은 예측 시각의 전역 성분, 같은 격자 그룹 성분, 지점 성분의 분산 비율
+# 같은 예측 시각이면 발표 시각이 달라도 전역/격자 그룹 성분을 공유합니다.
+NWP_SPATIAL_WEIGHTS = (0.6, 0.3, 0.1)
+NWP_HUMI_TEMP_CORR = -0.6      # 기온이 높은 지점일수록 습도가 낮음
+NWP_TEMP_PER_HPA = 0.055       # 기압(고도) 1hPa당 기온 차이 (°C)
+NWP_PSFC_SPREAD = 3.0          # 지점 기준 기압 대비 변동폭 (hPa)
+NWP_WSL2_RATIO = (1.3, 1.8)    # 상층 풍속(FCST_WSL2) / 지상 풍속(FCST_WSPD)
+NWP_WDIR_STEP = 15.0           # 예측 시각마다 주 풍향의 변화 (표준편차, 도)
+NWP_WDIR_SPREAD = 20.0         # 지점별 풍향 편차 (표준편차, 도)
+NWP_WDL2_VEER = (10.0, 8.0)    # 상층 풍향(FCST_WDL2)의 시계 방향 편차 (평균, 표준편차, 도)
+
+def get_nwp_site_count():
+    """
+    NWP 지점 수 - NWP_SITE_COUNT 환경변수로 조정 (기본값: 참조 덤프의 지점 수 37)
+    참조 덤프보다 크게 주면 같은 형식의 가상 지점을 덧붙여서 격자 규모로 생성합니다.
+    """
+    return max(1, int(os.getenv('NWP_SITE_COUNT', str(len(NWP_REFERENCE_SITES)))))
+
+@functools.lru_cache(maxsize=None)
+def nwp_sites(count):
+    """
+    NWP 지점 격자
+    앞쪽은 참조 덤프의 지점을 그대로 쓰고, count가 더 크면 NWP_SITES_PER_GROUP개씩 가상 격자 그룹을 만들어 덧붙입니다.
+    
+    Returns:
+        tuple: (AREA_GRP_ID 목록, 지점별 격자 그룹 번호(0부터), 지점별 기준 기압, 지점별 기온 보정)
+    """
+    grid_rng = random.Random(NWP_GRID_SEED)
+    site_ids = list(NWP_REFERENCE_SITES[:count])
+    used_groups = {site_id.split('_')[0] for site_id in NWP_REFERENCE_SITES}
+    while len(site_ids) < count:
+        group = f"{grid_rng.randint(1000, 9999):04d}"
+        if group in used_groups:
+            continue
+        used_groups.add(group)
+        site_ids.extend(f"{group}_{number:03d}" for number in range(1, min(NWP_SITES_PER_GROUP, count - len(site_ids)) + 1))
+    
+    # 지점별 값은 지점/격자 그룹 번호로 시드를 잡으므로 지점 수를 바꿔도 같은 지점은 같은 값
+    group_index = {}
+    site_groups = []
+    site_psfc = []
+    for site_id in site_ids:
+        group = site_id.split('_')[0]
+        if group not in group_index:
+            group_index[group] = len(group_index)
+        site_groups.append(group_index[group])
+        group_psfc = NWP_GROUP_PSFC.get(group)
+        if group_psfc is None:
+            group_psfc = random.Random(f"{NWP_GRID_SEED}:{group}").uniform(*NWP_PSFC_RANGE)
+        site_psfc.append(group_psfc + random.Random(f"{NWP_GRID_SEED}:{site_id}").gauss(0, 0.6))
+    site_temp = [(psfc - 1000) * NWP_TEMP_PER_HPA for psfc in site_psfc]
+    return tuple(site_ids), tuple(site_groups), tuple(site_psfc), tuple(site_temp)
+
+def _nwp_forecast_slots(today):
+    """
+    NWP (발표 시각, 예측 시각, 예측 단계) 목록 - 예측 단계는 다음날 00시부터의 시간 수
+    """
+    fcst_start = today + datetime.timedelta(days=1)
+    slots = []
+    for hour in NWP_ISSUE_HOURS:
+        issue_time = today.replace(hour=hour)
+        last_time = issue_time + datetime.timedelta(hours=NWP_MAX_LEAD_HOURS)
+        step_count = int((last_time - fcst_start).total_seconds() // 3600) + 1
+        slots.extend((issue_time, fcst_start + datetime.timedelta(hours=step), step) for step in range(step_count))
+    return slots
+
+def _nwp_reg_dates(issue_time, site_count):
+    """
+    발표 시각의 지점별 등록일시 (NWP_REG_LEAD_MINUTES분 전부터 NWP_REG_WINDOW_MINUTES분에 걸쳐 지점 순서대로)
+    """
+    first = issue_time - datetime.timedelta(minutes=NWP_REG_LEAD_MINUTES)
+    window_seconds = NWP_REG_WINDOW_MINUTES * 60
+    return [
+        (first + datetime.timedelta(seconds=index * window_seconds // site_count)).strftime("%Y-%m-%d %H:%M:%S")
+        for index in range(site_count)
+    ]
+
+def _nwp_correlated_normal(rng, slot_steps, site_groups):
+    """
+    공간 상관이 있는 표준정규 필드 (예측 슬롯 × 지점) - numpy 엔진용
+    예측 시각별 전역 성분, 예측 시각 × 격자 그룹 성분, 지점 성분을 NWP_SPATIAL_WEIGHTS 비율로 합칩니다.
+    지점 수만큼의 공분산 행렬을 만들지 않으므로 지점이 수천 개여도 행 수에 비례하는 비용으로 생성됩니다.
+    """
+    step_count = int(slot_steps.max()) + 1
+    group_count = int(site_groups.max()) + 1
+    global_weight, group_weight, site_weight = (weight ** 0.5 for weight in NWP_SPATIAL_WEIGHTS)
+    global_part = rng.standard_normal(step_count)[slot_steps][:, None]
+    group_part = rng.standard_normal((step_count, group_count))[slot_steps][:, site_groups]
+    site_part = rng.standard_normal((len(slot_steps), len(site_groups)))
+    return global_weight * global_part + group_weight * group_part + site_weight * site_part
+
+def _nwp_correlated_normal_python(rng, slots, site_groups):
+    """
+    _nwp_correlated_normal의 python 엔진용 (슬롯별 지점 값 목록)
+    """
+    step_count = max(step for _, _, step in slots) + 1
+    group_count = max(site_groups) + 1
+    global_weight, group_weight, site_weight = (weight ** 0.5 for weight in NWP_SPATIAL_WEIGHTS)
+    global_part = [rng.gauss(0, 1) for _ in range(step_count)]
+    group_part = [[rng.gauss(0, 1) for _ in range(group_count)] for _ in range(step_count)]
+    return [
+        [global_weight * global_part[step] + group_weight * group_part[step][group] + site_weight * rng.gauss(0, 1) for group in site_groups]
+        for _, _, step in slots
+    ]
+
+def _nwp_scale(z, low, high):
+    """
+    표준정규 값을 [하한, 상한] 범위로 변환 (±2σ를 범위 양 끝에 맞추고 바깥은 잘라냄, 스칼라/numpy 배열 공용)
+    """
+    if np is not None and isinstance(z, np.ndarray):
+        return (low + high) / 2 + (high - low) / 2 * np.clip(z / 2, -1, 1)
+    return (low + high) / 2 + (high - low) / 2 * max(-1.0, min(1.0, z / 2))
+
+def _nwp_columns_numpy(today, rng, site_count=None):
+    """
+    NWP 발표 시각 × 예측 시각 × 지점 격자를 배열 단위로 생성 (행 순서: 발표 → 예측 시각 → 지점)
+    
+    Returns:
+        dict: 컬럼명 → 값 목록 (TableData.extend_columns용)
+    """
+    site_ids, site_groups, site_psfc, site_temp = nwp_sites(site_count or get_nwp_site_count())
+    slots = _nwp_forecast_slots(today)
+    slot_steps = np.array([step for _, _, step in slots])
+    fcst_hours = np.array([fcst_time.hour for _, fcst_time, _ in slots])
+    groups = np.array(site_groups)
+    shape = (len(slots), len(site_ids))
+    profiles = get_hour_profiles()
+    
+    def hour_field(name, z):
+        low, high = profile_arrays(profiles, name, fcst_hours)
+        return _nwp_scale(z, low[:, None], high[:, None])
+    
+    temp_z = _nwp_correlated_normal(rng, slot_steps, groups)
+    humi_z = NWP_HUMI_TEMP_CORR * temp_z + (1 - NWP_HUMI_TEMP_CORR ** 2) ** 0.5 * _nwp_correlated_normal(rng, slot_steps, groups)
+    temp = hour_field('TEMP', temp_z) + np.array(site_temp)
+    humi = hour_field('HUMI', humi_z)
+    srad = hour_field('SRAD', _nwp_correlated_normal(rng, slot_steps, groups))
+    wspd = hour_field('WSPD', _nwp_correlated_normal(rng, slot_steps, groups))
+    wsl2 = wspd * _nwp_scale(_nwp_correlated_normal(rng, slot_steps, groups), *NWP_WSL2_RATIO)
+    # 주 풍향은 예측 시각을 따라 조금씩 돌고, 지점별로는 공간 상관이 있는 편차를 더함
+    prevailing = rng.uniform(0, 360) + np.cumsum(rng.normal(0, NWP_WDIR_STEP, size=int(slot_steps.max()) + 1))
+    wdir = prevailing[slot_steps][:, None] + NWP_WDIR_SPREAD * _nwp_correlated_normal(rng, slot_steps, groups)
+    wdl2 = wdir + rng.normal(*NWP_WDL2_VEER, size=shape)
+    psfc = np.array(site_psfc) + NWP_PSFC_SPREAD * np.clip(_nwp_correlated_normal(rng, slot_steps, groups) / 2, -1, 1)
+    
+    site_total = len(site_ids)
+    row_count = len(slots) * site_total
+    reg_dates_by_issue = {issue_time: _nwp_reg_dates(issue_time, site_total) for issue_time in {slot[0] for slot in slots}}
+    reg_dates = [v for issue_time, _, _ in slots for v in reg_dates_by_issue[issue_time]]
+    return {
+        'PWR_EXC_TP_CD': [NWP_PWR_EXC_TP_CD] * row_count,
+        'AREA_GRP_CD': [NWP_AREA_GRP_CD] * row_count,
+        'AREA_GRP_ID': list(site_ids) * len(slots),
+        'CRTN_TM': [v for issue_time, _, _ in slots for v in [issue_time.strftime("%Y%m%d%H%M")] * site_total],
+        'FCST_TM': [v for _, fcst_time, _ in slots for v in [fcst_time.strftime("%Y%m%d%H%M")] * site_total],
+        'LEAD_TM': [v for issue_time, fcst_time, _ in slots for v in [_lead_tm(issue_time, fcst_time)] * site_total],
+        'FCST_PROD_CD': [NWP_FCST_PROD_CD] * row_count,
+        'FCST_SRAD': np.round(srad, 2).ravel(),
+        'FCST_TEMP': np.round(temp, 2).ravel(),
+        'FCST_HUMI': np.round(humi, 2).ravel(),
+        'FCST_WSPD': np.round(wspd, 2).ravel(),
+        'FCST_WDIR': (np.round(wdir % 360, 2) % 360).ravel(),
+        'FCST_WSL2': np.round(wsl2, 2).ravel(),
+        'FCST_WDL2': (np.round(wdl2 % 360, 2) % 360).ravel(),
+        'FCST_PSFC': np.round(psfc, 2).ravel(),
+        'REG_DATE': reg_dates,
+        'UPD_DATE': reg_dates
+    }
+
+def get_hour_profile_path():
+    """
+    시간대 프로파일 파일 경로 - HOUR_PROFILE_FILE 환경변수 (없으면 None - HOUR_PROFILE_RANGES 기본값만 사용)
+    """
+    return os.getenv('HOUR_PROFILE_FILE') or None
+
+def _expand_hour_ranges(hour_ranges):
+    """
+    시간대별 범위 목록을 24시간 (하한, 상한) 표로 펼침 (빠진 시각이 있으면 ValueError)
+    """
+    table = [None] * 24
+    for start, end, range_low, range_high in hour_ranges:
+        for hour in range(start, end + 1):
+            table[hour] = (float(range_low), float(range_high))
+    if None in table:
+        raise ValueError(f"범위에 없는 시각이 있습니다: {[hour for hour, bounds in enumerate(table) if bounds is None]}")
+    return tuple(table)
+
+@functools.lru_cache(maxsize=None)
+def hour_profiles(path=None):
+    """
+    시간대 프로파일 (이름 → 하루 슬롯별 (하한, 상한) 튜플) - 경로마다 한 번만 만들고 캐시
+    
+    기본값은 HOUR_PROFILE_RANGES를 펼친 24슬롯(1시간) 표이며, path의 JSON 파일({이름: [[하한, 상한], ...]})에 있는
+    프로파일로 바꿉니다. 슬롯 수는 하루(1440분)를 나누어떨어지게 하면 되므로 24(1시간), 96(15분), 288(5분) 등을
+    프로파일마다 다르게 줄 수 있습니다.
+    """
+    profiles = {name: _expand_hour_ranges(hour_ranges) for name, hour_ranges in HOUR_PROFILE_RANGES.items()}
+    if path:
+        with open(path, encoding='utf-8') as profile_file:
+            overrides = json.load(profile_file)
+        for name, table in overrides.items():
+            if name not in profiles:
+                raise ValueError(f"알 수 없는 시간대 프로파일입니다: {name} (가능한 값: {', '.join(profiles)})")
+            if not table or MINUTES_PER_DAY % len(table):
+                raise ValueError(f"{name}: 슬롯 수는 1440(하루 분)의 약수여야 합니다 (24, 96, 288 등): {len(table)}")
+            if any(len(bounds) != 2 or bounds[0] > bounds[1] for bounds in table):
+                raise ValueError(f"{name}: 슬롯마다 [하한, 상한] (하한 <= 상한)이어야 합니다")
+            profiles[name] = tuple((float(low), float(high)) for low, high in table)
+    return profiles
+
+def get_hour_profiles():
+    """
+    현재 설정(HOUR_PROFILE_FILE)의 시간대 프로파일
+    """
+    return hour_profiles(get_hour_profile_path())
+
+def profile_bounds(profiles, name, hour, minute=0):
+    """
+    시간대 프로파일에서 해당 시각(시, 분)이 속한 슬롯의 (하한, 상한)
+    """
+    table = profiles[name]
+    return table[(hour * 60 + minute) * len(table) // MINUTES_PER_DAY]
+
+def profile_arrays(profiles, name, hours, minutes=0):
+    """
+    시간대 프로파일에서 시각 배열(시, 분)에 맞춘 (하한, 상한) numpy 배열
+    """
+    table = np.asarray(profiles[name])
+    slots = (np.asarray(hours) * 60 + minutes) * len(table) // MINUTES_PER_DAY
+    return table[slots, 0], table[slots, 1]
+
+def _draw_qg_matrix(rng, base):
+    """
+    기준값 배열(...)에 대해 QG01..QG06 행렬(..., 6)과 행별 평균/최대/최소를 한 번에 생성
+    """
+    spreads = np.array(QG_SPREADS)
+    factors = rng.uniform(1 - spreads, 1 + spreads, size=base.shape + (len(spreads),))
+    qg = np.round(base[..., None] * factors, 6)
+    return qg, np.round(qg.mean(axis=-1), 6), np.round(qg.max(axis=-1), 6), np.round(qg.min(axis=-1), 6)
+
+def _curt_forecast_times(today):
+    """
+    CURT 발표 시각 목록과 예측 시각 목록 (다음날 00시부터 CURT_HORIZON_HOURS시간)
+    """
+    issue_times = [today.replace(hour=hour) for hour in CURT_ISSUE_HOURS]
+    fcst_start = today + datetime.timedelta(days=1)
+    fcst_times = [fcst_start + datetime.timedelta(hours=step) for step in range(CURT_HORIZON_HOURS)]
+    return issue_times, fcst_times
+
+def _curt_reg_date(issue_time):
+    """
+    CURT 등록일시 (발표 시각보다 CURT_REG_LEAD_MINUTES분 앞)
+    """
+    return (issue_time - datetime.timedelta(minutes=CURT_REG_LEAD_MINUTES)).strftime("%Y-%m-%d %H:%M:%S")
+
+def _lead_tm(crtn_time, fcst_time):
+    """
+    생성시각과 예측시각의 차이를 선행시간(HHHMI 형식)으로 변환
+    """
+    lead_minutes = int((fcst_time - crtn_time).total_seconds() // 60)
+    return f"{lead_minutes // 60:03d}{lead_minutes % 60:02d}"
+
+def _add_generate_seconds(timings, label, started):
+    """
+    테이블 라벨별 생성 소요 시간을 timings에 더함 (timings가 None이면 무시)
+    """
+    if timings is not None:
+        timings[label] = timings.get(label, 0.0) + time.perf_counter() - started
+
+def _generate_random_test_cases_numpy(today, only_tables=None, rngs=None, timings=None):
+    """
+    numpy 기반 데이터 생성 엔진
+    시간 × 연료 × QG01..QG06 등 테이블별 값을 배열 단위로 한 번에 생성하여 TableData 컬럼에 그대로 저장
+    
+    Args:
+        today (datetime): 생성 기준일 (00시)
+        only_tables (list): None이면 모든 테이블 생성, 리스트가 있으면 해당 테이블만 생성
+        rngs (dict): 스트림별 numpy Generator (table_rngs, None이면 새로 생성)
+        timings (dict): 주어지면 테이블 라벨별 생성 소요 시간(초)을 더해 기록
+    """
+    if np is None:
+        raise RuntimeError("numpy 엔진을 사용하려면 numpy가 설치되어 있어야 합니다. (pip install numpy)")
+    if rngs is None:
+        rngs = table_rngs(None, today, engine='numpy')
+    rng = rngs[RNG_COMMON_STREAM]
+    
+    selected = [t.upper() for t in only_tables] if only_tables else None
+    fuel_types = ['SOLAR', 'WIND', 'HYDRO', 'BIOMASS', 'GEOTHERMAL']
+    area_groups = ['SEOUL', 'BUSAN', 'DAEGU', 'INCHON', 'GWANGJU', 'DAEJEON', 'ULSAN', 'SEJONG']
+    
+    hours = np.arange(24)
+    hour_count = len(hours)
+    crtn_times = [today.replace(hour=int(hour)) for hour in hours]
+    crtn_tms = [t.strftime("%Y%m%d%H%M") for t in crtn_times]
+    fcst_tms = [(t + datetime.timedelta(hours=1)).strftime("%Y%m%d%H%M") for t in crtn_times]
+    reg_dates = [t.strftime("%Y-%m-%d %H:%M:%S") for t in crtn_times]
+    
+    lead_hours = rng.integers(1, 25, size=hour_count)
+    lead_minutes = rng.integers(0, 60, size=hour_count)
+    lead_tms = [f"{h:03d}{m:02d}" for h, m in zip(lead_hours.tolist(), lead_minutes.tolist())]
+    fcst_prod_cds = [f"{c:02d}" for c in rng.integers(1, 100, size=hour_count).tolist()]
+    
+    profiles = get_hour_profiles()
+    demand_low, demand_high = profile_arrays(profiles, 'DEMAND', hours)
+    base_demand = rng.uniform(demand_low, demand_high)
+    
+    test_cases_lfd = TableData('REP_DATA_RE_FCST_LFD_DA')
+    test_cases_gen = TableData('REP_DATA_RE_FCST_GEN_DA')
+    test_cases_nwp = TableData('REP_DATA_HG_FCST_NWP_DA')
+    test_cases_kpx = TableData('REP_DATA_RE_KPX_JEJU_SUKUB_M')
+    test_cases_curt = TableData('REP_DATA_P2H_FCST_CURT_DA')
+    test_cases_hg_gen = TableData('REP_DATA_HG_FCST_GEN_GENT_DA')
+    test_cases_hg_meas = TableData('REP_DATA_HG_MEAS_GEM_GENT_DA')
+    
+    started = time.perf_counter()
+    # REP_DATA_RE_FCST_LFD_DA: 시간 × QG01..QG06
+    if not selected or 'LFD' in selected:
+        qg, qgen, qgmx, qgmn = _draw_qg_matrix(rngs['LFD'], base_demand)
+        lfd_columns = {
+            'CRTN_TM': crtn_tms,
+            'FCST_TM': fcst_tms,
+            'LEAD_TM': lead_tms,
+            'FCST_PROD_CD': fcst_prod_cds,
+            'FCST_QGEN': qgen,
+            'FCST_QGMX': qgmx,
+            'FCST_QGMN': qgmn,
+            'REG_DATE': reg_dates,
+            'UPD_DATE': reg_dates
+        }
+        for k in range(6):
+            lfd_columns[f'FCST_QG{k + 1:02d}'] = qg[:, k]
+        test_cases_lfd.extend_columns(lfd_columns)
+    _add_generate_seconds(timings, 'LFD', started)
+    
+    started = time.perf_counter()
+    # REP_DATA_RE_FCST_GEN_DA: 시간 × 연료 × QG01..QG06 (행 순서는 시간 → 연료)
+    # KPX의 신재생 합계도 GEN 값을 쓰므로 KPX만 생성할 때도 GEN 스트림에서 같은 값을 뽑음
+    renewable_qgen = np.zeros((hour_count, len(fuel_types)))
+    if not selected or 'GEN' in selected or 'KPX' in selected:
+        rng = rngs['GEN']
+        renewable_base = base_demand[:, None] * rng.uniform(0.1, 0.3, size=(hour_count, len(fuel_types)))
+        qg, renewable_qgen, qgmx, qgmn = _draw_qg_matrix(rng, renewable_base)
+        fcst_capa = np.round(renewable_base * rng.uniform(0.8, 1.2, size=renewable_base.shape), 6)
+        ess_chrg = np.round(renewable_base * rng.uniform(0.05, 0.15, size=renewable_base.shape), 6)
+        ess_disc = np.round(renewable_base * rng.uniform(0.05, 0.15, size=renewable_base.shape), 6)
+        ess_capa = np.round(renewable_base * rng.uniform(0.1, 0.3, size=renewable_base.shape), 6)
+        pwr_exc_tp_cds = rng.integers(1, 100, size=renewable_base.shape).ravel().tolist()
+        fuel_count = len(fuel_types)
+    if not selected or 'GEN' in selected:
+        gen_columns = {
+            'PWR_EXC_TP_CD': [f"{c:02d}" for c in pwr_exc_tp_cds],
+            'FUEL_TP_CD': fuel_types * hour_count,
+            'CRTN_TM': [v for v in crtn_tms for _ in range(fuel_count)],
+            'FCST_TM': [v for v in fcst_tms for _ in range(fuel_count)],
+            'LEAD_TM': [v for v in lead_tms for _ in range(fuel_count)],
+            'FCST_PROD_CD': [v for v in fcst_prod_cds for _ in range(fuel_count)],
+            'FCST_QGEN': renewable_qgen.ravel(),
+            'FCST_QGMX': qgmx.ravel(),
+            'FCST_QGMN': qgmn.ravel(),
+            'FCST_CAPA': fcst_capa.ravel(),
+            'ESS_CHRG': ess_chrg.ravel(),
+            'ESS_DISC': ess_disc.ravel(),
+            'ESS_CAPA': ess_capa.ravel(),
+            'REG_DATE': [v for v in reg_dates for _ in range(fuel_count)],
+        }
+        gen_columns['UPD_DATE'] = gen_columns['REG_DATE']
+        for k in range(6):
+            gen_columns[f'FCST_QG{k + 1:02d}'] = qg[:, :, k].ravel()
+        test_cases_gen.extend_columns(gen_columns)
+    _add_generate_seconds(timings, 'GEN' if not selected or 'GEN' in selected else 'KPX', started)
+    
+    started = time.perf_counter()
+    # REP_DATA_HG_FCST_NWP_DA: 발표 시각 × 예측 시각 × 지점 (공간 상관이 있는 필드를 한 번에 생성)
+    if not selected or 'NWP' in selected:
+        test_cases_nwp.extend_columns(_nwp_columns_numpy(today, rngs['NWP']))
+    _add_generate_seconds(timings, 'NWP', started)
+    
+    started = time.perf_counter()
+    # REP_DATA_RE_KPX_JEJU_SUKUB_M: 신재생 합계는 GEN의 연료별 최종 발전량 합
+    if not selected or 'KPX' in selected:
+        rng = rngs['KPX']
+        test_cases_kpx.extend_columns({
+            'TM': crtn_tms,
+            'SUPP_ABILITY': np.round(base_demand * rng.uniform(1.1, 1.3, size=hour_count), 5),
+            'CURR_PWR_TOT': np.round(base_demand * rng.uniform(0.95, 1.05, size=hour_count), 5),
+            'RENEW_PWR_TOT': np.round(renewable_qgen.sum(axis=1), 5),
+            'RENEW_PWR_SOLAR': np.round(renewable_qgen[:, fuel_types.index('SOLAR')], 5),
+            'RENEW_PWR_WIND': np.round(renewable_qgen[:, fuel_types.index('WIND')], 5),
+            'REG_DATE': reg_dates,
+            'UPD_DATE': reg_dates
+        })
+    _add_generate_seconds(timings, 'KPX', started)
+    
+    started = time.perf_counter()
+    # REP_DATA_P2H_FCST_CURT_DA: 발표 시각 × 예측 구간 (하루 한 번, 키 중복 없음)
+    if not selected or 'CURT' in selected:
+        rng = rngs['CURT']
+        curt_issue_times, curt_fcst_times = _curt_forecast_times(today)
+        curt_fcst_hours = np.array([t.hour for t in curt_fcst_times])
+        curt_shape = (len(curt_issue_times), len(curt_fcst_times))
+        minpw_low, minpw_high = profile_arrays(profiles, 'CURT_MINPW', curt_fcst_hours)
+        fcst_minpw = np.round(rng.uniform(minpw_low, minpw_high, size=curt_shape) / 50) * 50
+        curt_low, curt_high = profile_arrays(profiles, 'CURT', curt_fcst_hours)
+        fcst_curt = rng.uniform(curt_low, curt_high, size=curt_shape)
+        event_hours = (curt_fcst_hours >= CURT_EVENT_HOURS[0]) & (curt_fcst_hours <= CURT_EVENT_HOURS[1])
+        events = event_hours & (rng.random(size=curt_shape) < CURT_EVENT_PROBABILITY)
+        fcst_curt = np.round(np.where(events, rng.uniform(*CURT_EVENT_RANGE, size=curt_shape), fcst_curt), 2)
+        curt_reg_dates = [_curt_reg_date(t) for t in curt_issue_times]
+        fcst_count = len(curt_fcst_times)
+        test_cases_curt.extend_columns({
+            'CRTN_TM': [t.strftime("%Y%m%d%H%M") for t in curt_issue_times for _ in range(fcst_count)],
+            'FCST_TM': [t.strftime("%Y%m%d%H%M") for t in curt_fcst_times] * len(curt_issue_times),
+            'LEAD_TM': [_lead_tm(issue, fcst) for issue in curt_issue_times for fcst in curt_fcst_times],
+            'FCST_MINPW': fcst_minpw.ravel(),
+            'FCST_CURT': fcst_curt.ravel(),
+            'REG_DATE': [v for v in curt_reg_dates for _ in range(fcst_count)],
+            'UPD_DATE': [v for v in curt_reg_dates for _ in range(fcst_count)]
+        })
+    _add_generate_seconds(timings, 'CURT', started)
+    
+    # REP_DATA_HG_FCST_GEN_GENT_DA / REP_DATA_HG_MEAS_GEM_GENT_DA: 시간 × 영역 그룹
+    area_count = len(area_groups)
+    area_shape = (hour_count, area_count)
+    
+    def area_uniform(rng, name, digits):
+        low, high = profile_arrays(profiles, name, hours)
+        return np.round(rng.uniform(low[:, None], high[:, None], size=area_shape), digits)
+    
+    started = time.perf_counter()
+    if not selected or 'HG_GEN' in selected:
+        rng = rngs['HG_GEN']
+        hg_qgen = area_uniform(rng, 'HG_GEN_QGEN', 6)
+        hg_capa = area_uniform(rng, 'HG_GEN_CAPA', 6)
+        area_ids = rng.integers(1, 1000, size=area_shape).ravel().tolist()
+        area_codes = area_groups * hour_count
+        hg_reg_dates = [v for v in reg_dates for _ in range(area_count)]
+        test_cases_hg_gen.extend_columns({
+            'AREA_GRP_CD': area_codes,
+            'AREA_GRP_ID': [f"{code}_H2_{area_id:03d}" for code, area_id in zip(area_codes, area_ids)],
+            'CRTN_TM': [v for v in crtn_tms for _ in range(area_count)],
+            'FCST_TM': [v for v in fcst_tms for _ in range(area_count)],
+            'LEAD_TM': [v for v in lead_tms for _ in range(area_count)],
+            'FCST_PROD_CD': [v for v in fcst_prod_cds for _ in range(area_count)],
+            'FCST_QGEN': hg_qgen.ravel(),
+            'FCST_CAPA': hg_capa.ravel(),
+            'REG_DATE': hg_reg_dates,
+            'UPD_DATE': hg_reg_dates
+        })
+    _add_generate_seconds(timings, 'HG_GEN', started)
+    
+    started = time.perf_counter()
+    if not selected or 'HG_MEAS' in selected:
+        rng = rngs['HG_MEAS']
+        hgen_prod = area_uniform(rng, 'HG_MEAS_PROD', 5)
+        hgen_capa = area_uniform(rng, 'HG_MEAS_CAPA', 5)
+        area_ids = rng.integers(1, 1000, size=area_shape).ravel().tolist()
+        area_codes = area_groups * hour_count
+        hg_reg_dates = [v for v in reg_dates for _ in range(area_count)]
+        test_cases_hg_meas.extend_columns({
+            'TM': [v for v in crtn_tms for _ in range(area_count)],
+            'AREA_GRP_CD': area_codes,
+            'AREA_GRP_ID': [f"{code}_H2_{area_id:03d}" for code, area_id in zip(area_codes, area_ids)],
+            'HGEN_PROD': hgen_prod.ravel(),
+            'HGEN_CAPA': hgen_capa.ravel(),
+            'REG_DATE': hg_reg_dates,
+            'UPD_DATE': hg_reg_dates
+        })
+    _add_generate_seconds(timings, 'HG_MEAS', started)
+    
+    return test_cases_lfd, test_cases_gen, test_cases_nwp, test_cases_kpx, test_cases_curt, test_cases_hg_gen, test_cases_hg_meas
+
+# 통계 모델(--engine model) 학습 대상: 테이블명 → (시간대 기준 컬럼, 범주 컬럼) - TABLE_SPECS의 model 선언
+# 범주 × 시간대(0~23시)마다 값 컬럼(덤프에 있는 DECIMAL 컬럼)의 분포와 상관관계를 학습합니다.
+MODEL_TABLES = {name: spec.model for name, spec in TABLE_SPECS.items() if spec.model}
+
+# 모델 캐시 형식 버전 (학습 방식이나 테이블 컬럼이 바뀌면 올려서 기존 캐시를 무효화)
+MODEL_VERSION = 2
+
+# 앙상블 멤버 컬럼 (생성 후 최대/최소 컬럼을 멤버 값에 맞춤)
+QG_MEMBER_COLUMNS = ('FCST_QG01', 'FCST_QG02', 'FCST_QG03', 'FCST_QG04', 'FCST_QG05', 'FCST_QG06')
+
+def get_model_cache_dir():
+    """
+    통계 모델 캐시 디렉터리 (MODEL_CACHE_DIR 환경변수, 기본값: 스크립트 디렉터리의 .model_cache)
+    """
+    return os.getenv('MODEL_CACHE_DIR') or os.path.join(os.path.dirname(os.path.abspath(__file__)), '.model_cache')
+
+def dump_source_hash(files):
+    """
+    덤프 파일 내용(과 MODEL_VERSION)의 해시 - 캐시 파일 이름에 사용
+    """
+    digest = hashlib.sha256(f"v{MODEL_VERSION}".encode())
+    for path in sorted(files, key=os.path.basename):
+        digest.update(os.path.basename(path).encode())
+        with open(path, 'rb') as dump_file:
+            for block in iter(lambda: dump_file.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()[:16]
+
+class TableModel:
+    """
+    테이블 하나의 통계 모델
+    
+    그룹(범주|시간대)마다 값 컬럼의 평균 벡터, 공분산 제곱근 행렬, NULL 비율, 관측 최소/최대값을 가지며
+    생성은 그룹별 다변량 정규분포에서 한 번에 뽑은 뒤 관측 범위로 자르고 NULL 비율만큼 비웁니다.
+    관측되지 않은 시간대는 같은 범주의 전체 시간대 그룹('범주|*')을 사용합니다.
+    """
+    
+    FIELDS = ('mean', 'scale', 'null', 'low', 'high')
+    
+    def __init__(self, table_name, columns, groups, categories, mean, scale, null, low, high):
+        self.table_name = table_name
+        self.time_column, self.category_columns = MODEL_TABLES[table_name]
+        self.columns = tuple(columns)
+        self.groups = tuple(groups)
+        self.categories = [tuple(category) for category in categories]
+        self.mean, self.scale, self.null, self.low, self.high = mean, scale, null, low, high
+        self._group_index = {group: index for index, group in enumerate(self.groups)}
+    
+    @classmethod
+    def fit(cls, table_name, cases, columns):
+        """
+        TableData에서 columns(값 컬럼)의 그룹별 분포를 학습
+        """
+        time_column, category_columns = MODEL_TABLES[table_name]
+        category_keys = ['|'.join(values) for values in zip(*(cases.column(c) for c in category_columns))] if category_columns else [''] * len(cases)
+        hours = [value[8:10] for value in cases.column(time_column)]
+        values = np.column_stack([np.asarray(cases.column(column), dtype=np.float64) for column in columns])
         
-        # HG_MEAS 테이블 데이터 삽입
-        inserted_hg_meas_count = 0
-        if not only_tables or 'HG_MEAS' in [t.upper() for t in only_tables]:
-            for i, case in enumerate(test_cases_hg_meas, 1):
-                try:
-                    cursor.execute(insert_hg_meas_sql, (
-                        case['TM'],
-                        case['AREA_GRP_CD'],
-                        case['AREA_GRP_ID'],
-                        case['HGEN_PROD'],
-                        case['HGEN_CAPA'],
-                        case['REG_DATE'],
-                        case['UPD_DATE']
-                    ))
-                    inserted_hg_meas_count += 1
-                    # print(f"HG_MEAS 데이터 {i} 삽입 완료")
-                    
-                except psycopg2.Error as e:
-                    print(f"HG_MEAS 데이터 {i} 삽입 실패: {e}")
-                    connection.rollback()
-                    continue
+        rows_by_group = {}
+        for row, (category_key, hour) in enumerate(zip(category_keys, hours)):
+            rows_by_group.setdefault(f"{category_key}|{hour}", []).append(row)
+            rows_by_group.setdefault(f"{category_key}|*", []).append(row)
+        groups = sorted(rows_by_group)
+        stats = [cls._fit_group(values[rows_by_group[group]]) for group in groups]
+        categories = sorted({tuple(key.split('|')) for key in category_keys}) if category_columns else [()]
+        return cls(table_name, columns, groups, categories, *(np.stack(field) for field in zip(*stats)))
+    
+    @staticmethod
+    def _fit_group(values):
+        """
+        관측값 행렬(행 × 값 컬럼, NULL은 NaN) 하나의 (평균, 공분산 제곱근, NULL 비율, 최소, 최대)
+        """
+        present = ~np.isnan(values)
+        counts = present.sum(axis=0)
+        mean = np.where(counts > 0, np.nansum(values, axis=0) / np.maximum(counts, 1), 0.0)
+        filled = np.where(present, values, mean)
+        covariance = np.cov(filled, rowvar=False).reshape(len(mean), len(mean)) if len(values) > 1 else np.zeros((len(mean), len(mean)))
+        # 멤버 컬럼끼리 같은 값이면 공분산이 특이행렬이므로 Cholesky 대신 고유값 분해로 제곱근을 구함
+        eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+        scale = eigenvectors * np.sqrt(np.clip(eigenvalues, 0.0, None))
+        low = np.where(counts > 0, np.where(present, values, np.inf).min(axis=0), 0.0)
+        high = np.where(counts > 0, np.where(present, values, -np.inf).max(axis=0), 0.0)
+        return mean, scale, 1.0 - counts / len(values), low, high
+    
+    def to_arrays(self):
+        """
+        npz 저장용 배열 dict ('테이블명.필드' 키)
+        """
+        arrays = {
+            f"{self.table_name}.columns": np.array(self.columns),
+            f"{self.table_name}.groups": np.array(self.groups),
+            f"{self.table_name}.categories": np.array(self.categories, dtype=str).reshape(len(self.categories), len(self.category_columns)),
+        }
+        arrays.update({f"{self.table_name}.{field}": getattr(self, field) for field in self.FIELDS})
+        return arrays
+    
+    @classmethod
+    def from_arrays(cls, table_name, arrays):
+        """
+        to_arrays()로 저장한 배열에서 모델 복원
+        """
+        return cls(table_name, *(arrays[f"{table_name}.{field}"].tolist() for field in ('columns', 'groups', 'categories')),
+                   *(arrays[f"{table_name}.{field}"] for field in cls.FIELDS))
+    
+    def expand_categories(self, cases):
+        """
+        범주 컬럼이 있는 테이블(GEN)의 행 골격을 시간대 × 학습한 범주로 다시 구성
+        (범주 컬럼 외에는 시간대별 첫 행의 값을 범주마다 복사)
+        """
+        seen = set()
+        templates = []
+        for row, time_value in enumerate(cases.column(self.time_column)):
+            if time_value not in seen:
+                seen.add(time_value)
+                templates.append(row)
+        values_by_column = {}
+        for column in cases.columns:
+            if column in self.category_columns:
+                position = self.category_columns.index(column)
+                values_by_column[column] = [category[position] for _ in templates for category in self.categories]
+            else:
+                values = cases.column(column)
+                values_by_column[column] = [values[row] for row in templates for _ in self.categories]
+        expanded = TableData(cases.table_name, cases.columns)
+        expanded.extend_columns(values_by_column)
+        return expanded
+    
+    def apply(self, cases, rng):
+        """
+        cases의 값 컬럼을 모델에서 뽑은 값으로 바꾼 새 TableData (다른 컬럼은 그대로)
+        """
+        category_keys = ['|'.join(values) for values in zip(*(cases.column(c) for c in self.category_columns))] if self.category_columns else [''] * len(cases)
+        group_index = np.array([
+            self._group_index.get(f"{category_key}|{value[8:10]}", self._group_index.get(f"{category_key}|*", 0))
+            for category_key, value in zip(category_keys, cases.column(self.time_column))
+        ])
+        normal = rng.standard_normal((len(group_index), len(self.columns)))
+        drawn = self.mean[group_index] + np.einsum('nij,nj->ni', self.scale[group_index], normal)
+        drawn = np.clip(drawn, self.low[group_index], self.high[group_index])
+        drawn[rng.random(drawn.shape) < self.null[group_index]] = np.nan
         
-        connection.commit()
-        cursor.close()
-        connection.close()
+        scales = TABLE_DECIMAL_SCALES[self.table_name]
+        values_by_column = {column: cases.column(column) for column in cases.columns}
+        for position, column in enumerate(self.columns):
+            values_by_column[column] = np.round(drawn[:, position], scales.get(column, (0, 6))[1])
         
-        print(f"\n총 {inserted_lfd_count}개의 LFD 데이터, {inserted_gen_count}개의 GEN 데이터, {inserted_nwp_count}개의 NWP 데이터, {inserted_kpx_count}개의 KPX 데이터, {inserted_curt_count}개의 CURT 데이터, {inserted_hg_gen_count}개의 HG_GEN 데이터, {inserted_hg_meas_count}개의 HG_MEAS 데이터가 PostgreSQL에 성공적으로 삽입되었습니다.")
-        return True
+        # 최대/최소는 멤버 값에 맞추고 대표값은 그 사이로 제한
+        members = [values_by_column[column] for column in QG_MEMBER_COLUMNS if column in self.columns]
+        if members and 'FCST_QGMX' in self.columns and 'FCST_QGMN' in self.columns:
+            member_max = np.fmax.reduce(members)
+            member_min = np.fmin.reduce(members)
+            values_by_column['FCST_QGMX'] = np.where(np.isnan(member_max), values_by_column['FCST_QGMX'], member_max)
+            values_by_column['FCST_QGMN'] = np.where(np.isnan(member_min), values_by_column['FCST_QGMN'], member_min)
+            if 'FCST_QGEN' in self.columns:
+                values_by_column['FCST_QGEN'] = np.fmin(np.fmax(values_by_column['FCST_QGEN'], values_by_column['FCST_QGMN']), values_by_column['FCST_QGMX'])
         
-    except psycopg2.Error as e:
-        print(f"데이터 삽입 중 오류 발생: {e}")
-        if connection:
-            connection.rollback()
-            connection.close()
-        return False
+        result = TableData(cases.table_name, cases.columns)
+        result.extend_columns(values_by_column)
+        return result
+
+def fit_dump_model(files):
+    """
+    덤프 파일들에서 MODEL_TABLES 테이블의 통계 모델을 학습
+    덤프 헤더에 있는 DECIMAL 컬럼만 학습하며, 학습하지 않은 컬럼은 numpy 엔진 값을 그대로 사용합니다.
+    
+    Returns:
+        dict: 테이블명 → TableModel
+    """
+    cases_by_table = {}
+    for path in files:
+        table_name = replay_table_name(path)
+        if table_name not in MODEL_TABLES:
+            continue
+        with open(path, newline='', encoding='utf-8-sig') as dump_file:
+            header = {name.strip().upper() for name in next(csv.reader(dump_file), [])}
+        cases = cases_by_table.setdefault(table_name, (TableData(table_name), set()))
+        cases[1].update(header)
+        for chunk in read_replay_chunks(path, table_name):
+            cases[0].extend(chunk)
+    
+    model = {}
+    for table_name, (cases, header) in cases_by_table.items():
+        columns = [column for column in cases.columns if column in cases.numeric_columns and column in header]
+        if columns and len(cases):
+            model[table_name] = TableModel.fit(table_name, cases, columns)
+    return model
+
+def load_dump_model(files=None, cache_dir=None):
+    """
+    덤프에서 학습한 통계 모델을 반환
+    덤프 내용 해시로 이름 붙인 캐시(.npz)가 있으면 읽고, 없으면 학습한 뒤 저장합니다.
+    
+    Returns:
+        dict: 테이블명 → TableModel
+    """
+    if np is None:
+        raise RuntimeError("통계 모델 엔진을 사용하려면 numpy가 설치되어 있어야 합니다. (pip install numpy)")
+    files = files or find_replay_files()
+    if not files:
+        raise RuntimeError("통계 모델을 학습할 rep_data_*.csv 덤프가 없습니다.")
+    cache_dir = cache_dir or get_model_cache_dir()
+    cache_path = os.path.join(cache_dir, f"dump_model_{dump_source_hash(files)}.npz")
+    
+    if os.path.exists(cache_path):
+        try:
+            with np.load(cache_path, allow_pickle=False) as arrays:
+                table_names = arrays['tables'].tolist()
+                return {table_name: TableModel.from_arrays(table_name, arrays) for table_name in table_names}
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠️ 통계 모델 캐시를 읽지 못해 다시 학습합니다 ({cache_path}): {e}")
+    
+    started = time.perf_counter()
+    model = fit_dump_model(files)
+    arrays = {'tables': np.array(sorted(model))}
+    for table_model in model.values():
+        arrays.update(table_model.to_arrays())
+    os.makedirs(cache_dir, exist_ok=True)
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as cache_file:
+        np.savez_compressed(cache_file, **arrays)
+    os.replace(temp_path, cache_path)
+    print(f"📊 통계 모델 학습 완료 ({len(model)}개 테이블, {time.perf_counter() - started:.2f}초) → {cache_path}")
+    return model
+
+# 프로세스별 통계 모델 (처음 사용할 때 캐시에서 읽거나 학습)
+_dump_model = None
+
+def get_dump_model():
+    """
+    프로세스에서 한 번만 읽은 통계 모델
+    """
+    global _dump_model
+    if _dump_model is None:
+        _dump_model = load_dump_model()
+    return _dump_model
+
+def _generate_random_test_cases_model(today, only_tables=None, rngs=None, model=None, timings=None):
+    """
+    통계 모델 기반 데이터 생성 엔진
+    행 골격(시간, 코드 등)은 numpy 엔진으로 만들고, 모델을 학습한 테이블의 값 컬럼은
+    덤프에서 학습한 시간대(와 연료)별 분포/상관관계에서 한 번에 뽑은 값으로 바꿉니다.
+    
+    Args:
+        today (datetime): 생성 기준일 (00시)
+        only_tables (list): None이면 모든 테이블 생성, 리스트가 있으면 해당 테이블만 생성
+        rngs (dict): 스트림별 numpy Generator (table_rngs, None이면 새로 생성)
+        model (dict): 테이블명 → TableModel (None이면 get_dump_model())
+        timings (dict): 주어지면 테이블 라벨별 생성 소요 시간(초, 골격 + 모델 값)을 더해 기록
+    """
+    if np is None:
+        raise RuntimeError("통계 모델 엔진을 사용하려면 numpy가 설치되어 있어야 합니다. (pip install numpy)")
+    if rngs is None:
+        rngs = table_rngs(None, today, engine='model')
+    model = model if model is not None else get_dump_model()
+    
+    # 모델 값은 골격을 만든 뒤 같은 테이블 스트림에서 이어서 뽑음
+    test_cases = []
+    for cases in _generate_random_test_cases_numpy(today, only_tables=only_tables, rngs=rngs, timings=timings):
+        table_model = model.get(cases.table_name)
+        if table_model is not None and len(cases):
+            started = time.perf_counter()
+            if table_model.category_columns:
+                cases = table_model.expand_categories(cases)
+            cases = table_model.apply(cases, rngs[TABLE_LABELS[cases.table_name]])
+            _add_generate_seconds(timings, TABLE_LABELS[cases.table_name], started)
+        test_cases.append(cases)
+    return tuple(test_cases)
+
+def _record_generate_metrics(test_cases, seconds, timings=None):
+    """
+    생성 결과를 METRICS의 'generate' 단계로 기록
+    numpy/model 엔진은 테이블별로 잰 소요 시간(timings)과 행 수를 테이블 라벨별로 기록하고,
+    python 엔진은 시간대 루프 한 번에 여러 테이블을 함께 만들기 때문에
+    소요 시간은 호출 단위(대상 없음)로, 행 수는 테이블 라벨별로 기록합니다.
+    """
+    if timings is None:
+        METRICS.record('generate', seconds=seconds, rows=sum(len(cases) for cases in test_cases))
+    for cases in test_cases:
+        if len(cases):
+            label = TABLE_LABELS[cases.table_name]
+            METRICS.record('generate', label, seconds=timings.get(label, 0.0) if timings is not None else None, rows=len(cases))
 
-def generate_random_test_cases(num_cases=10, next_day=False, only_tables=None):
+def generate_random_test_cases(num_cases=10, next_day=False, only_tables=None, engine='python', target_date=None, seed=None):
     """
     수요예측 데이터 테스트케이스 생성 함수
     00시부터 23시까지 한 시간 간격으로 데이터 생성 (24시간 운영)
@@ -537,21 +2460,47 @@ def generate_random_test_cases(num_cases=10, next_day=False, only_tables=None):
         num_cases (int): 생성할 테스트 케이스 수 (기본값: 10)
         next_day (bool): True이면 다음날 데이터 생성, False이면 오늘 데이터 생성
         only_tables (list): None이면 모든 테이블 생성, 리스트가 있으면 해당 테이블만 생성
-                           가능한 값: ['HG_GEN', 'HG_MEAS']
+                           가능한 값: TABLE_SPECS의 테이블 라벨 ['LFD', 'GEN', 'NWP', 'KPX', 'CURT', 'HG_GEN', 'HG_MEAS']
+        engine (str): 생성 엔진 ('python' - 행 단위 random, 'numpy' - 배열 단위 생성, 'model' - 덤프에서 학습한 통계 모델)
+        target_date (date): 생성할 날짜 (지정하면 next_day는 무시, 백필에서 사용)
+        seed (int): 기준 난수 시드 - (시드, 날짜, 테이블)마다 독립된 스트림(table_rngs)을 사용하므로
+                    같은 시드와 날짜는 어떤 테이블 조합/프로세스에서 생성하든 같은 데이터를 만듭니다. (None이면 매번 다른 데이터)
     """
-    test_cases_lfd = []  # REP_DATA_RE_FCST_LFD_DA용
-    test_cases_gen = []  # REP_DATA_RE_FCST_GEN_DA용
-    test_cases_nwp = []  # REP_DATA_HG_FCST_NWP_DA용
-    test_cases_kpx = []  # REP_DATA_RE_KPX_JEJU_SUKUB_M용
-    test_cases_curt = [] # REP_DATA_P2H_FCST_CURT_DA용
-    test_cases_hg_gen = [] # REP_DATA_HG_FCST_GEN_GENT_DA용
-    test_cases_hg_meas = [] # REP_DATA_HG_MEAS_GEM_GENT_DA용
+    if engine not in ENGINES:
+        raise ValueError(f"지원하지 않는 생성 엔진입니다: {engine} (가능한 값: {', '.join(ENGINES)})")
     
     # 날짜 기준으로 00시부터 23시까지 (24시간 운영)
-    base_date = datetime.datetime.now()
-    if next_day:
-        base_date = base_date + datetime.timedelta(days=1)
+    if target_date is not None:
+        base_date = datetime.datetime(target_date.year, target_date.month, target_date.day)
+    else:
+        base_date = datetime.datetime.now()
+        if next_day:
+            base_date = base_date + datetime.timedelta(days=1)
     today = base_date.replace(hour=0, minute=0, second=0, microsecond=0)
+    
+    started = time.perf_counter()
+    rngs = table_rngs(seed, today.date(), engine=engine)
+    if engine == 'numpy':
+        timings = {}
+        test_cases = _generate_random_test_cases_numpy(today, only_tables=only_tables, rngs=rngs, timings=timings)
+        _record_generate_metrics(test_cases, time.perf_counter() - started, timings)
+        return test_cases
+    if engine == 'model':
+        timings = {}
+        test_cases = _generate_random_test_cases_model(today, only_tables=only_tables, rngs=rngs, timings=timings)
+        _record_generate_metrics(test_cases, time.perf_counter() - started, timings)
+        return test_cases
+    
+    # 여러 테이블이 함께 쓰는 값(선행시간, 예측생산구분, 기준 수요량)은 COMMON 스트림, 테이블 값은 테이블별 스트림
+    rng = rngs[RNG_COMMON_STREAM]
+    
+    test_cases_lfd = TableData('REP_DATA_RE_FCST_LFD_DA')
+    test_cases_gen = TableData('REP_DATA_RE_FCST_GEN_DA')
+    test_cases_nwp = TableData('REP_DATA_HG_FCST_NWP_DA')
+    test_cases_kpx = TableData('REP_DATA_RE_KPX_JEJU_SUKUB_M')
+    test_cases_curt = TableData('REP_DATA_P2H_FCST_CURT_DA')
+    test_cases_hg_gen = TableData('REP_DATA_HG_FCST_GEN_GENT_DA')
+    test_cases_hg_meas = TableData('REP_DATA_HG_MEAS_GEM_GENT_DA')
     start_hour = 0
     end_hour = 23
     
@@ -561,6 +2510,12 @@ def generate_random_test_cases(num_cases=10, next_day=False, only_tables=None):
     # 영역 그룹 코드들 (수소 생산단지)
     area_groups = ['SEOUL', 'BUSAN', 'DAEGU', 'INCHON', 'GWANGJU', 'DAEJEON', 'ULSAN', 'SEJONG']
     
+    lfd_rng, gen_rng, nwp_rng, kpx_rng, curt_rng, hg_gen_rng, hg_meas_rng = (rngs[label] for label in ('LFD', 'GEN', 'NWP', 'KPX', 'CURT', 'HG_GEN', 'HG_MEAS'))
+    
+    # 선택된 테이블 라벨과 시간대 프로파일 (시간대마다 분기하지 않고 슬롯 번호로 범위를 찾음)
+    selected = {t.upper() for t in only_tables} if only_tables else None
+    profiles = get_hour_profiles()
+    
     for hour in range(start_hour, end_hour + 1):
         # 생성시간을 해당 시간으로 설정
         crtn_time = today.replace(hour=hour, minute=0, second=0, microsecond=0)
@@ -571,34 +2526,23 @@ def generate_random_test_cases(num_cases=10, next_day=False, only_tables=None):
         fcst_tm = fcst_time.strftime("%Y%m%d%H%M")
         
         # 선행시간 (HHHMI 형식)
-        lead_hours = random.randint(1, 24)
-        lead_minutes = random.randint(0, 59)
+        lead_hours = rng.randint(1, 24)
+        lead_minutes = rng.randint(0, 59)
         lead_tm = f"{lead_hours:03d}{lead_minutes:02d}"
         
         # 예측생산구분 (2자리 코드)
-        fcst_prod_cd = f"{random.randint(1, 99):02d}"
+        fcst_prod_cd = f"{rng.randint(1, 99):02d}"
         
-        # 시간대별로 다른 기본 수요량 설정 (24시간 운영)
-        if 0 <= hour <= 5:  # 새벽
-            base_demand = random.uniform(30000, 45000)
-        elif 6 <= hour <= 9:  # 오전 피크
-            base_demand = random.uniform(60000, 80000)
-        elif 10 <= hour <= 16:  # 주간
-            base_demand = random.uniform(50000, 70000)
-        elif 17 <= hour <= 20:  # 오후 피크
-            base_demand = random.uniform(65000, 85000)
-        elif 21 <= hour <= 23:  # 저녁
-            base_demand = random.uniform(40000, 60000)
-        else:  # 기타 시간
-            base_demand = random.uniform(35000, 55000)
+        # 시간대별로 다른 기본 수요량 설정 (24시간 운영 - 새벽/오전 피크/주간/오후 피크/저녁)
+        base_demand = rng.uniform(*profile_bounds(profiles, 'DEMAND', hour))
         
         # 개별 예측량들 (약간의 변동성 추가)
-        fcst_qg01 = round(base_demand * random.uniform(0.95, 1.05), 6)
-        fcst_qg02 = round(base_demand * random.uniform(0.94, 1.06), 6)
-        fcst_qg03 = round(base_demand * random.uniform(0.93, 1.07), 6)
-        fcst_qg04 = round(base_demand * random.uniform(0.92, 1.08), 6)
-        fcst_qg05 = round(base_demand * random.uniform(0.91, 1.09), 6)
-        fcst_qg06 = round(base_demand * random.uniform(0.90, 1.10), 6)
+        fcst_qg01 = round(base_demand * lfd_rng.uniform(0.95, 1.05), 6)
+        fcst_qg02 = round(base_demand * lfd_rng.uniform(0.94, 1.06), 6)
+        fcst_qg03 = round(base_demand * lfd_rng.uniform(0.93, 1.07), 6)
+        fcst_qg04 = round(base_demand * lfd_rng.uniform(0.92, 1.08), 6)
+        fcst_qg05 = round(base_demand * lfd_rng.uniform(0.91, 1.09), 6)
+        fcst_qg06 = round(base_demand * lfd_rng.uniform(0.90, 1.10), 6)
         
         # 최종 수요예측량 (개별 예측량들의 평균)
         fcst_qgen = round((fcst_qg01 + fcst_qg02 + fcst_qg03 + fcst_qg04 + fcst_qg05 + fcst_qg06) / 6, 6)
@@ -613,7 +2557,7 @@ def generate_random_test_cases(num_cases=10, next_day=False, only_tables=None):
         upd_date = crtn_time.strftime("%Y-%m-%d %H:%M:%S")
         
         # REP_DATA_RE_FCST_LFD_DA용 데이터 (only_tables가 지정되지 않았을 때만 생성)
-        if not only_tables or 'LFD' in [t.upper() for t in only_tables]:
+        if not selected or 'LFD' in selected:
             test_case_lfd = {
                 'CRTN_TM': crtn_tm,
                 'FCST_TM': fcst_tm,
@@ -637,18 +2581,19 @@ def generate_random_test_cases(num_cases=10, next_day=False, only_tables=None):
         # REP_DATA_RE_FCST_GEN_DA용 데이터 (각 연료 타입별로 - only_tables가 지정되지 않았을 때만 생성)
         renewable_totals = {'SOLAR': 0, 'WIND': 0, 'HYDRO': 0, 'BIOMASS': 0, 'GEOTHERMAL': 0}
         
-        if not only_tables or 'GEN' in [t.upper() for t in only_tables]:
+        # KPX의 신재생 합계도 GEN 값을 쓰므로 KPX만 생성할 때도 GEN 스트림에서 같은 값을 뽑음
+        if not selected or {'GEN', 'KPX'} & selected:
             for fuel_type in fuel_types:
                 # 신재생 발전량은 일반 수요량보다 작음
-                renewable_base = base_demand * random.uniform(0.1, 0.3)  # 10-30% 수준
+                renewable_base = base_demand * gen_rng.uniform(0.1, 0.3)  # 10-30% 수준
                 
                 # 신재생 발전량들
-                renewable_qg01 = round(renewable_base * random.uniform(0.95, 1.05), 6)
-                renewable_qg02 = round(renewable_base * random.uniform(0.94, 1.06), 6)
-                renewable_qg03 = round(renewable_base * random.uniform(0.93, 1.07), 6)
-                renewable_qg04 = round(renewable_base * random.uniform(0.92, 1.08), 6)
-                renewable_qg05 = round(renewable_base * random.uniform(0.91, 1.09), 6)
-                renewable_qg06 = round(renewable_base * random.uniform(0.90, 1.10), 6)
+                renewable_qg01 = round(renewable_base * gen_rng.uniform(0.95, 1.05), 6)
+                renewable_qg02 = round(renewable_base * gen_rng.uniform(0.94, 1.06), 6)
+                renewable_qg03 = round(renewable_base * gen_rng.uniform(0.93, 1.07), 6)
+                renewable_qg04 = round(renewable_base * gen_rng.uniform(0.92, 1.08), 6)
+                renewable_qg05 = round(renewable_base * gen_rng.uniform(0.91, 1.09), 6)
+                renewable_qg06 = round(renewable_base * gen_rng.uniform(0.90, 1.10), 6)
                 
                 # 최종 신재생 발전량
                 renewable_qgen = round((renewable_qg01 + renewable_qg02 + renewable_qg03 + renewable_qg04 + renewable_qg05 + renewable_qg06) / 6, 6)
@@ -659,16 +2604,16 @@ def generate_random_test_cases(num_cases=10, next_day=False, only_tables=None):
                 renewable_qgmn = round(min(renewable_all_values), 6)
                 
                 # ESS 관련 데이터
-                fcst_capa = round(renewable_base * random.uniform(0.8, 1.2), 6)  # 설비용량
-                ess_chrg = round(renewable_base * random.uniform(0.05, 0.15), 6)  # ESS 충전
-                ess_disc = round(renewable_base * random.uniform(0.05, 0.15), 6)  # ESS 방전
-                ess_capa = round(renewable_base * random.uniform(0.1, 0.3), 6)    # ESS 용량
+                fcst_capa = round(renewable_base * gen_rng.uniform(0.8, 1.2), 6)  # 설비용량
+                ess_chrg = round(renewable_base * gen_rng.uniform(0.05, 0.15), 6)  # ESS 충전
+                ess_disc = round(renewable_base * gen_rng.uniform(0.05, 0.15), 6)  # ESS 방전
+                ess_capa = round(renewable_base * gen_rng.uniform(0.1, 0.3), 6)    # ESS 용량
                 
                 # 합계 계산용
                 renewable_totals[fuel_type] = renewable_qgen
                 
                 test_case_gen = {
-                    'PWR_EXC_TP_CD': f"{random.randint(1, 99):02d}",
+                    'PWR_EXC_TP_CD': f"{gen_rng.randint(1, 99):02d}",
                     'FUEL_TP_CD': fuel_type,
                     'CRTN_TM': crtn_tm,
                     'FCST_TM': fcst_tm,
@@ -691,490 +2636,1645 @@ def generate_random_test_cases(num_cases=10, next_day=False, only_tables=None):
                     'UPD_DATE': upd_date
                 }
                 
-                test_cases_gen.append(test_case_gen)
+                if not selected or 'GEN' in selected:
+                    test_cases_gen.append(test_case_gen)
         
-        # REP_DATA_HG_FCST_NWP_DA용 데이터 (시간당 하나씩만 생성)
-        if not only_tables or 'NWP' in [t.upper() for t in only_tables]:
-            # 기상 예측 데이터 생성
-            # 일사량 (W/m²) - 시간대별로 다른 값
-            if 0 <= hour <= 5:  # 새벽
-                fcst_srad = round(random.uniform(0, 50), 6)  # 0-50 W/m²
-            elif 6 <= hour <= 9:  # 오전
-                fcst_srad = round(random.uniform(200, 600), 6)  # 200-600 W/m²
-            elif 10 <= hour <= 16:  # 주간
-                fcst_srad = round(random.uniform(600, 1000), 6)  # 600-1000 W/m²
-            elif 17 <= hour <= 20:  # 오후
-                fcst_srad = round(random.uniform(300, 700), 6)  # 300-700 W/m²
-            elif 21 <= hour <= 23:  # 저녁
-                fcst_srad = round(random.uniform(0, 200), 6)  # 0-200 W/m²
-            else:  # 기타 시간
-                fcst_srad = round(random.uniform(0, 100), 6)  # 0-100 W/m²
-            
-            # 기온 (°C) - 시간대별로 다른 값
-            if 0 <= hour <= 5:  # 새벽
-                fcst_temp = round(random.uniform(10, 18), 6)
-            elif 6 <= hour <= 9:  # 오전
-                fcst_temp = round(random.uniform(15, 25), 6)
-            elif 10 <= hour <= 16:  # 주간
-                fcst_temp = round(random.uniform(20, 30), 6)
-            elif 17 <= hour <= 20:  # 오후
-                fcst_temp = round(random.uniform(18, 28), 6)
-            elif 21 <= hour <= 23:  # 저녁
-                fcst_temp = round(random.uniform(15, 22), 6)
-            else:  # 기타 시간
-                fcst_temp = round(random.uniform(12, 20), 6)
-            
-            # 습도 (%) - 시간대별로 다른 값
-            if 0 <= hour <= 5:  # 새벽
-                fcst_humi = round(random.uniform(70, 90), 6)
-            elif 6 <= hour <= 9:  # 오전
-                fcst_humi = round(random.uniform(60, 80), 6)
-            elif 10 <= hour <= 16:  # 주간
-                fcst_humi = round(random.uniform(40, 60), 6)
-            elif 17 <= hour <= 20:  # 오후
-                fcst_humi = round(random.uniform(50, 70), 6)
-            elif 21 <= hour <= 23:  # 저녁
-                fcst_humi = round(random.uniform(60, 80), 6)
-            else:  # 기타 시간
-                fcst_humi = round(random.uniform(65, 85), 6)
-            
-            # 풍속 (m/s) - 시간대별로 다른 값
-            if 0 <= hour <= 5:  # 새벽
-                fcst_wspd = round(random.uniform(1, 3), 6)
-            elif 6 <= hour <= 9:  # 오전
-                fcst_wspd = round(random.uniform(2, 5), 6)
-            elif 10 <= hour <= 16:  # 주간
-                fcst_wspd = round(random.uniform(3, 7), 6)
-            elif 17 <= hour <= 20:  # 오후
-                fcst_wspd = round(random.uniform(2, 6), 6)
-            elif 21 <= hour <= 23:  # 저녁
-                fcst_wspd = round(random.uniform(1, 4), 6)
-            else:  # 기타 시간
-                fcst_wspd = round(random.uniform(1, 3), 6)
+        # 기준일시 (YYYYMMDDHHMI 형식, KPX/HG_MEAS 공용)
+        tm = crtn_time.strftime("%Y%m%d%H%M")
+        
+        # REP_DATA_RE_KPX_JEJU_SUKUB_M용 데이터 (제주 계통 운영 정보)
+        if not selected or 'KPX' in selected:
+            # 공급능력 (MW) - 현재 수요보다 약간 높게
+            supp_ability = round(base_demand * kpx_rng.uniform(1.1, 1.3), 5)
+        
+            # 현재수요 (MW) - 기존 수요예측량과 유사
+            curr_pwr_tot = round(base_demand * kpx_rng.uniform(0.95, 1.05), 5)
+        
+            # 신재생합계 (MW) - 모든 신재생 발전량의 합
+            renew_pwr_tot = round(sum(renewable_totals.values()), 5)
+        
+            # 태양광합계 (MW) - SOLAR 발전량
+            renew_pwr_solar = round(renewable_totals['SOLAR'], 5)
+        
+            # 풍력합계 (MW) - WIND 발전량
+            renew_pwr_wind = round(renewable_totals['WIND'], 5)
+        
+            test_case_kpx = {
+                'TM': tm,
+                'SUPP_ABILITY': supp_ability,
+                'CURR_PWR_TOT': curr_pwr_tot,
+                'RENEW_PWR_TOT': renew_pwr_tot,
+                'RENEW_PWR_SOLAR': renew_pwr_solar,
+                'RENEW_PWR_WIND': renew_pwr_wind,
+                'REG_DATE': reg_date,
+                'UPD_DATE': upd_date
+            }
+        
+            test_cases_kpx.append(test_case_kpx)
+
+        # REP_DATA_HG_FCST_GEN_GENT_DA용 데이터 (수소발전단지 수소 예측 생산량)
+        if not selected or 'HG_GEN' in selected:
+            hg_qgen_bounds = profile_bounds(profiles, 'HG_GEN_QGEN', hour)
+            hg_capa_bounds = profile_bounds(profiles, 'HG_GEN_CAPA', hour)
+            for area_group in area_groups:
+                for fuel_type in ['HYDROGEN']:  # 수소 발전만
+                    # 수소 생산량 (MWh) - 시간대별로 다른 값 (주간에 생산 활발)
+                    fcst_qgen = round(hg_gen_rng.uniform(*hg_qgen_bounds), 6)
+                    fcst_capa = round(hg_gen_rng.uniform(*hg_capa_bounds), 6)
+                    
+                    test_case_hg_gen = {
+                        'AREA_GRP_CD': area_group,
+                        'AREA_GRP_ID': f"{area_group}_H2_{hg_gen_rng.randint(1, 999):03d}",
+                        'CRTN_TM': crtn_tm,
+                        'FCST_TM': fcst_tm,
+                        'LEAD_TM': lead_tm,
+                        'FCST_PROD_CD': fcst_prod_cd,
+                        'FCST_QGEN': fcst_qgen,
+                        'FCST_CAPA': fcst_capa,
+                        'REG_DATE': reg_date,
+                        'UPD_DATE': upd_date
+                    }
+                    test_cases_hg_gen.append(test_case_hg_gen)
+        
+        # REP_DATA_HG_MEAS_GEM_GENT_DA용 데이터 (수소발전단지 수소 생산량 정보)
+        if not selected or 'HG_MEAS' in selected:
+            hg_prod_bounds = profile_bounds(profiles, 'HG_MEAS_PROD', hour)
+            hg_meas_capa_bounds = profile_bounds(profiles, 'HG_MEAS_CAPA', hour)
+            for area_group in area_groups:
+                # 수소 생산량 (KG) - 시간대별로 다른 값 (주간에 생산 활발)
+                hgen_prod = round(hg_meas_rng.uniform(*hg_prod_bounds), 5)
+                hgen_capa = round(hg_meas_rng.uniform(*hg_meas_capa_bounds), 5)
+                
+                test_case_hg_meas = {
+                    'TM': tm,
+                    'AREA_GRP_CD': area_group,
+                    'AREA_GRP_ID': f"{area_group}_H2_{hg_meas_rng.randint(1, 999):03d}",
+                    'HGEN_PROD': hgen_prod,
+                    'HGEN_CAPA': hgen_capa,
+                    'REG_DATE': reg_date,
+                    'UPD_DATE': upd_date
+                }
+                test_cases_hg_meas.append(test_case_hg_meas)
+    
+    # REP_DATA_HG_FCST_NWP_DA용 데이터 (발표 시각 × 예측 시각 × 지점, 하루 한 번 생성)
+    if not selected or 'NWP' in selected:
+        site_ids, site_groups, site_psfc, site_temp = nwp_sites(get_nwp_site_count())
+        nwp_slots = _nwp_forecast_slots(today)
+        temp_z = _nwp_correlated_normal_python(nwp_rng, nwp_slots, site_groups)
+        humi_z = _nwp_correlated_normal_python(nwp_rng, nwp_slots, site_groups)
+        srad_z = _nwp_correlated_normal_python(nwp_rng, nwp_slots, site_groups)
+        wspd_z = _nwp_correlated_normal_python(nwp_rng, nwp_slots, site_groups)
+        wsl2_z = _nwp_correlated_normal_python(nwp_rng, nwp_slots, site_groups)
+        wdir_z = _nwp_correlated_normal_python(nwp_rng, nwp_slots, site_groups)
+        psfc_z = _nwp_correlated_normal_python(nwp_rng, nwp_slots, site_groups)
+        # 주 풍향은 예측 시각을 따라 조금씩 돌고, 지점별로는 공간 상관이 있는 편차를 더함
+        prevailing = [nwp_rng.uniform(0, 360)]
+        for _ in range(max(step for _, _, step in nwp_slots)):
+            prevailing.append(prevailing[-1] + nwp_rng.gauss(0, NWP_WDIR_STEP))
+        humi_own = (1 - NWP_HUMI_TEMP_CORR ** 2) ** 0.5
+        reg_dates_by_issue = {}
+        for slot_index, (crtn_time_nwp, fcst_time_nwp, step) in enumerate(nwp_slots):
+            if crtn_time_nwp not in reg_dates_by_issue:
+                reg_dates_by_issue[crtn_time_nwp] = _nwp_reg_dates(crtn_time_nwp, len(site_ids))
+            crtn_tm_nwp = crtn_time_nwp.strftime("%Y%m%d%H%M")
+            fcst_tm_nwp = fcst_time_nwp.strftime("%Y%m%d%H%M")
+            lead_tm_nwp = _lead_tm(crtn_time_nwp, fcst_time_nwp)
+            srad_bounds, temp_bounds, humi_bounds, wspd_bounds = (profile_bounds(profiles, name, fcst_time_nwp.hour) for name in ('SRAD', 'TEMP', 'HUMI', 'WSPD'))
+            for site_index, site_id in enumerate(site_ids):
+                fcst_wspd = _nwp_scale(wspd_z[slot_index][site_index], *wspd_bounds) # 지상 풍속 (m/s)
+                fcst_wdir = prevailing[step] + NWP_WDIR_SPREAD * wdir_z[slot_index][site_index] # 풍향 (도)
+                reg_date_nwp = reg_dates_by_issue[crtn_time_nwp][site_index]
+                test_cases_nwp.append({
+                    'PWR_EXC_TP_CD': NWP_PWR_EXC_TP_CD,
+                    'AREA_GRP_CD': NWP_AREA_GRP_CD,
+                    'AREA_GRP_ID': site_id,
+                    'CRTN_TM': crtn_tm_nwp,
+                    'FCST_TM': fcst_tm_nwp,
+                    'LEAD_TM': lead_tm_nwp,
+                    'FCST_PROD_CD': NWP_FCST_PROD_CD,
+                    'FCST_SRAD': round(_nwp_scale(srad_z[slot_index][site_index], *srad_bounds), 2),
+                    'FCST_TEMP': round(_nwp_scale(temp_z[slot_index][site_index], *temp_bounds) + site_temp[site_index], 2),
+                    'FCST_HUMI': round(_nwp_scale(NWP_HUMI_TEMP_CORR * temp_z[slot_index][site_index] + humi_own * humi_z[slot_index][site_index], *humi_bounds), 2),
+                    'FCST_WSPD': round(fcst_wspd, 2),
+                    'FCST_WDIR': round(fcst_wdir % 360, 2) % 360,
+                    'FCST_WSL2': round(fcst_wspd * _nwp_scale(wsl2_z[slot_index][site_index], *NWP_WSL2_RATIO), 2),
+                    'FCST_WDL2': round((fcst_wdir + nwp_rng.gauss(*NWP_WDL2_VEER)) % 360, 2) % 360,
+                    'FCST_PSFC': round(site_psfc[site_index] + NWP_PSFC_SPREAD * max(-1.0, min(1.0, psfc_z[slot_index][site_index] / 2)), 2),
+                    'REG_DATE': reg_date_nwp,
+                    'UPD_DATE': reg_date_nwp
+                })
+    
+    # REP_DATA_P2H_FCST_CURT_DA용 데이터 (발표 시각별 예측 구간, 하루 한 번 생성)
+    if not selected or 'CURT' in selected:
+        curt_issue_times, curt_fcst_times = _curt_forecast_times(today)
+        for crtn_time_curt in curt_issue_times:
+            reg_date_curt = _curt_reg_date(crtn_time_curt)
+            for fcst_time_curt in curt_fcst_times:
+                fcst_hour = fcst_time_curt.hour
+                fcst_minpw = float(round(curt_rng.uniform(*profile_bounds(profiles, 'CURT_MINPW', fcst_hour)) / 50) * 50) # 예측 최소 수요 (50MW 단위)
+                if CURT_EVENT_HOURS[0] <= fcst_hour <= CURT_EVENT_HOURS[1] and curt_rng.random() < CURT_EVENT_PROBABILITY:
+                    fcst_curt = round(curt_rng.uniform(*CURT_EVENT_RANGE), 2) # 태양광 과잉 시간대의 큰 출력제어
+                else:
+                    fcst_curt = round(curt_rng.uniform(*profile_bounds(profiles, 'CURT', fcst_hour)), 2) # 예측 출력제어량
+                
+                test_case_curt = {
+                    'CRTN_TM': crtn_time_curt.strftime("%Y%m%d%H%M"),
+                    'FCST_TM': fcst_time_curt.strftime("%Y%m%d%H%M"),
+                    'LEAD_TM': _lead_tm(crtn_time_curt, fcst_time_curt),
+                    'FCST_MINPW': fcst_minpw,
+                    'FCST_CURT': fcst_curt,
+                    'REG_DATE': reg_date_curt,
+                    'UPD_DATE': reg_date_curt
+                }
+                test_cases_curt.append(test_case_curt)
+    
+    test_cases = (test_cases_lfd, test_cases_gen, test_cases_nwp, test_cases_kpx, test_cases_curt, test_cases_hg_gen, test_cases_hg_meas)
+    _record_generate_metrics(test_cases, time.perf_counter() - started)
+    return test_cases
+
+def print_test_cases(test_cases_lfd, test_cases_gen, test_cases_nwp, test_cases_kpx, test_cases_curt, test_cases_hg_gen, test_cases_hg_meas):
+    """
+    테스트케이스를 보기 좋게 출력 (제목, 단위, 소수 자릿수는 TABLE_SPECS 기준)
+    """
+    all_cases = (test_cases_lfd, test_cases_gen, test_cases_nwp, test_cases_kpx, test_cases_curt, test_cases_hg_gen, test_cases_hg_meas)
+    for index, (spec, cases) in enumerate(zip(TABLE_SPECS.values(), all_cases)):
+        print(("\n" if index else "") + "=" * 120)
+        print(f"{spec.title} 테스트케이스 ({spec.name})")
+        print("=" * 120)
+        
+        for i, case in enumerate(as_table_data(spec.name, cases), 1):
+            print(f"\n[{spec.label} 테스트케이스 {i}]")
+            print("-" * 80)
             
-            # 기압 (hPa) - 상대적으로 안정적
-            fcst_psfc = round(random.uniform(1010, 1020), 6)
+            for key, value in case.items():
+                print(spec.format_field(key, value))
+
+def generate_sql_insert_statements(test_cases_lfd, test_cases_gen, test_cases_nwp, test_cases_kpx, test_cases_curt, test_cases_hg_gen, test_cases_hg_meas):
+    """
+    SQL INSERT 문 생성 (컬럼 순서와 값 형식은 TABLE_SPECS 기준)
+    """
+    all_cases = (test_cases_lfd, test_cases_gen, test_cases_nwp, test_cases_kpx, test_cases_curt, test_cases_hg_gen, test_cases_hg_meas)
+    for spec, cases in zip(TABLE_SPECS.values(), all_cases):
+        print("\n" + "=" * 120)
+        print(f"SQL INSERT 문 ({spec.name})")
+        print("=" * 120)
+        
+        cases = as_table_data(spec.name, cases)
+        for i, values in enumerate(cases.rows(spec.insert_columns), 1):
+            print(f"\n-- {spec.label} 테스트케이스 {i}")
+            print(f"INSERT INTO {spec.name} (")
+            print(f"    {spec.column_list}")
+            print(") VALUES (")
+            print(f"    {', '.join(spec.sql_literals(values))}")
+            print(");")
+
+# 파일 내보내기 형식별 확장자
+#   csv     - rep_data_* 덤프와 같은 CSV (문자열은 따옴표, 숫자는 고정 소수점, NULL은 빈 값)
+#   sql     - 여러 행을 묶은 INSERT 문
+#   copy    - psql로 실행하는 COPY ... FROM stdin 스크립트
+#   parquet - Parquet 파일 (pyarrow 필요)
+EXPORT_FORMATS = {'csv': '.csv', 'sql': '.sql', 'copy': '.sql', 'parquet': '.parquet'}
+
+# 형식별 NULL 표기
+EXPORT_NULLS = {'csv': '', 'sql': 'NULL', 'copy': '\\N'}
+
+def _export_timestamp(value):
+    """
+    TIMESTAMP 값을 덤프 형식('2025-08-01 02:51:09.000')의 문자열로 변환
+    """
+    if isinstance(value, datetime.datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S.') + f"{value.microsecond // 1000:03d}"
+    text = str(value)
+    return text + '.000' if len(text) == 19 else text
+
+def _export_column_text(values, column_type, scale, fmt):
+    """
+    컬럼 값 배열 하나를 fmt('csv', 'sql', 'copy') 형식의 텍스트 목록으로 변환
+    (행 단위가 아니라 컬럼 단위로 변환해서 타입 분기를 컬럼마다 한 번만 수행)
+    """
+    null = EXPORT_NULLS[fmt]
+    if column_type == 'DECIMAL':
+        spec = f".{scale}f"
+        return [null if v != v else format(v, spec) for v in values]
+    if column_type == 'TIMESTAMP':
+        texts = [null if v is None else _export_timestamp(v) for v in values]
+        if fmt == 'sql':
+            return [text if text == null else f"'{text}'" for text in texts]
+        return texts
+    if fmt == 'csv':
+        return [null if v is None else '"' + str(v).replace('"', '""') + '"' for v in values]
+    if fmt == 'sql':
+        return [null if v is None else "'" + str(v).replace("'", "''") + "'" for v in values]
+    return [null if v is None else _format_copy_value(str(v)) for v in values]
+
+class TableExportWriter:
+    """
+    테이블 하나를 파일로 스트리밍 기록하는 writer
+    
+    write()에 넘긴 TableData를 chunk_size행씩 나누어 파일 뒤에 이어 쓰므로
+    여러 날짜를 차례로 넘겨도 메모리에는 하루치 데이터만 남습니다.
+    컬럼 순서는 TABLE_INSERT_COLUMNS, 소수 자릿수는 DDL의 DECIMAL(p,s)를 따릅니다.
+    
+    사용 예:
+        with TableExportWriter('REP_DATA_RE_FCST_LFD_DA', 'lfd.csv') as writer:
+            writer.write(test_cases_lfd)
+    """
+    
+    def __init__(self, table_name, path, fmt='csv', chunk_size=None, rows_per_statement=1000):
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"지원하지 않는 내보내기 형식입니다: {fmt} (가능한 값: {', '.join(EXPORT_FORMATS)})")
+        if fmt == 'parquet' and pa is None:
+            raise RuntimeError("Parquet로 내보내려면 pyarrow가 설치되어 있어야 합니다. (pip install pyarrow)")
+        self.table_name = table_name
+        self.path = path
+        self.fmt = fmt
+        self.chunk_size = chunk_size or get_batch_size()
+        self.rows_per_statement = rows_per_statement
+        self.columns = TABLE_INSERT_COLUMNS[table_name]
+        column_types = dict(TABLE_COLUMN_TYPES[table_name])
+        self.column_types = [column_types.get(column, 'VARCHAR') for column in self.columns]
+        decimal_scales = TABLE_DECIMAL_SCALES[table_name]
+        self.scales = [decimal_scales.get(column, (0, 0))[1] for column in self.columns]
+        self.rows = 0
+        self._file = None
+        self._parquet_writer = None
+        
+        if fmt == 'parquet':
+            self._schema = pa.schema([
+                (column, pa.float64() if column_type == 'DECIMAL' else pa.timestamp('ms') if column_type == 'TIMESTAMP' else pa.string())
+                for column, column_type in zip(self.columns, self.column_types)
+            ])
+            self._parquet_writer = pq.ParquetWriter(path, self._schema)
+            return
+        
+        self._file = open(path, 'w', encoding='utf-8', newline='')
+        if fmt == 'csv':
+            self._file.write(','.join(f'"{column}"' for column in self.columns) + '\n')
+        elif fmt == 'copy':
+            self._file.write(f"COPY {table_name} ({', '.join(self.columns)}) FROM stdin;\n")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def write(self, cases):
+        """
+        TableData를 chunk_size행씩 파일에 이어 씀
+        """
+        with METRICS.stage('export', TABLE_LABELS[self.table_name]) as observation:
+            for start in range(0, len(cases), self.chunk_size):
+                stop = min(start + self.chunk_size, len(cases))
+                if self._parquet_writer is not None:
+                    self._write_parquet_chunk(cases, start, stop)
+                else:
+                    self._write_text_chunk(cases, start, stop)
+            self.rows += len(cases)
+            observation['rows'] = len(cases)
+    
+    def _write_text_chunk(self, cases, start, stop):
+        column_texts = [
+            _export_column_text(cases.column(column)[start:stop], column_type, scale, self.fmt)
+            for column, column_type, scale in zip(self.columns, self.column_types, self.scales)
+        ]
+        rows = zip(*column_texts)
+        if self.fmt == 'csv':
+            self._file.write(''.join(','.join(row) + '\n' for row in rows))
+        elif self.fmt == 'copy':
+            self._file.write(''.join('\t'.join(row) + '\n' for row in rows))
+        else:
+            header = f"INSERT INTO {self.table_name} ({', '.join(self.columns)}) VALUES\n"
+            while True:
+                statement_rows = list(itertools.islice(rows, self.rows_per_statement))
+                if not statement_rows:
+                    break
+                self._file.write(header + ',\n'.join('(' + ', '.join(row) + ')' for row in statement_rows) + ';\n')
+    
+    def _write_parquet_chunk(self, cases, start, stop):
+        arrays = []
+        for column, column_type in zip(self.columns, self.column_types):
+            values = cases.column(column)[start:stop]
+            if column_type == 'DECIMAL':
+                arrays.append(pa.array(values.tolist(), type=pa.float64(), from_pandas=True))
+            elif column_type == 'TIMESTAMP':
+                arrays.append(pc.strptime(pa.array([None if v is None else str(v) for v in values], type=pa.string()), format='%Y-%m-%d %H:%M:%S', unit='ms'))
+            else:
+                arrays.append(pa.array([None if v is None else str(v) for v in values], type=pa.string()))
+        self._parquet_writer.write_table(pa.Table.from_arrays(arrays, schema=self._schema))
+    
+    def close(self):
+        """
+        파일을 닫음 (COPY 스크립트는 종료 표시 '\\.'를 추가)
+        """
+        if self._file is not None:
+            if self.fmt == 'copy':
+                self._file.write('\\.\n')
+            self._file.close()
+            self._file = None
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+def get_pipeline_buffer_days():
+    """
+    생성-적재 파이프라인의 버퍼 크기 (일수) - PIPELINE_BUFFER_DAYS 환경변수로 조정 (기본값: 2)
+    생성 스레드는 버퍼가 차면 적재가 따라올 때까지 기다리므로 기간이 길어도 메모리에는 몇 일치 데이터만 남습니다.
+    """
+    return max(1, int(os.getenv('PIPELINE_BUFFER_DAYS', '2')))
+
+def iter_generated_days(days, only_tables=None, engine='python', seed=None):
+    """
+    날짜마다 일곱 테이블 데이터를 생성하여 (날짜, 테이블 데이터 목록)을 하나씩 내보내는 지연 생성기
+    다음 날짜는 앞 날짜를 꺼내간 뒤에 생성하므로 한 번에 하루치만 메모리에 있습니다.
+    """
+    for day in days:
+        yield day, generate_random_test_cases(only_tables=only_tables, engine=engine, target_date=day, seed=seed)
+
+def pipelined(items, buffer_size=None):
+    """
+    items를 별도 생성 스레드에서 미리 꺼내 크기가 제한된 큐(버퍼)로 넘겨주는 생성기
+    
+    소비하는 쪽(적재/파일 기록)이 앞 항목을 처리하는 동안 다음 항목을 생성하므로 DB는 생성이 끝나기 전에 행을 받기 시작하고,
+    버퍼가 차면 생성 스레드가 기다리므로 메모리에는 최대 (버퍼 + 2)개 항목만 남습니다.
+    생성 중 발생한 예외는 소비하는 쪽에서 다시 발생하고, 소비를 중간에 멈추면 생성 스레드도 멈춥니다.
+    
+    Args:
+        items (iterable): 생성할 항목 (예: iter_generated_days)
+        buffer_size (int): 버퍼 크기 (None이면 PIPELINE_BUFFER_DAYS 환경변수)
+    """
+    buffer = queue.Queue(maxsize=buffer_size or get_pipeline_buffer_days())
+    stop = threading.Event()
+    finished = object()
+    
+    def put(entry):
+        # 소비하는 쪽이 멈췄으면 버퍼가 비지 않으므로 stop을 확인하며 기다림
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce():
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+        except Exception as e:
+            put((finished, e))
+            return
+        put((finished, None))
+    
+    producer = threading.Thread(target=produce, name='generate-pipeline', daemon=True)
+    producer.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is finished:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+def run_export(output_dir, fmt='csv', start_date=None, end_date=None, only_tables=None, engine='python', seed=None, chunk_size=None):
+    """
+    파일 내보내기 모드
+    start_date부터 end_date까지(양 끝 포함) 하루씩 생성하여 테이블마다 파일 하나에 이어 씁니다.
+    파일명은 덤프와 같이 '<테이블명 소문자>_<내보낸 시각 YYYYMMDDHHMI><확장자>'입니다.
+    
+    날짜마다 (seed, 날짜, 테이블)로 정해지는 난수 스트림을 사용하므로 같은 seed로 다시 내보내면 같은 파일이 만들어집니다.
+    
+    Args:
+        output_dir (str): 출력 디렉터리 (없으면 생성)
+        fmt (str): 내보내기 형식 ('csv', 'sql', 'copy', 'parquet')
+        start_date (date): 시작일 (None이면 오늘)
+        end_date (date): 종료일 (포함, None이면 start_date)
+        only_tables (list): None이면 모든 테이블, 리스트가 있으면 해당 테이블만 내보냄
+        engine (str): 생성 엔진 ('python', 'numpy')
+        seed (int): 기준 난수 시드 (None이면 현재 시각으로 정하고 출력)
+        chunk_size (int): 한 번에 기록할 행 수 (None이면 DB_BATCH_SIZE)
+    
+    Returns:
+        dict: 테이블명별 (파일 경로, 행 수)
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"지원하지 않는 내보내기 형식입니다: {fmt} (가능한 값: {', '.join(EXPORT_FORMATS)})")
+    if fmt == 'parquet' and pa is None:
+        raise RuntimeError("Parquet로 내보내려면 pyarrow가 설치되어 있어야 합니다. (pip install pyarrow)")
+    start_date = start_date or datetime.date.today()
+    end_date = end_date or start_date
+    if end_date < start_date:
+        print(f"❌ 종료일({end_date:%Y%m%d})이 시작일({start_date:%Y%m%d})보다 앞섭니다.")
+        return {}
+    if seed is None:
+        seed = new_seed()
+    
+    os.makedirs(output_dir, exist_ok=True)
+    stamp = datetime.datetime.now().strftime('%Y%m%d%H%M')
+    day_count = (end_date - start_date).days + 1
+    
+    print(f"\n{'='*60}")
+    print(f"파일 내보내기 시작: {start_date:%Y%m%d} ~ {end_date:%Y%m%d} ({day_count}일) → {output_dir} ({fmt})")
+    print(f"생성 엔진: {engine}, 시드: {seed}")
+    print(f"{'='*60}")
+    
+    started = time.perf_counter()
+    writers = {}
+    days = [start_date + datetime.timedelta(days=offset) for offset in range(day_count)]
+    try:
+        # 다음 날짜는 생성 스레드가 미리 생성하고, 이 스레드는 앞 날짜를 파일에 기록
+        for day, test_cases in pipelined(iter_generated_days(days, only_tables, engine, seed)):
+            for cases in test_cases:
+                if not len(cases):
+                    continue
+                writer = writers.get(cases.table_name)
+                if writer is None:
+                    path = os.path.join(output_dir, f"{cases.table_name.lower()}_{stamp}{EXPORT_FORMATS[fmt]}")
+                    writer = writers[cases.table_name] = TableExportWriter(cases.table_name, path, fmt=fmt, chunk_size=chunk_size)
+                writer.write(cases)
+    finally:
+        for writer in writers.values():
+            writer.close()
+    
+    elapsed = time.perf_counter() - started
+    total_rows = sum(writer.rows for writer in writers.values())
+    for writer in writers.values():
+        print(f"✅ {writer.table_name}: {writer.rows:,}행 → {writer.path}")
+    print(f"\n총 {total_rows:,}행, {elapsed:.1f}초 ({total_rows / max(elapsed, 1e-9):,.0f} rows/s)")
+    write_metrics_file()
+    return {table_name: (writer.path, writer.rows) for table_name, writer in writers.items()}
+
+def run_daily_simulation(next_day=False, only_tables=None, loader='copy', engine='python', target_date=None, seed=None):
+    """
+    일일 시뮬레이션 실행 함수
+    
+    Args:
+        next_day (bool): True이면 다음날 데이터 생성, False이면 오늘 데이터 생성
+        only_tables (list): None이면 모든 테이블 생성, 리스트가 있으면 해당 테이블만 생성
+                           가능한 값: TABLE_SPECS의 테이블 라벨 ['LFD', 'GEN', 'NWP', 'KPX', 'CURT', 'HG_GEN', 'HG_MEAS']
+        loader (str): 적재 방식 ('copy', 'executemany', 'row')
+        engine (str): 생성 엔진 ('python', 'numpy')
+        target_date (date): 생성할 날짜 (지정하면 next_day는 무시, 스케줄러에서 사용)
+        seed (int): 기준 난수 시드 (None이면 현재 시각으로 정하고 출력 - 출력된 시드로 같은 데이터를 재현할 수 있음)
+    
+    Returns:
+        bool: 데이터베이스 적재 성공 여부
+    """
+    if target_date is not None:
+        date_label = target_date.strftime("%Y-%m-%d")
+    else:
+        date_label = "다음날" if next_day else "오늘"
+    table_label = ""
+    if only_tables:
+        table_label = f" - 선택된 테이블: {', '.join(only_tables)}"
+    
+    print(f"\n{'='*60}")
+    print(f"일일 에너지 데이터 시뮬레이션 시작 ({date_label}){table_label} - {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"{'='*60}")
+    
+    # 랜덤 시드 설정 (재현 가능한 결과를 위해 - 같은 시드와 날짜는 같은 데이터를 생성)
+    if seed is None:
+        seed = new_seed()
+    print(f"생성 엔진: {engine}, 시드: {seed}")
+    
+    # 00시부터 23시까지의 데이터 생성 (24시간 운영, 24개 시간대)
+    test_cases_lfd, test_cases_gen, test_cases_nwp, test_cases_kpx, test_cases_curt, test_cases_hg_gen, test_cases_hg_meas = generate_random_test_cases(next_day=next_day, only_tables=only_tables, engine=engine, target_date=target_date, seed=seed)
+    
+    # 결과 출력 (주석처리)
+    # print_test_cases(test_cases_lfd, test_cases_gen, test_cases_nwp, test_cases_kpx, test_cases_curt, test_cases_hg_gen, test_cases_hg_meas)
+    
+    # PostgreSQL에 데이터 삽입 시도
+    print(f"\n{'='*60}")
+    print(f"PostgreSQL 데이터 삽입 시도 (적재 방식: {loader})")
+    print(f"{'='*60}")
+    
+    success = insert_data_to_postgresql(test_cases_lfd, test_cases_gen, test_cases_nwp, test_cases_kpx, test_cases_curt, test_cases_hg_gen, test_cases_hg_meas, only_tables=only_tables, loader=loader)
+    
+    if success:
+        print(f"\n일일 시뮬레이션이 성공적으로 완료되었습니다! - {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    else:
+        print(f"\n⚠️ 데이터베이스 연결에 실패했지만 데이터는 성공적으로 생성되었습니다. - {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    
+    # SQL INSERT 문도 함께 생성 (참고용) - 주석처리
+    # generate_sql_insert_statements(test_cases_lfd, test_cases_gen, test_cases_nwp, test_cases_kpx, test_cases_curt, test_cases_hg_gen, test_cases_hg_meas)
+    
+    write_metrics_file()
+    return success
+
+def _load_backfill_batch(connection, generated_days, only_tables, loader):
+    """
+    백필 배치 하나(여러 날짜)를 적재하고 커밋
+    실패하면 롤백한 뒤 예외를 그대로 전달
+    
+    Args:
+        generated_days (iterable): 배치 날짜들의 (날짜, 테이블 데이터 목록) - iter_generated_days 또는 pipelined
+    
+    Returns:
+        tuple: (적재 행 수, 거부 행 수)
+    """
+    batch_rows = 0
+    batch_rejected = 0
+    try:
+        for day, test_cases in generated_days:
+            counts, rejected = load_test_cases(connection, *test_cases, only_tables=only_tables, loader=loader)
+            batch_rows += sum(counts.values())
+            batch_rejected += sum(rejected.values())
+        commit_transaction(connection)
+    except psycopg2.Error:
+        connection.rollback()
+        raise
+    return batch_rows, batch_rejected
+
+# 백필 워커 프로세스마다 하나씩 여는 DB 연결
+_worker_connection = None
+
+def _init_backfill_worker():
+    """
+    백필 워커 프로세스 초기화 (프로세스 전용 DB 연결 생성)
+    """
+    global _worker_connection
+    METRICS.reset()  # fork로 물려받은 부모 프로세스의 지표는 버림 (부모가 이미 가지고 있음)
+    _worker_connection = acquire_connection()
+
+def _run_backfill_worker_batch(batch, only_tables, loader, engine, seed):
+    """
+    워커 프로세스에서 배치 하나를 처리
+    
+    워커 프로세스의 지표는 배치마다 넘겨주고 초기화하며, 부모 프로세스가 METRICS에 합칩니다.
+    
+    Returns:
+        tuple: (배치, 적재 행 수, 거부 행 수, 소요 시간(초), 오류 메시지 또는 None, 지표 snapshot)
+    """
+    global _worker_connection
+    started = time.perf_counter()
+    if _worker_connection is None or _worker_connection.closed:
+        release_connection(_worker_connection)
+        _worker_connection = acquire_connection()
+    if _worker_connection is None:
+        return batch, 0, 0, 0.0, "워커 데이터베이스 연결 실패", METRICS.snapshot(reset=True)
+    try:
+        batch_rows, batch_rejected = _load_backfill_batch(_worker_connection, iter_generated_days(batch, only_tables, engine, seed), only_tables, loader)
+    except psycopg2.Error as e:
+        return batch, 0, 0, time.perf_counter() - started, str(e).strip(), METRICS.snapshot(reset=True)
+    return batch, batch_rows, batch_rejected, time.perf_counter() - started, None, METRICS.snapshot(reset=True)
+
+def run_backfill(start_date, end_date, only_tables=None, loader='copy', engine='python', batch_days=7, workers=1, seed=None):
+    """
+    기간 백필 실행 함수
+    start_date부터 end_date까지(양 끝 포함) 하루씩 데이터를 생성하고 batch_days일 단위 트랜잭션으로 적재
+    
+    날짜마다 (seed, 날짜, 테이블)로 정해지는 독립된 난수 스트림(table_rngs)을 사용하므로 workers 수와 관계없이 같은 데이터가 생성됩니다.
+    
+    Args:
+        start_date (date): 시작일
+        end_date (date): 종료일 (포함)
+        only_tables (list): None이면 모든 테이블 생성, 리스트가 있으면 해당 테이블만 생성
+        loader (str): 적재 방식 ('copy', 'executemany', 'row')
+        engine (str): 생성 엔진 ('python', 'numpy')
+        batch_days (int): 한 트랜잭션에 묶을 일수
+        workers (int): 병렬 워커 프로세스 수 (1이면 현재 프로세스에서 순차 처리)
+        seed (int): 기준 난수 시드 (None이면 현재 시각으로 정하고 출력)
+    
+    Returns:
+        bool: 모든 배치가 커밋되었으면 True
+    """
+    if end_date < start_date:
+        print(f"❌ 종료일({end_date:%Y%m%d})이 시작일({start_date:%Y%m%d})보다 앞섭니다.")
+        return False
+    batch_days = max(1, int(batch_days))
+    workers = max(1, int(workers))
+    if seed is None:
+        seed = new_seed()
+    
+    days = [start_date + datetime.timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+    batches = [days[i:i + batch_days] for i in range(0, len(days), batch_days)]
+    workers = min(workers, len(batches))
+    
+    print(f"\n{'='*60}")
+    print(f"기간 백필 시작: {start_date:%Y%m%d} ~ {end_date:%Y%m%d} ({len(days)}일, {len(batches)}개 배치, 배치당 {batch_days}일)")
+    print(f"생성 엔진: {engine}, 적재 방식: {loader}, 워커: {workers}, 시드: {seed} - {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"{'='*60}")
+    
+    connection = acquire_connection()
+    if not connection:
+        print("❌ 데이터베이스 연결에 실패했습니다.")
+        return False
+    
+    ensure_schema(connection)
+    
+    started = time.perf_counter()
+    total_rows = 0
+    total_rejected = 0
+    done_days = 0
+    failed_batches = 0
+    
+    def report(batch_no, batch, batch_rows, batch_rejected, batch_elapsed, error):
+        nonlocal total_rows, total_rejected, done_days, failed_batches
+        if error:
+            failed_batches += 1
+            print(f"❌ [{batch_no}/{len(batches)}] {batch[0]:%Y%m%d}~{batch[-1]:%Y%m%d} 배치 적재 실패 (롤백): {error}")
+            return
+        total_rows += batch_rows
+        total_rejected += batch_rejected
+        done_days += len(batch)
+        elapsed = time.perf_counter() - started
+        rejected_label = f", 거부 {batch_rejected:,}행" if batch_rejected else ""
+        print(f"[{batch_no}/{len(batches)}] {batch[0]:%Y%m%d}~{batch[-1]:%Y%m%d} 커밋 완료 - "
+              f"{batch_rows:,}행{rejected_label} ({batch_rows / max(batch_elapsed, 1e-9):,.0f} rows/s) | "
+              f"진행 {done_days}/{len(days)}일, 누적 {total_rows:,}행 ({total_rows / max(elapsed, 1e-9):,.0f} rows/s)")
+    
+    if workers == 1:
+        # 생성 스레드가 다음 날짜들을 버퍼 크기만큼 미리 생성하고, 이 스레드는 꺼내는 대로 적재
+        generated = pipelined(iter_generated_days(days, only_tables, engine, seed))
+        try:
+            for batch_no, batch in enumerate(batches, 1):
+                batch_started = time.perf_counter()
+                generated_days = itertools.islice(generated, len(batch))
+                try:
+                    batch_rows, batch_rejected = _load_backfill_batch(connection, generated_days, only_tables, loader)
+                except psycopg2.Error as e:
+                    # 실패한 배치의 남은 날짜는 버려서 다음 배치와 날짜를 맞춤
+                    for _ in generated_days:
+                        pass
+                    report(batch_no, batch, 0, 0, 0.0, str(e).strip())
+                    continue
+                report(batch_no, batch, batch_rows, batch_rejected, time.perf_counter() - batch_started, None)
+        finally:
+            generated.close()
+            release_connection(connection)
+    else:
+        # fork된 워커가 부모의 연결을 물려받지 않도록 프로세스 풀 생성 전에 커넥션 풀을 닫음
+        release_connection(connection)
+        close_connection_pool()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_backfill_worker) as executor:
+            futures = [executor.submit(_run_backfill_worker_batch, batch, only_tables, loader, engine, seed) for batch in batches]
+            for batch_no, future in enumerate(as_completed(futures), 1):
+                batch, batch_rows, batch_rejected, batch_elapsed, error, worker_metrics = future.result()
+                METRICS.merge(worker_metrics)
+                report(batch_no, batch, batch_rows, batch_rejected, batch_elapsed, error)
+    
+    elapsed = time.perf_counter() - started
+    rows_per_sec = total_rows / elapsed if elapsed > 0 else 0.0
+    print(f"\n{'='*60}")
+    if failed_batches:
+        print(f"⚠️ 기간 백필 완료 (실패 배치 {failed_batches}개) - {done_days}/{len(days)}일, {total_rows:,}행, {elapsed:.1f}초, {rows_per_sec:,.0f} rows/s")
+    else:
+        print(f"✅ 기간 백필 완료 - {done_days}일, {total_rows:,}행, {elapsed:.1f}초, {rows_per_sec:,.0f} rows/s")
+    if total_rejected:
+        print(f"⚠️ 거부된 행 {total_rejected:,}개는 {get_dead_letter_path()}에 기록되었습니다.")
+    print(f"{'='*60}")
+    write_metrics_file()
+    return failed_batches == 0
+
+def get_watermark_path():
+    """
+    증분 생성 워터마크 파일 경로 - WATERMARK_FILE 환경변수 (없으면 None - 매번 DB에서 MAX 조회)
+    """
+    return os.getenv('WATERMARK_FILE') or None
+
+# 여러 스레드(스케줄러 작업)가 같은 워터마크 파일을 갱신할 때 서로 덮어쓰지 않도록 보호
+_watermark_lock = threading.Lock()
+
+def load_watermark_file(path):
+    """
+    워터마크 파일({테이블 라벨: 'YYYYMMDDHHMI'} JSON)을 읽음 (파일이 없으면 빈 dict)
+    """
+    try:
+        with open(path, encoding='utf-8') as watermark_file:
+            return json.load(watermark_file)
+    except FileNotFoundError:
+        return {}
+
+def update_watermark_file(path, watermarks):
+    """
+    워터마크 파일을 갱신 (테이블마다 기존 값과 비교해 더 늦은 시각만 반영)
+    임시 파일에 쓴 뒤 교체하므로 중간에 중단되어도 이전 워터마크가 남습니다.
+    
+    Returns:
+        dict: 갱신된 전체 워터마크 (기록에 실패하면 None)
+    """
+    if not path or not watermarks:
+        return None
+    with _watermark_lock:
+        merged = load_watermark_file(path)
+        for label, watermark in watermarks.items():
+            if watermark and watermark > merged.get(label, ''):
+                merged[label] = watermark
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as watermark_file:
+                json.dump(merged, watermark_file, ensure_ascii=False, indent=2, sort_keys=True)
+                watermark_file.write('\n')
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"⚠️ 워터마크 파일 기록 실패 ({path}): {e}")
+            return None
+    return merged
+
+def query_watermarks(connection, labels):
+    """
+    테이블별 기준 시각 컬럼(CRTN_TM/TM)의 최댓값 조회
+    
+    Returns:
+        dict: 테이블 라벨별 'YYYYMMDDHHMI' (데이터가 없는 테이블은 제외)
+    """
+    watermarks = {}
+    cursor = connection.cursor()
+    try:
+        for label in labels:
+            spec = TABLE_SPECS[LABEL_TABLES[label]]
+            cursor.execute(f"SELECT MAX({spec.time_column}) FROM {spec.name}")
+            watermark = cursor.fetchone()[0]
+            if watermark:
+                watermarks[label] = watermark
+    finally:
+        cursor.close()
+    return watermarks
+
+def get_watermarks(connection, labels, path=None):
+    """
+    테이블별 워터마크 (마지막으로 적재된 기준 시각)
+    path(워터마크 파일)가 있으면 파일 값을 쓰고, 파일에 없는 테이블만 DB에서 조회합니다.
+    """
+    watermarks = {}
+    if path:
+        watermarks = {label: value for label, value in load_watermark_file(path).items() if label in labels}
+    missing = [label for label in labels if label not in watermarks]
+    if missing and connection is not None:
+        watermarks.update(query_watermarks(connection, missing))
+    return watermarks
+
+def _rows_after(cases, watermark):
+    """
+    기준 시각이 watermark보다 늦은 행만 남긴 TableData (생성 데이터는 기준 시각 순으로 정렬되어 있음)
+    """
+    if not watermark:
+        return cases
+    start = bisect.bisect_right(cases.column(TABLE_TIME_COLUMNS[cases.table_name]), watermark)
+    return cases if start == 0 else cases.slice(start, len(cases))
+
+def incremental_first_days(labels, watermarks, start_date, end_date):
+    """
+    증분 생성에서 테이블마다 생성을 시작할 날짜
+    
+    워터마크가 있는 테이블은 워터마크가 속한 날부터 시작하므로 자정을 놓쳤거나 여러 날 중단된 뒤에도 빠진 날짜를 모두 채웁니다.
+    start_date를 지정하면 그보다 이른 날짜는 생성하지 않고, 워터마크가 없는 테이블은 start_date(없으면 end_date)부터 시작합니다.
+    
+    Returns:
+        dict: 테이블 라벨별 시작일 (end_date까지 적재가 끝난 테이블은 제외)
+    """
+    first_days = {}
+    for label in labels:
+        if label in watermarks:
+            first_day = datetime.datetime.strptime(watermarks[label], "%Y%m%d%H%M").date()
+            if start_date:
+                first_day = max(first_day, start_date)
+        else:
+            first_day = start_date or end_date
+        if first_day <= end_date:
+            first_days[label] = first_day
+    return first_days
+
+def run_incremental(start_date=None, end_date=None, only_tables=None, loader='copy', engine='python', seed=None, watermark_path=None):
+    """
+    증분 생성 모드
+    테이블마다 워터마크(DB의 MAX(CRTN_TM/TM) 또는 워터마크 파일) 이후의 시점만 생성/적재합니다.
+    
+    날짜마다 (seed, 날짜, 테이블)로 정해지는 난수 스트림을 쓰므로 워터마크가 있는 날은 하루치를 다시 생성한 뒤
+    워터마크 이후 행만 잘라서 적재하며, 같은 시드면 처음부터 한 번에 적재한 것과 같은 데이터가 됩니다.
+    워터마크까지 적재가 끝난 날짜와 테이블은 생성하지 않으므로 중단 후 재시작해도 기본키 충돌 없이 빠르게 따라잡습니다.
+    
+    Args:
+        start_date (date): 워터마크가 없는 테이블의 시작일 (None이면 end_date), 워터마크가 있는 테이블은 워터마크가 속한 날부터 (이 날짜보다 이르면 이 날짜부터)
+        end_date (date): 종료일 (포함, None이면 오늘)
+        only_tables (list): None이면 모든 테이블, 리스트가 있으면 해당 테이블 라벨만
+        loader (str): 적재 방식 ('copy', 'executemany', 'row')
+        engine (str): 생성 엔진 ('python', 'numpy', 'model')
+        seed (int): 기준 난수 시드 (None이면 현재 시각으로 정하고 출력 - 이어서 적재하려면 처음과 같은 시드를 지정)
+        watermark_path (str): 워터마크 파일 (None이면 WATERMARK_FILE 환경변수, 그것도 없으면 DB 조회만 사용)
+    
+    Returns:
+        dict: 테이블 라벨별 적재 행 수 (데이터베이스 연결에 실패하면 None)
+    """
+    end_date = end_date or datetime.date.today()
+    labels = [t.upper() for t in only_tables] if only_tables else list(TABLE_LABELS.values())
+    watermark_path = watermark_path or get_watermark_path()
+    if seed is None:
+        seed = new_seed()
+    
+    connection = acquire_connection()
+    if not connection:
+        print("❌ 데이터베이스 연결에 실패했습니다.")
+        return None
+    ensure_schema(connection)
+    
+    watermarks = get_watermarks(connection, labels, watermark_path)
+    first_days = incremental_first_days(labels, watermarks, start_date, end_date)
+    
+    print(f"\n{'='*60}")
+    print(f"증분 생성 시작: ~{end_date:%Y%m%d} (생성 엔진: {engine}, 적재 방식: {loader}, 시드: {seed})")
+    for label in labels:
+        start_label = f"{first_days[label]:%Y%m%d}부터" if label in first_days else "적재 완료"
+        print(f"  {label}: 워터마크 {watermarks.get(label, '없음')} → {start_label}")
+    print(f"{'='*60}")
+    
+    started = time.perf_counter()
+    totals = {label: 0 for label in labels}
+    day = min(first_days.values(), default=end_date + datetime.timedelta(days=1))
+    try:
+        while day <= end_date:
+            pending = [label for label in labels if label in first_days and first_days[label] <= day]
+            test_cases = generate_random_test_cases(only_tables=pending, engine=engine, target_date=day, seed=seed)
+            test_cases = [_rows_after(cases, watermarks.get(TABLE_LABELS[cases.table_name])) if TABLE_LABELS[cases.table_name] in pending else TableData(cases.table_name) for cases in test_cases]
+            try:
+                counts, rejected = load_test_cases(connection, *test_cases, only_tables=pending, loader=loader)
+                commit_transaction(connection)
+            except psycopg2.Error as e:
+                connection.rollback()
+                print(f"❌ [{day:%Y%m%d}] 적재 실패 (롤백, 다음 실행에서 이 날짜부터 다시 시도): {str(e).strip()}")
+                break
             
-            test_case_nwp = {
-                'PWR_EXC_TP_CD': '9',  # 무조건 9
-                'AREA_GRP_CD': '1',    # 무조건 1
-                'AREA_GRP_ID': '1',    # 무조건 1
-                'CRTN_TM': crtn_tm,
-                'FCST_TM': fcst_tm,
-                'LEAD_TM': lead_tm,
-                'FCST_PROD_CD': fcst_prod_cd,
-                'FCST_SRAD': fcst_srad,
-                'FCST_TEMP': fcst_temp,
-                'FCST_HUMI': fcst_humi,
-                'FCST_WSPD': fcst_wspd,
-                'FCST_PSFC': fcst_psfc,
-                'REG_DATE': reg_date,
-                'UPD_DATE': upd_date
-            }
+            day_watermarks = {}
+            for cases in test_cases:
+                label = TABLE_LABELS[cases.table_name]
+                if label in pending and len(cases):
+                    day_watermarks[label] = cases.column(TABLE_TIME_COLUMNS[cases.table_name])[-1]
+                    totals[label] += counts[label]
+            watermarks.update(day_watermarks)
+            update_watermark_file(watermark_path, day_watermarks)
             
-            test_cases_nwp.append(test_case_nwp)
-        
-        # REP_DATA_RE_KPX_JEJU_SUKUB_M용 데이터 (제주 계통 운영 정보)
-        # 기준일시 (YYYYMMDDHHMI 형식)
-        tm = crtn_time.strftime("%Y%m%d%H%M")
-        
-        # 공급능력 (MW) - 현재 수요보다 약간 높게
-        supp_ability = round(base_demand * random.uniform(1.1, 1.3), 5)
-        
-        # 현재수요 (MW) - 기존 수요예측량과 유사
-        curr_pwr_tot = round(base_demand * random.uniform(0.95, 1.05), 5)
-        
-        # 신재생합계 (MW) - 모든 신재생 발전량의 합
-        renew_pwr_tot = round(sum(renewable_totals.values()), 5)
-        
-        # 태양광합계 (MW) - SOLAR 발전량
-        renew_pwr_solar = round(renewable_totals['SOLAR'], 5)
-        
-        # 풍력합계 (MW) - WIND 발전량
-        renew_pwr_wind = round(renewable_totals['WIND'], 5)
-        
-        test_case_kpx = {
+            rejected_label = f", 거부 {sum(rejected.values()):,}행" if any(rejected.values()) else ""
+            print(f"[{day:%Y%m%d}] {', '.join(f'{label} {counts[label]}행' for label in pending)} 커밋{rejected_label}")
+            day += datetime.timedelta(days=1)
+    except KeyboardInterrupt:
+        print("\n증분 생성을 중단합니다. (커밋된 날짜까지 워터마크가 반영되어 있습니다)")
+    finally:
+        release_connection(connection)
+    
+    elapsed = time.perf_counter() - started
+    total_rows = sum(totals.values())
+    print(f"\n증분 생성 종료 - {total_rows:,}행, {elapsed:.1f}초 ({total_rows / max(elapsed, 1e-9):,.0f} rows/s)")
+    write_metrics_file()
+    return totals
+
+class SimulatedClock:
+    """
+    가속 가능한 시뮬레이션 시계
+    speed배 빠르게 흐르며, speed=1440이면 실제 1분에 시뮬레이션 하루가 지나갑니다.
+    """
+    
+    def __init__(self, start=None, speed=1.0):
+        if speed <= 0:
+            raise ValueError(f"시계 배속은 0보다 커야 합니다: {speed}")
+        self.start = start or datetime.datetime.now()
+        self.speed = float(speed)
+        self._started = time.monotonic()
+    
+    def now(self):
+        """
+        현재 시뮬레이션 시각
+        """
+        elapsed = (time.monotonic() - self._started) * self.speed
+        return self.start + datetime.timedelta(seconds=elapsed)
+    
+    def sleep_until(self, sim_time, stop_event=None):
+        """
+        시뮬레이션 시각 sim_time이 될 때까지 대기 (이미 지났으면 바로 반환)
+        stop_event가 설정되면 대기를 중단합니다.
+        """
+        wait_seconds = (sim_time - self.now()).total_seconds() / self.speed
+        if wait_seconds <= 0:
+            return
+        if stop_event is not None:
+            stop_event.wait(wait_seconds)
+        else:
+            time.sleep(wait_seconds)
+
+# 실시간 피드로 내보낼 수 있는 테이블
+STREAM_TABLES = ('KPX', 'HG_MEAS')
+
+def generate_realtime_slot(slot_time, seed=None, tables=STREAM_TABLES):
+    """
+    실시간 피드용 데이터 생성 (한 시점)
+    (시드, 날짜, 자정부터의 분)의 테이블별 스트림을 사용하므로 같은 시드면 시점마다 항상 같은 값을 만듭니다.
+    
+    Args:
+        slot_time (datetime): 기준일시 (TM)
+        seed (int): 기준 난수 시드 (None이면 매번 다른 데이터)
+        tables (tuple): 생성할 테이블 라벨 ('KPX', 'HG_MEAS')
+    
+    Returns:
+        tuple: (KPX TableData, HG_MEAS TableData)
+    """
+    tm = slot_time.strftime("%Y%m%d%H%M")
+    reg_date = slot_time.strftime("%Y-%m-%d %H:%M:%S")
+    hour = slot_time.hour
+    rngs = table_rngs(seed, slot_time.date(), slot=hour * 60 + slot_time.minute)
+    profiles = get_hour_profiles()
+    
+    test_cases_kpx = TableData('REP_DATA_RE_KPX_JEJU_SUKUB_M')
+    test_cases_hg_meas = TableData('REP_DATA_HG_MEAS_GEM_GENT_DA')
+    
+    if 'KPX' in tables:
+        rng = rngs['KPX']
+        base_demand = rng.uniform(*profile_bounds(profiles, 'DEMAND', hour, slot_time.minute))
+        # 연료별 신재생 발전량 (GEN과 같은 10-30% 수준) - SOLAR, WIND, HYDRO, BIOMASS, GEOTHERMAL
+        renewables = [base_demand * rng.uniform(0.1, 0.3) for _ in range(5)]
+        test_cases_kpx.append({
             'TM': tm,
-            'SUPP_ABILITY': supp_ability,
-            'CURR_PWR_TOT': curr_pwr_tot,
-            'RENEW_PWR_TOT': renew_pwr_tot,
-            'RENEW_PWR_SOLAR': renew_pwr_solar,
-            'RENEW_PWR_WIND': renew_pwr_wind,
+            'SUPP_ABILITY': round(base_demand * rng.uniform(1.1, 1.3), 5),
+            'CURR_PWR_TOT': round(base_demand * rng.uniform(0.95, 1.05), 5),
+            'RENEW_PWR_TOT': round(sum(renewables), 5),
+            'RENEW_PWR_SOLAR': round(renewables[0], 5),
+            'RENEW_PWR_WIND': round(renewables[1], 5),
             'REG_DATE': reg_date,
-            'UPD_DATE': upd_date
-        }
-        
-        test_cases_kpx.append(test_case_kpx)
-
-        # REP_DATA_P2H_FCST_CURT_DA용 데이터 (각 시간대별로)
-        for i in range(24): # 00시부터 23시까지
-            crtn_tm_curt_dt = crtn_time.replace(hour=i, minute=0, second=0, microsecond=0)
-            crtn_tm_curt = crtn_tm_curt_dt.strftime("%Y%m%d%H%M")
-            fcst_tm_curt = (crtn_tm_curt_dt + datetime.timedelta(hours=1)).strftime("%Y%m%d%H%M")
-            lead_tm_curt = f"{i:03d}00" # 선행시간은 시간대와 동일
-            fcst_minpw = round(base_demand * random.uniform(0.8, 1.2), 2) # 예측 최소 수요
-            fcst_curt = round(base_demand * random.uniform(0.9, 1.1), 2) # 예측 최대 수요
-
-            test_case_curt = {
-                'CRTN_TM': crtn_tm_curt,
-                'FCST_TM': fcst_tm_curt,
-                'LEAD_TM': lead_tm_curt,
-                'FCST_MINPW': fcst_minpw,
-                'FCST_CURT': fcst_curt,
+            'UPD_DATE': reg_date
+        })
+    
+    if 'HG_MEAS' in tables:
+        rng = rngs['HG_MEAS']
+        area_groups = ['SEOUL', 'BUSAN', 'DAEGU', 'INCHON', 'GWANGJU', 'DAEJEON', 'ULSAN', 'SEJONG']
+        prod_bounds = profile_bounds(profiles, 'HG_MEAS_PROD', hour, slot_time.minute)
+        capa_bounds = profile_bounds(profiles, 'HG_MEAS_CAPA', hour, slot_time.minute)
+        for area_group in area_groups:
+            # 수소 생산량 - 주간에 생산 활발
+            hgen_prod = round(rng.uniform(*prod_bounds), 5)
+            hgen_capa = round(rng.uniform(*capa_bounds), 5)
+            test_cases_hg_meas.append({
+                'TM': tm,
+                'AREA_GRP_CD': area_group,
+                'AREA_GRP_ID': f"{area_group}_H2_{rng.randint(1, 999):03d}",
+                'HGEN_PROD': hgen_prod,
+                'HGEN_CAPA': hgen_capa,
                 'REG_DATE': reg_date,
-                'UPD_DATE': upd_date
-            }
-            test_cases_curt.append(test_case_curt)
-        
-        # REP_DATA_HG_FCST_GEN_GENT_DA용 데이터 (수소발전단지 수소 예측 생산량)
-        if not only_tables or 'HG_GEN' in [t.upper() for t in only_tables]:
-            for area_group in area_groups:
-                for fuel_type in ['HYDROGEN']:  # 수소 발전만
-                    # 수소 생산량 (MWh) - 시간대별로 다른 값
-                    if 6 <= hour <= 18:  # 주간 (수소 생산 활발)
-                        fcst_qgen = round(random.uniform(50, 200), 6)
-                        fcst_capa = round(random.uniform(100, 300), 6)
-                    else:  # 야간 (수소 생산 감소)
-                        fcst_qgen = round(random.uniform(20, 80), 6)
-                        fcst_capa = round(random.uniform(50, 150), 6)
-                    
-                    test_case_hg_gen = {
-                        'AREA_GRP_CD': area_group,
-                        'AREA_GRP_ID': f"{area_group}_H2_{random.randint(1, 999):03d}",
-                        'CRTN_TM': crtn_tm,
-                        'FCST_TM': fcst_tm,
-                        'LEAD_TM': lead_tm,
-                        'FCST_PROD_CD': fcst_prod_cd,
-                        'FCST_QGEN': fcst_qgen,
-                        'FCST_CAPA': fcst_capa,
-                        'REG_DATE': reg_date,
-                        'UPD_DATE': upd_date
-                    }
-                    test_cases_hg_gen.append(test_case_hg_gen)
-        
-        # REP_DATA_HG_MEAS_GEM_GENT_DA용 데이터 (수소발전단지 수소 생산량 정보)
-        if not only_tables or 'HG_MEAS' in [t.upper() for t in only_tables]:
-            for area_group in area_groups:
-                # 수소 생산량 (KG) - 시간대별로 다른 값
-                if 6 <= hour <= 18:  # 주간 (수소 생산 활발)
-                    hgen_prod = round(random.uniform(1000, 5000), 5)
-                    hgen_capa = round(random.uniform(2000, 8000), 5)
-                else:  # 야간 (수소 생산 감소)
-                    hgen_prod = round(random.uniform(500, 2000), 5)
-                    hgen_capa = round(random.uniform(1000, 4000), 5)
-                
-                test_case_hg_meas = {
-                    'TM': tm,
-                    'AREA_GRP_CD': area_group,
-                    'AREA_GRP_ID': f"{area_group}_H2_{random.randint(1, 999):03d}",
-                    'HGEN_PROD': hgen_prod,
-                    'HGEN_CAPA': hgen_capa,
-                    'REG_DATE': reg_date,
-                    'UPD_DATE': upd_date
-                }
-                test_cases_hg_meas.append(test_case_hg_meas)
+                'UPD_DATE': reg_date
+            })
     
-    return test_cases_lfd, test_cases_gen, test_cases_nwp, test_cases_kpx, test_cases_curt, test_cases_hg_gen, test_cases_hg_meas
+    return test_cases_kpx, test_cases_hg_meas
 
-def print_test_cases(test_cases_lfd, test_cases_gen, test_cases_nwp, test_cases_kpx, test_cases_curt, test_cases_hg_gen, test_cases_hg_meas):
-    """
-    테스트케이스를 보기 좋게 출력
+def _load_realtime_slot(connection, slot_time, tables, seed=None, loader='copy'):
     """
-    print("=" * 120)
-    print("수요예측 데이터 테스트케이스 (REP_DATA_RE_FCST_LFD_DA)")
-    print("=" * 120)
+    한 시점의 실시간 데이터를 생성해 적재 (커밋은 호출하는 쪽에서)
     
-    for i, case in enumerate(test_cases_lfd, 1):
-        print(f"\n[LFD 테스트케이스 {i}]")
-        print("-" * 80)
-        
-        for key, value in case.items():
-            if key in ['FCST_QG01', 'FCST_QG02', 'FCST_QG03', 'FCST_QG04', 'FCST_QG05', 'FCST_QG06', 'FCST_QGEN', 'FCST_QGMX', 'FCST_QGMN']:
-                print(f"{key:12} : {value:>15.6f} MWh")
-            else:
-                print(f"{key:12} : {value}")
+    Returns:
+        tuple: (테이블 라벨별 적재 행 수 dict, 테이블 라벨별 거부 행 수 dict)
+    """
+    started = time.perf_counter()
+    test_cases_kpx, test_cases_hg_meas = generate_realtime_slot(slot_time, seed, tables)
+    _record_generate_metrics((test_cases_kpx, test_cases_hg_meas), time.perf_counter() - started)
+    return load_test_cases(
+        connection,
+        TableData('REP_DATA_RE_FCST_LFD_DA'), TableData('REP_DATA_RE_FCST_GEN_DA'), TableData('REP_DATA_HG_FCST_NWP_DA'),
+        test_cases_kpx, TableData('REP_DATA_P2H_FCST_CURT_DA'), TableData('REP_DATA_HG_FCST_GEN_GENT_DA'), test_cases_hg_meas,
+        loader=loader
+    )
+
+def run_stream(tables=STREAM_TABLES, interval_minutes=5, speed=1.0, start=None, max_slots=None, loader='copy', seed=None, stop_event=None, resume=False, watermark_path=None):
+    """
+    실시간 피드 모드
+    interval_minutes 간격의 시점마다 KPX/HG_MEAS 데이터를 생성하고 바로 커밋합니다.
     
-    print("\n" + "=" * 120)
-    print("신재생 예측 발전량 데이터 테스트케이스 (REP_DATA_RE_FCST_GEN_DA)")
-    print("=" * 120)
+    가속 시계(speed)를 사용하면 하위 시스템 부하 테스트용으로 빠르게 흘려보낼 수 있습니다.
+    시계가 여러 시점을 앞질러 가도 건너뛰지 않고 밀린 시점을 순서대로 모두 내보냅니다.
+    resume이면 테이블별 워터마크 다음 시점부터 시작해 중단된 동안 빠진 시점을 대기 없이 먼저 채웁니다.
     
-    for i, case in enumerate(test_cases_gen, 1):
-        print(f"\n[GEN 테스트케이스 {i}]")
-        print("-" * 80)
-        
-        for key, value in case.items():
-            if key in ['FCST_QG01', 'FCST_QG02', 'FCST_QG03', 'FCST_QG04', 'FCST_QG05', 'FCST_QG06', 'FCST_QGEN', 'FCST_QGMX', 'FCST_QGMN', 'FCST_CAPA', 'ESS_CHRG', 'ESS_DISC', 'ESS_CAPA']:
-                print(f"{key:12} : {value:>15.6f} MWh")
-            else:
-                print(f"{key:12} : {value}")
+    Args:
+        tables (tuple): 내보낼 테이블 라벨 ('KPX', 'HG_MEAS')
+        interval_minutes (int): 시뮬레이션 시간 기준 생성 간격 (분)
+        speed (float): 시계 배속 (1440이면 실제 1분에 하루)
+        start (datetime): 시뮬레이션 시작 시각 (None이면 현재 시각)
+        max_slots (int): 내보낼 시점 수 (None이면 Ctrl+C 또는 stop_event까지 계속)
+        loader (str): 적재 방식 ('copy', 'executemany', 'row')
+        seed (int): 기준 난수 시드 (같은 시드면 시점마다 같은 데이터, None이면 매번 다른 데이터)
+        stop_event (threading.Event): 설정되면 스트림을 종료
+        resume (bool): True이면 워터마크 이후 빠진 시점부터 이어서 생성 (같은 시드를 지정해야 중단 전과 이어지는 데이터)
+        watermark_path (str): 워터마크 파일 (None이면 WATERMARK_FILE 환경변수, 지정되어 있으면 커밋마다 갱신)
     
-    print("\n" + "=" * 120)
-    print("수소 생산단지 기상 예측 데이터 테스트케이스 (REP_DATA_HG_FCST_NWP_DA)")
-    print("=" * 120)
+    Returns:
+        int: 커밋한 행 수
+    """
+    tables = tuple(t.upper() for t in tables)
+    watermark_path = watermark_path or get_watermark_path()
+    interval = datetime.timedelta(minutes=interval_minutes)
+    clock = SimulatedClock(start=start, speed=speed)
     
-    for i, case in enumerate(test_cases_nwp, 1):
-        print(f"\n[NWP 테스트케이스 {i}]")
-        print("-" * 80)
-        
-        for key, value in case.items():
-            if key in ['FCST_SRAD']:
-                print(f"{key:12} : {value:>15.6f} W/m²")
-            elif key in ['FCST_TEMP']:
-                print(f"{key:12} : {value:>15.6f} °C")
-            elif key in ['FCST_HUMI']:
-                print(f"{key:12} : {value:>15.6f} %")
-            elif key in ['FCST_WSPD']:
-                print(f"{key:12} : {value:>15.6f} m/s")
-            elif key in ['FCST_PSFC']:
-                print(f"{key:12} : {value:>15.6f} hPa")
-            else:
-                print(f"{key:12} : {value}")
+    # 시작 시각을 간격 경계로 올림
+    first = clock.start.replace(second=0, microsecond=0)
+    remainder = (first.hour * 60 + first.minute) % interval_minutes
+    slot_time = first + datetime.timedelta(minutes=(interval_minutes - remainder) % interval_minutes)
+    if slot_time < clock.start:
+        slot_time += interval
     
-    print("\n" + "=" * 120)
-    print("제주 계통 운영 정보 데이터 테스트케이스 (REP_DATA_RE_KPX_JEJU_SUKUB_M)")
-    print("=" * 120)
+    connection = acquire_connection()
+    if not connection:
+        print("❌ 데이터베이스 연결에 실패했습니다.")
+        return 0
+    ensure_schema(connection)
     
-    for i, case in enumerate(test_cases_kpx, 1):
-        print(f"\n[KPX 테스트케이스 {i}]")
-        print("-" * 80)
-        
-        for key, value in case.items():
-            if key in ['SUPP_ABILITY', 'CURR_PWR_TOT', 'RENEW_PWR_TOT', 'RENEW_PWR_SOLAR', 'RENEW_PWR_WIND']:
-                print(f"{key:12} : {value:>15.5f} MW")
-            else:
-                print(f"{key:12} : {value}")
+    # 워터마크 이후 첫 간격 경계부터 재개 (워터마크가 없는 테이블은 원래 첫 시점부터)
+    watermarks = {}
+    if resume:
+        watermarks = get_watermarks(connection, tables, watermark_path)
+        if watermarks:
+            resume_from = datetime.datetime.strptime(min(watermarks.values()), "%Y%m%d%H%M")
+            resume_from += datetime.timedelta(minutes=interval_minutes - (resume_from.hour * 60 + resume_from.minute) % interval_minutes)
+            if resume_from < slot_time:
+                skipped = (slot_time - interval).strftime("%Y%m%d%H%M")
+                watermarks = {table: watermarks.get(table, skipped) for table in tables}
+                slot_time = resume_from
+            while all(watermarks.get(table, '') >= slot_time.strftime("%Y%m%d%H%M") for table in tables):
+                slot_time += interval
     
-    print("\n" + "=" * 120)
-    print("제주전체 예측 출력제어량 데이터 테스트케이스 (REP_DATA_P2H_FCST_CURT_DA)")
-    print("=" * 120)
+    print(f"\n{'='*60}")
+    print(f"실시간 피드 시작: {', '.join(tables)} - {interval_minutes}분 간격, 배속 x{speed:g}, 첫 시점 {slot_time:%Y-%m-%d %H:%M}")
+    if slot_time < clock.start:
+        print(f"워터마크 {', '.join(f'{table} {watermarks[table]}' for table in tables)} 이후 빠진 시점을 먼저 채웁니다.")
+    print(f"{'='*60}")
     
-    for i, case in enumerate(test_cases_curt, 1):
-        print(f"\n[CURT 테스트케이스 {i}]")
-        print("-" * 80)
-        
-        for key, value in case.items():
-            if key in ['FCST_MINPW', 'FCST_CURT']:
-                print(f"{key:12} : {value:>15.2f} MW/m²")
+    total_rows = 0
+    slots = 0
+    try:
+        while max_slots is None or slots < max_slots:
+            tm = slot_time.strftime("%Y%m%d%H%M")
+            slot_tables = tuple(table for table in tables if watermarks.get(table, '') < tm)
+            if not slot_tables:
+                slot_time += interval
+                continue
+            clock.sleep_until(slot_time, stop_event)
+            if stop_event is not None and stop_event.is_set():
+                break
+            
+            generated = time.perf_counter()
+            try:
+                counts, _ = _load_realtime_slot(connection, slot_time, slot_tables, seed, loader=loader)
+                commit_transaction(connection)
+            except psycopg2.Error as e:
+                connection.rollback()
+                print(f"❌ [{slot_time:%Y-%m-%d %H:%M}] 적재 실패: {str(e).strip()}")
+                if connection.closed:
+                    release_connection(connection)
+                    connection = acquire_connection()
+                    if not connection:
+                        print("❌ 데이터베이스 재연결에 실패하여 실시간 피드를 종료합니다.")
+                        break
             else:
-                print(f"{key:12} : {value}")
-    
-    print("\n" + "=" * 120)
-    print("수소발전단지 수소 예측 생산량 데이터 테스트케이스 (REP_DATA_HG_FCST_GEN_GENT_DA)")
-    print("=" * 120)
+                latency_ms = (time.perf_counter() - generated) * 1000
+                slot_rows = counts['KPX'] + counts['HG_MEAS']
+                total_rows += slot_rows
+                print(f"[{slot_time:%Y-%m-%d %H:%M}] KPX {counts['KPX']}행, HG_MEAS {counts['HG_MEAS']}행 커밋 (생성→커밋 {latency_ms:.1f}ms, 누적 {total_rows:,}행)")
+                update_watermark_file(watermark_path, {table: tm for table in slot_tables})
+            
+            write_metrics_file()
+            slots += 1
+            slot_time += interval
+    except KeyboardInterrupt:
+        print("\n실시간 피드를 종료합니다.")
+    finally:
+        release_connection(connection)
     
-    for i, case in enumerate(test_cases_hg_gen, 1):
-        print(f"\n[HG_GEN 테스트케이스 {i}]")
-        print("-" * 80)
-        
-        for key, value in case.items():
-            if key in ['FCST_QGEN', 'FCST_CAPA']:
-                print(f"{key:12} : {value:>15.6f} MWh")
-            else:
-                print(f"{key:12} : {value}")
+    print(f"실시간 피드 종료 - {slots}개 시점, {total_rows:,}행")
+    return total_rows
+
+# 재생 시 날짜를 옮기는 컬럼 (YYYYMMDDHHMI 문자열 / TIMESTAMP 문자열)
+REPLAY_TIME_COLUMNS = ('CRTN_TM', 'FCST_TM', 'TM')
+REPLAY_TIMESTAMP_COLUMNS = ('REG_DATE', 'UPD_DATE')
+
+# 덤프 파일명: <테이블명 소문자>_<덤프 시각 YYYYMMDDHHMI>.csv
+REPLAY_FILE_PATTERN = re.compile(r"^(rep_data_\w+?)_\d{12}\.csv$", re.IGNORECASE)
+
+def find_replay_files(directory=None):
+    """
+    directory(기본값: 이 스크립트가 있는 디렉터리)의 rep_data_*.csv 덤프 목록
+    """
+    directory = directory or os.path.dirname(os.path.abspath(__file__))
+    return sorted(glob.glob(os.path.join(directory, 'rep_data_*.csv')))
+
+def replay_table_name(path):
+    """
+    덤프 파일명에서 테이블명을 추출 (알 수 없는 테이블이면 ValueError)
+    """
+    match = REPLAY_FILE_PATTERN.match(os.path.basename(path))
+    table_name = match.group(1).upper() if match else None
+    if table_name not in TABLE_SPECS:
+        raise ValueError(f"덤프 파일명에서 테이블을 알 수 없습니다: {path} (형식: rep_data_..._YYYYMMDDHHMI.csv)")
+    return table_name
+
+@functools.lru_cache(maxsize=65536)
+def _shift_tm(value, days):
+    """
+    YYYYMMDDHHMI 문자열을 days일만큼 이동
+    """
+    return (datetime.datetime.strptime(value, "%Y%m%d%H%M") + datetime.timedelta(days=days)).strftime("%Y%m%d%H%M")
+
+@functools.lru_cache(maxsize=65536)
+def _shift_timestamp(value, days):
+    """
+    TIMESTAMP 문자열('2025-08-01 02:51:09.000')을 days일만큼 이동
+    """
+    return _export_timestamp(datetime.datetime.fromisoformat(value) + datetime.timedelta(days=days))
+
+def _first_replay_time(path, table_name):
+    """
+    덤프의 첫 데이터 행 기준 시각 (파일이 기준 시각 순으로 정렬되어 있다고 가정, 빈 파일이면 None)
+    """
+    with open(path, newline='', encoding='utf-8-sig') as dump_file:
+        reader = csv.reader(dump_file)
+        header = [name.strip().upper() for name in next(reader, [])]
+        first_row = next(reader, None)
+    key_column = TABLE_TIME_COLUMNS[table_name]
+    if first_row is None or key_column not in header:
+        return None
+    return datetime.datetime.strptime(first_row[header.index(key_column)], "%Y%m%d%H%M")
+
+def read_replay_chunks(path, table_name=None, chunk_size=None, day_shift=0):
+    """
+    덤프 CSV를 chunk_size행씩 읽어 TableData로 반환하는 제너레이터
     
-    print("\n" + "=" * 120)
-    print("수소발전단지 수소 생산량 정보 데이터 테스트케이스 (REP_DATA_HG_MEAS_GEM_GENT_DA)")
-    print("=" * 120)
+    컬럼은 헤더 이름으로 맞추며, 테이블에 없는 컬럼은 버리고 덤프에 없는 컬럼은 NULL로 채웁니다.
+    빈 값은 NULL이며, day_shift가 있으면 CRTN_TM/FCST_TM/TM과 REG_DATE/UPD_DATE를 그만큼 이동합니다.
+    """
+    table_name = table_name or replay_table_name(path)
+    chunk_size = chunk_size or get_batch_size()
+    columns = TABLE_INSERT_COLUMNS[table_name]
+    numeric_columns = TableData(table_name).numeric_columns
     
-    for i, case in enumerate(test_cases_hg_meas, 1):
-        print(f"\n[HG_MEAS 테스트케이스 {i}]")
-        print("-" * 80)
+    with open(path, newline='', encoding='utf-8-sig') as dump_file:
+        reader = csv.reader(dump_file)
+        header = [name.strip().upper() for name in next(reader, [])]
+        dropped = [name for name in header if name not in columns]
+        missing = [column for column in columns if column not in header]
+        if dropped or missing:
+            print(f"⚠️ {os.path.basename(path)}: 테이블에 없는 컬럼 제외 {dropped or '-'}, 덤프에 없는 컬럼 NULL {missing or '-'}")
+        positions = {column: header.index(column) for column in columns if column in header}
         
-        for key, value in case.items():
-            if key in ['HGEN_PROD', 'HGEN_CAPA']:
-                print(f"{key:12} : {value:>15.5f} KG")
+        while True:
+            rows = list(itertools.islice(reader, chunk_size))
+            if not rows:
+                break
+            values_by_column = {}
+            for column in columns:
+                position = positions.get(column)
+                if position is None:
+                    values = [float('nan') if column in numeric_columns else None] * len(rows)
+                elif column in numeric_columns:
+                    values = [float(row[position]) if row[position] != '' else float('nan') for row in rows]
+                else:
+                    values = [row[position] if row[position] != '' else None for row in rows]
+                    if day_shift and column in REPLAY_TIME_COLUMNS:
+                        values = [_shift_tm(v, day_shift) if v else v for v in values]
+                    elif day_shift and column in REPLAY_TIMESTAMP_COLUMNS:
+                        values = [_shift_timestamp(v, day_shift) if v else v for v in values]
+                values_by_column[column] = values
+            chunk = TableData(table_name)
+            chunk.extend_columns(values_by_column)
+            yield chunk
+
+def _replay_groups(path, table_name, chunk_size, day_shift):
+    """
+    덤프를 기준 시각이 같은 행 묶음 (기준 시각, 테이블명, TableData)으로 나누어 반환하는 제너레이터
+    """
+    key_column = TABLE_TIME_COLUMNS[table_name]
+    pending = None
+    for chunk in read_replay_chunks(path, table_name, chunk_size, day_shift):
+        keys = chunk.column(key_column)
+        start = 0
+        for index in range(1, len(keys) + 1):
+            if index < len(keys) and keys[index] == keys[start]:
+                continue
+            group = chunk.slice(start, index)
+            if pending is not None and pending[0] == keys[start]:
+                pending[2].extend(group)
             else:
-                print(f"{key:12} : {value}")
+                if pending is not None:
+                    yield pending
+                pending = (keys[start], table_name, group)
+            start = index
+    if pending is not None:
+        yield pending
 
-def generate_sql_insert_statements(test_cases_lfd, test_cases_gen, test_cases_nwp, test_cases_kpx, test_cases_curt, test_cases_hg_gen, test_cases_hg_meas):
+def _load_table_data(connection, cases, loader='copy'):
     """
-    SQL INSERT 문 생성
-    """
-    print("\n" + "=" * 120)
-    print("SQL INSERT 문 (REP_DATA_RE_FCST_LFD_DA)")
-    print("=" * 120)
-    
-    for i, case in enumerate(test_cases_lfd, 1):
-        print(f"\n-- LFD 테스트케이스 {i}")
-        print("INSERT INTO REP_DATA_RE_FCST_LFD_DA (")
-        print("    CRTN_TM, FCST_TM, LEAD_TM, FCST_PROD_CD,")
-        print("    FCST_QG01, FCST_QG02, FCST_QG03, FCST_QG04, FCST_QG05, FCST_QG06,")
-        print("    FCST_QGEN, FCST_QGMX, FCST_QGMN, REG_DATE, UPD_DATE")
-        print(") VALUES (")
-        print(f"    '{case['CRTN_TM']}', '{case['FCST_TM']}', '{case['LEAD_TM']}', '{case['FCST_PROD_CD']}',")
-        print(f"    {case['FCST_QG01']}, {case['FCST_QG02']}, {case['FCST_QG03']}, {case['FCST_QG04']}, {case['FCST_QG05']}, {case['FCST_QG06']},")
-        print(f"    {case['FCST_QGEN']}, {case['FCST_QGMX']}, {case['FCST_QGMN']}, TO_TIMESTAMP('{case['REG_DATE']}', 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP('{case['UPD_DATE']}', 'YYYY-MM-DD HH24:MI:SS')")
-        print(");")
-    
-    print("\n" + "=" * 120)
-    print("SQL INSERT 문 (REP_DATA_RE_FCST_GEN_DA)")
-    print("=" * 120)
-    
-    for i, case in enumerate(test_cases_gen, 1):
-        print(f"\n-- GEN 테스트케이스 {i}")
-        print("INSERT INTO REP_DATA_RE_FCST_GEN_DA (")
-        print("    PWR_EXC_TP_CD, FUEL_TP_CD, CRTN_TM, FCST_TM, LEAD_TM, FCST_PROD_CD,")
-        print("    FCST_QG01, FCST_QG02, FCST_QG03, FCST_QG04, FCST_QG05, FCST_QG06,")
-        print("    FCST_QGEN, FCST_QGMX, FCST_QGMN, FCST_CAPA, ESS_CHRG, ESS_DISC, ESS_CAPA,")
-        print("    REG_DATE, UPD_DATE")
-        print(") VALUES (")
-        print(f"    '{case['PWR_EXC_TP_CD']}', '{case['FUEL_TP_CD']}', '{case['CRTN_TM']}', '{case['FCST_TM']}', '{case['LEAD_TM']}', '{case['FCST_PROD_CD']}',")
-        print(f"    {case['FCST_QG01']}, {case['FCST_QG02']}, {case['FCST_QG03']}, {case['FCST_QG04']}, {case['FCST_QG05']}, {case['FCST_QG06']},")
-        print(f"    {case['FCST_QGEN']}, {case['FCST_QGMX']}, {case['FCST_QGMN']}, {case['FCST_CAPA']}, {case['ESS_CHRG']}, {case['ESS_DISC']}, {case['ESS_CAPA']},")
-        print(f"    TO_TIMESTAMP('{case['REG_DATE']}', 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP('{case['UPD_DATE']}', 'YYYY-MM-DD HH24:MI:SS')")
-        print(");")
-    
-    print("\n" + "=" * 120)
-    print("SQL INSERT 문 (REP_DATA_HG_FCST_NWP_DA)")
-    print("=" * 120)
-    
-    for i, case in enumerate(test_cases_nwp, 1):
-        print(f"\n-- NWP 테스트케이스 {i}")
-        print("INSERT INTO REP_DATA_HG_FCST_NWP_DA (")
-        print("    PWR_EXC_TP_CD, AREA_GRP_CD, AREA_GRP_ID, CRTN_TM, FCST_TM, LEAD_TM, FCST_PROD_CD,")
-        print("    FCST_SRAD, FCST_TEMP, FCST_HUMI, FCST_WSPD, FCST_PSFC,")
-        print("    REG_DATE, UPD_DATE")
-        print(") VALUES (")
-        print(f"    '{case['PWR_EXC_TP_CD']}', '{case['AREA_GRP_CD']}', '{case['AREA_GRP_ID']}', '{case['CRTN_TM']}', '{case['FCST_TM']}', '{case['LEAD_TM']}', '{case['FCST_PROD_CD']}',")
-        print(f"    {case['FCST_SRAD']}, {case['FCST_TEMP']}, {case['FCST_HUMI']}, {case['FCST_WSPD']}, {case['FCST_PSFC']},")
-        print(f"    TO_TIMESTAMP('{case['REG_DATE']}', 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP('{case['UPD_DATE']}', 'YYYY-MM-DD HH24:MI:SS')")
-        print(");")
-    
-    print("\n" + "=" * 120)
-    print("SQL INSERT 문 (REP_DATA_RE_KPX_JEJU_SUKUB_M)")
-    print("=" * 120)
-    
-    for i, case in enumerate(test_cases_kpx, 1):
-        print(f"\n-- KPX 테스트케이스 {i}")
-        print("INSERT INTO REP_DATA_RE_KPX_JEJU_SUKUB_M (")
-        print("    TM, SUPP_ABILITY, CURR_PWR_TOT, RENEW_PWR_TOT, RENEW_PWR_SOLAR, RENEW_PWR_WIND,")
-        print("    REG_DATE, UPD_DATE")
-        print(") VALUES (")
-        print(f"    '{case['TM']}', {case['SUPP_ABILITY']}, {case['CURR_PWR_TOT']}, {case['RENEW_PWR_TOT']}, {case['RENEW_PWR_SOLAR']}, {case['RENEW_PWR_WIND']},")
-        print(f"    TO_TIMESTAMP('{case['REG_DATE']}', 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP('{case['UPD_DATE']}', 'YYYY-MM-DD HH24:MI:SS')")
-        print(");")
-    
-    print("\n" + "=" * 120)
-    print("SQL INSERT 문 (REP_DATA_P2H_FCST_CURT_DA)")
-    print("=" * 120)
-    
-    for i, case in enumerate(test_cases_curt, 1):
-        print(f"\n-- CURT 테스트케이스 {i}")
-        print("INSERT INTO REP_DATA_P2H_FCST_CURT_DA (")
-        print("    CRTN_TM, FCST_TM, LEAD_TM, FCST_MINPW, FCST_CURT,")
-        print("    REG_DATE, UPD_DATE")
-        print(") VALUES (")
-        print(f"    '{case['CRTN_TM']}', '{case['FCST_TM']}', '{case['LEAD_TM']}', {case['FCST_MINPW']}, {case['FCST_CURT']},")
-        print(f"    TO_TIMESTAMP('{case['REG_DATE']}', 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP('{case['UPD_DATE']}', 'YYYY-MM-DD HH24:MI:SS')")
-        print(");")
-    
-    print("\n" + "=" * 120)
-    print("SQL INSERT 문 (REP_DATA_HG_FCST_GEN_GENT_DA)")
-    print("=" * 120)
-    
-    for i, case in enumerate(test_cases_hg_gen, 1):
-        print(f"\n-- HG_GEN 테스트케이스 {i}")
-        print("INSERT INTO REP_DATA_HG_FCST_GEN_GENT_DA (")
-        print("    AREA_GRP_CD, AREA_GRP_ID, CRTN_TM, FCST_TM, LEAD_TM, FCST_PROD_CD,")
-        print("    FCST_QGEN, FCST_CAPA, REG_DATE, UPD_DATE")
-        print(") VALUES (")
-        print(f"    '{case['AREA_GRP_CD']}', '{case['AREA_GRP_ID']}', '{case['CRTN_TM']}', '{case['FCST_TM']}', '{case['LEAD_TM']}', '{case['FCST_PROD_CD']}',")
-        print(f"    {case['FCST_QGEN']}, {case['FCST_CAPA']},")
-        print(f"    TO_TIMESTAMP('{case['REG_DATE']}', 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP('{case['UPD_DATE']}', 'YYYY-MM-DD HH24:MI:SS')")
-        print(");")
-    
-    print("\n" + "=" * 120)
-    print("SQL INSERT 문 (REP_DATA_HG_MEAS_GEM_GENT_DA)")
-    print("=" * 120)
-    
-    for i, case in enumerate(test_cases_hg_meas, 1):
-        print(f"\n-- HG_MEAS 테스트케이스 {i}")
-        print("INSERT INTO REP_DATA_HG_MEAS_GEM_GENT_DA (")
-        print("    TM, AREA_GRP_CD, AREA_GRP_ID, HGEN_PROD, HGEN_CAPA,")
-        print("    REG_DATE, UPD_DATE")
-        print(") VALUES (")
-        print(f"    '{case['TM']}', '{case['AREA_GRP_CD']}', '{case['AREA_GRP_ID']}', {case['HGEN_PROD']}, {case['HGEN_CAPA']},")
-        print(f"    TO_TIMESTAMP('{case['REG_DATE']}', 'YYYY-MM-DD HH24:MI:SS'), TO_TIMESTAMP('{case['UPD_DATE']}', 'YYYY-MM-DD HH24:MI:SS')")
-        print(");")
-
-def run_daily_simulation(next_day=False, only_tables=None):
+    테이블 하나의 TableData를 load_test_cases로 적재 (커밋은 호출하는 쪽에서)
+    
+    Returns:
+        tuple: (적재 행 수, 거부 행 수)
     """
-    일일 시뮬레이션 실행 함수
+    test_cases = [cases if table_name == cases.table_name else TableData(table_name) for table_name in TABLE_LABELS]
+    counts, rejected = load_test_cases(connection, *test_cases, loader=loader)
+    label = TABLE_LABELS[cases.table_name]
+    return counts[label], rejected[label]
+
+def run_replay(files=None, shift_to=None, only_tables=None, loader='copy', speed=None, chunk_size=None, stop_event=None):
+    """
+    덤프 재생 모드
+    rep_data_*.csv 덤프를 청크 단위로 읽어 데이터베이스에 적재합니다.
+    
+    speed가 없으면 파일마다 청크 단위로 바로 적재(청크마다 커밋)하고,
+    speed가 있으면 모든 파일을 기준 시각(CRTN_TM/TM) 순으로 합쳐서 가속 시계에 맞춰
+    같은 시각의 행을 한 트랜잭션으로 흘려보냅니다. (speed=1440이면 실제 1분에 하루)
     
     Args:
-        next_day (bool): True이면 다음날 데이터 생성, False이면 오늘 데이터 생성
-        only_tables (list): None이면 모든 테이블 생성, 리스트가 있으면 해당 테이블만 생성
-                           가능한 값: ['HG_GEN', 'HG_MEAS']
+        files (list): 덤프 파일 경로 목록 (None이면 find_replay_files())
+        shift_to (date): 지정하면 가장 이른 기준 시각의 날짜가 shift_to가 되도록 모든 일시를 일 단위로 이동
+        only_tables (list): None이면 모든 덤프, 리스트가 있으면 해당 테이블 라벨의 덤프만 재생
+        loader (str): 적재 방식 ('copy', 'executemany', 'row')
+        speed (float): 스트리밍 재생 배속 (None이면 일괄 적재)
+        chunk_size (int): 한 번에 읽을 행 수 (None이면 DB_BATCH_SIZE)
+        stop_event (threading.Event): 설정되면 스트리밍 재생을 종료
+    
+    Returns:
+        dict: 테이블 라벨별 적재 행 수
     """
-    date_label = "다음날" if next_day else "오늘"
-    table_label = ""
-    if only_tables:
-        table_label = f" - 선택된 테이블: {', '.join(only_tables)}"
+    files = files or find_replay_files()
+    selected = {t.upper() for t in only_tables} if only_tables else None
+    sources = []
+    for path in files:
+        table_name = replay_table_name(path)
+        if selected is None or TABLE_LABELS[table_name] in selected:
+            sources.append((path, table_name))
+    if not sources:
+        print("❌ 재생할 덤프 파일이 없습니다.")
+        return {}
+    
+    first_times = [t for t in (_first_replay_time(path, table_name) for path, table_name in sources) if t]
+    day_shift = 0
+    if shift_to is not None and first_times:
+        day_shift = (shift_to - min(first_times).date()).days
     
     print(f"\n{'='*60}")
-    print(f"일일 에너지 데이터 시뮬레이션 시작 ({date_label}){table_label} - {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"덤프 재생 시작: {len(sources)}개 파일, {'배속 x' + format(speed, 'g') if speed else '일괄 적재'}, 날짜 이동 {day_shift:+d}일 (적재 방식: {loader})")
     print(f"{'='*60}")
     
-    # 랜덤 시드 설정 (재현 가능한 결과를 위해)
-    random.seed(int(time.time()))
+    connection = acquire_connection()
+    if not connection:
+        print("❌ 데이터베이스 연결에 실패했습니다.")
+        return {}
+    ensure_schema(connection)
     
-    # 00시부터 23시까지의 데이터 생성 (24시간 운영, 24개 시간대)
-    test_cases_lfd, test_cases_gen, test_cases_nwp, test_cases_kpx, test_cases_curt, test_cases_hg_gen, test_cases_hg_meas = generate_random_test_cases(next_day=next_day, only_tables=only_tables)
+    started = time.perf_counter()
+    totals = {}
+    try:
+        if not speed:
+            for path, table_name in sources:
+                label = TABLE_LABELS[table_name]
+                file_started = time.perf_counter()
+                for chunk in read_replay_chunks(path, table_name, chunk_size, day_shift):
+                    try:
+                        inserted, _ = _load_table_data(connection, chunk, loader)
+                        commit_transaction(connection)
+                    except psycopg2.Error as e:
+                        connection.rollback()
+                        print(f"❌ {os.path.basename(path)} 청크 적재 실패 (롤백): {str(e).strip()}")
+                        continue
+                    totals[label] = totals.get(label, 0) + inserted
+                file_elapsed = time.perf_counter() - file_started
+                print(f"✅ {os.path.basename(path)} → {table_name}: {totals.get(label, 0):,}행 ({totals.get(label, 0) / max(file_elapsed, 1e-9):,.0f} rows/s)")
+        else:
+            groups = heapq.merge(*(_replay_groups(path, table_name, chunk_size, day_shift) for path, table_name in sources), key=lambda group: group[0])
+            start = (min(first_times) + datetime.timedelta(days=day_shift)) if first_times else None
+            clock = SimulatedClock(start=start, speed=speed)
+            for key, slot_groups in itertools.groupby(groups, key=lambda group: group[0]):
+                slot_time = datetime.datetime.strptime(key, "%Y%m%d%H%M")
+                clock.sleep_until(slot_time, stop_event)
+                if stop_event is not None and stop_event.is_set():
+                    break
+                slot_counts = {}
+                try:
+                    for _, table_name, cases in slot_groups:
+                        inserted, _ = _load_table_data(connection, cases, loader)
+                        slot_counts[TABLE_LABELS[table_name]] = slot_counts.get(TABLE_LABELS[table_name], 0) + inserted
+                    commit_transaction(connection)
+                except psycopg2.Error as e:
+                    connection.rollback()
+                    print(f"❌ [{slot_time:%Y-%m-%d %H:%M}] 적재 실패 (롤백): {str(e).strip()}")
+                    continue
+                for label, count in slot_counts.items():
+                    totals[label] = totals.get(label, 0) + count
+                print(f"[{slot_time:%Y-%m-%d %H:%M}] {', '.join(f'{label} {count}행' for label, count in slot_counts.items())} 커밋 (누적 {sum(totals.values()):,}행)")
+    except KeyboardInterrupt:
+        print("\n덤프 재생을 중단합니다.")
+    finally:
+        release_connection(connection)
     
-    # 결과 출력 (주석처리)
-    # print_test_cases(test_cases_lfd, test_cases_gen, test_cases_nwp, test_cases_kpx, test_cases_curt, test_cases_hg_gen, test_cases_hg_meas)
+    elapsed = time.perf_counter() - started
+    total_rows = sum(totals.values())
+    print(f"\n덤프 재생 종료 - {total_rows:,}행, {elapsed:.1f}초 ({total_rows / max(elapsed, 1e-9):,.0f} rows/s)")
+    write_metrics_file()
+    return totals
+
+class RetryPolicy:
+    """
+    작업 재시도 정책
+    실패하면 base_delay초부터 두 배씩 늘려가며(최대 max_delay초) max_attempts번까지 시도합니다.
+    """
     
-    # PostgreSQL에 데이터 삽입 시도
-    print(f"\n{'='*60}")
-    print("PostgreSQL 데이터 삽입 시도")
-    print(f"{'='*60}")
+    def __init__(self, max_attempts=3, base_delay=5.0, max_delay=300.0):
+        if max_attempts < 1:
+            raise ValueError(f"시도 횟수는 1 이상이어야 합니다: {max_attempts}")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
     
-    success = insert_data_to_postgresql(test_cases_lfd, test_cases_gen, test_cases_nwp, test_cases_kpx, test_cases_curt, test_cases_hg_gen, test_cases_hg_meas, only_tables=only_tables)
+    def delay(self, attempt):
+        """
+        attempt번째 실패 후 다음 시도까지 대기할 시간 (초)
+        """
+        return min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+
+class ScheduledJob:
+    """
+    스케줄러에 등록하는 주기 작업
+    실행 시점은 자정부터 interval 간격으로 맞춰지며, action(slot_time)은 별도 스레드에서 실행됩니다.
+    action이 예외를 던지면 retry_policy에 따라 같은 시점을 다시 시도합니다.
+    """
     
-    if success:
-        print(f"\n일일 시뮬레이션이 성공적으로 완료되었습니다! - {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    else:
-        print(f"\n⚠️ 데이터베이스 연결에 실패했지만 데이터는 성공적으로 생성되었습니다. - {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    def __init__(self, name, interval, action, retry_policy=None):
+        if interval <= datetime.timedelta(0) or datetime.timedelta(days=1) % interval:
+            raise ValueError(f"실행 간격은 하루를 나누어떨어지게 하는 양수여야 합니다: {interval}")
+        self.name = name
+        self.interval = interval
+        self.action = action
+        self.retry_policy = retry_policy or RetryPolicy()
     
-    # SQL INSERT 문도 함께 생성 (참고용) - 주석처리
-    # generate_sql_insert_statements(test_cases_lfd, test_cases_gen, test_cases_nwp, test_cases_kpx, test_cases_curt, test_cases_hg_gen, test_cases_hg_meas)
+    def next_run(self, after):
+        """
+        after 이후(after 제외) 첫 실행 시점
+        """
+        midnight = after.replace(hour=0, minute=0, second=0, microsecond=0)
+        return midnight + ((after - midnight) // self.interval + 1) * self.interval
+
+# 스케줄러의 일일 예측 작업이 생성하는 테이블 (KPX/HG_MEAS는 별도 주기 작업)
+DAILY_FORECAST_TABLES = ('LFD', 'GEN', 'NWP', 'CURT', 'HG_GEN')
+
+async def _wait_for_stop(stop_event, timeout):
+    """
+    timeout초 동안 대기 (그 전에 stop_event가 설정되면 True 반환)
+    """
+    try:
+        await asyncio.wait_for(stop_event.wait(), timeout=max(0.0, timeout))
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+async def _run_scheduled_job(job, stop_event):
+    """
+    하나의 주기 작업을 stop_event가 설정될 때까지 반복 실행
+    블로킹 DB 작업은 asyncio.to_thread로 넘겨 다른 작업의 주기를 막지 않습니다.
+    시점마다 재시도 대기를 포함한 소요 시간과 재시도/실패 여부를 METRICS의 'job' 단계로 기록합니다.
+    """
+    last_slot = None
+    while not stop_event.is_set():
+        now = datetime.datetime.now()
+        slot_time = job.next_run(max(now, last_slot) if last_slot else now)
+        print(f"[{job.name}] 다음 실행 시간: {slot_time:%Y-%m-%d %H:%M:%S}")
+        if await _wait_for_stop(stop_event, (slot_time - datetime.datetime.now()).total_seconds()):
+            break
+        last_slot = slot_time
+        
+        policy = job.retry_policy
+        started = time.perf_counter()
+        for attempt in range(1, policy.max_attempts + 1):
+            try:
+                await asyncio.to_thread(job.action, slot_time)
+                METRICS.record('job', job.name, time.perf_counter() - started, retries=attempt - 1)
+                break
+            except Exception as e:
+                if attempt >= policy.max_attempts:
+                    print(f"❌ [{job.name}] {slot_time:%Y-%m-%d %H:%M} 실행 실패, 재시도 횟수를 모두 사용했습니다: {e}")
+                    METRICS.record('job', job.name, time.perf_counter() - started, retries=attempt - 1, errors=1)
+                    break
+                delay = policy.delay(attempt)
+                print(f"⚠️ [{job.name}] {slot_time:%Y-%m-%d %H:%M} 실행 실패, {delay:.0f}초 후 다시 시도합니다 ({attempt}/{policy.max_attempts}): {e}")
+                if await _wait_for_stop(stop_event, delay):
+                    return
+        write_metrics_file()
+
+def _daily_forecast_job(loader, engine, seed=None, incremental=False):
+    """
+    자정마다 당일 예측 테이블(LFD/GEN/NWP/CURT/HG_GEN)을 생성하는 작업
+    incremental이면 워터마크 이후만 적재하므로 재시도나 재시작 때 이미 적재된 행과 충돌하지 않습니다.
+    """
+    def action(slot_time):
+        if incremental:
+            if run_incremental(end_date=slot_time.date(), only_tables=list(DAILY_FORECAST_TABLES), loader=loader, engine=engine, seed=seed) is None:
+                raise RuntimeError("데이터베이스 연결 실패")
+            return
+        if not run_daily_simulation(only_tables=list(DAILY_FORECAST_TABLES), loader=loader, engine=engine, target_date=slot_time.date(), seed=seed):
+            raise RuntimeError("데이터베이스 적재 실패")
+    return action
+
+def _partition_maintenance_job():
+    """
+    매일 앞으로의 파티션을 미리 만들고, 보존 기간(DB_RETENTION_DAYS)이 지난 파티션을 DROP하는 작업
+    """
+    def action(slot_time):
+        with db_session() as connection:
+            if not connection:
+                raise RuntimeError("데이터베이스 연결 실패")
+            cursor = connection.cursor()
+            try:
+                created = create_upcoming_partitions(cursor, today=slot_time.date())
+                commit_transaction(connection)
+            except psycopg2.Error:
+                connection.rollback()
+                raise
+            finally:
+                cursor.close()
+            retention_days = get_retention_days()
+            dropped = drop_expired_partitions(connection, retention_days, today=slot_time.date()) if retention_days is not None else {}
+        print(f"[{slot_time:%Y-%m-%d %H:%M}] 파티션 생성 {len(created)}개, 삭제 {sum(dropped.values())}개")
+    return action
+
+def _realtime_job(tables, loader, seed=None):
+    """
+    매 시점마다 실시간 테이블(KPX/HG_MEAS)을 생성해 커밋하는 작업
+    """
+    def action(slot_time):
+        with db_session() as connection:
+            if not connection:
+                raise RuntimeError("데이터베이스 연결 실패")
+            try:
+                counts, _ = _load_realtime_slot(connection, slot_time, tables, seed, loader=loader)
+                commit_transaction(connection)
+            except psycopg2.Error:
+                connection.rollback()
+                raise
+        print(f"[{slot_time:%Y-%m-%d %H:%M}] {', '.join(f'{label} {counts[label]}행' for label in tables)} 커밋")
+    return action
 
-def wait_until_midnight():
+async def run_async_scheduler(loader='copy', engine='python', jobs=None, stop_event=None, seed=None, incremental=False):
     """
-    다음 자정까지 대기하는 함수
+    asyncio 기반 스케줄러
+    여러 작업을 한 프로세스에서 각자의 주기와 재시도 정책으로 실행합니다.
+    
+    기본 작업:
+        - 일일 예측 (LFD/GEN/NWP/CURT/HG_GEN): 매일 자정
+        - KPX: 5분마다
+        - HG_MEAS: 1시간마다
+        - 파티션 관리 (DB_PARTITION을 지정한 경우): 매일 자정 - 앞으로의 파티션 생성, 보존 기간이 지난 파티션 삭제
+    
+    SIGINT/SIGTERM을 받으면 대기 중인 작업은 바로 멈추고, 실행 중인 작업은 현재 시점을 마친 뒤 종료합니다.
+    
+    Args:
+        loader (str): 적재 방식 ('copy', 'executemany', 'row')
+        engine (str): 일일 예측 생성 엔진 ('python', 'numpy')
+        jobs (list): ScheduledJob 목록 (None이면 기본 작업)
+        stop_event (asyncio.Event): 설정되면 스케줄러를 종료 (None이면 새로 만듦)
+        seed (int): 기준 난수 시드 (같은 시드면 날짜/시점마다 같은 데이터, None이면 매번 다른 데이터)
+        incremental (bool): True이면 시작할 때 오늘 예측 테이블의 빠진 시점을 먼저 채우고, 일일 예측도 워터마크 이후만 적재
     """
-    now = datetime.datetime.now()
-    next_midnight = now.replace(hour=0, minute=0, second=0, microsecond=0) + datetime.timedelta(days=1)
-    wait_seconds = (next_midnight - now).total_seconds()
+    daily_action = _daily_forecast_job(loader, engine, seed, incremental)
+    if jobs is None:
+        jobs = [
+            ScheduledJob('DAILY', datetime.timedelta(days=1), daily_action, RetryPolicy(max_attempts=5, base_delay=60.0, max_delay=900.0)),
+            ScheduledJob('KPX', datetime.timedelta(minutes=5), _realtime_job(('KPX',), loader, seed), RetryPolicy(max_attempts=3, base_delay=5.0, max_delay=60.0)),
+            ScheduledJob('HG_MEAS', datetime.timedelta(hours=1), _realtime_job(('HG_MEAS',), loader, seed), RetryPolicy(max_attempts=3, base_delay=10.0, max_delay=300.0)),
+        ]
+        if get_partition_granularity():
+            jobs.append(ScheduledJob('PARTITION', datetime.timedelta(days=1), _partition_maintenance_job(), RetryPolicy(max_attempts=3, base_delay=60.0, max_delay=600.0)))
+    stop_event = stop_event or asyncio.Event()
+    
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, stop_event.set)
+        except (NotImplementedError, RuntimeError):
+            pass  # Windows 등에서는 KeyboardInterrupt로 종료
     
-    print(f"다음 실행 시간: {next_midnight.strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"대기 시간: {wait_seconds:.0f}초")
+    # 작업들이 동시에 DDL을 실행하지 않도록 시작 전에 한 번만 확인
+    with db_session() as connection:
+        if connection:
+            ensure_schema(connection)
+        else:
+            print("⚠️ 데이터베이스 연결에 실패했습니다. 각 작업이 실행 시점에 다시 연결합니다.")
+    
+    # 자정을 놓쳤거나 중단된 뒤 재시작하면 다음 자정까지 기다리지 않고 오늘 예측을 먼저 따라잡음
+    if incremental:
+        try:
+            await asyncio.to_thread(daily_action, datetime.datetime.now())
+        except RuntimeError as e:
+            print(f"⚠️ 시작 시 증분 생성 실패 ({e}) - 다음 일일 예측 시점에 다시 시도합니다.")
     
-    time.sleep(wait_seconds)
+    print(f"스케줄러 시작: {', '.join(f'{job.name}({job.interval})' for job in jobs)}")
+    try:
+        await asyncio.gather(*(_run_scheduled_job(job, stop_event) for job in jobs))
+    finally:
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.remove_signal_handler(signum)
+            except (NotImplementedError, RuntimeError):
+                pass
+        close_connection_pool()
+        print("\n스케줄러가 종료되었습니다.")
 
-def scheduler_loop():
+def scheduler_loop(loader='copy', engine='python', seed=None, incremental=False):
     """
-    스케줄러 루프
+    스케줄러 루프 (asyncio 스케줄러 실행)
     """
-    while True:
-        try:
-            # 다음 자정까지 대기
-            wait_until_midnight()
-            
-            # 시뮬레이션 실행
-            run_daily_simulation()
-            
-        except KeyboardInterrupt:
-            print("\n프로그램이 종료되었습니다.")
-            break
-        except Exception as e:
-            print(f"오류 발생: {e}")
-            print("1분 후 다시 시도합니다...")
-            time.sleep(60)
+    try:
+        asyncio.run(run_async_scheduler(loader=loader, engine=engine, seed=seed, incremental=incremental))
+    except KeyboardInterrupt:
+        print("\n프로그램이 종료되었습니다.")
+
+def get_cli_option(argv, name, default=None):
+    """
+    명령행 인자에서 '--옵션 값' 형태의 값을 읽는 함수
+    """
+    if name in argv:
+        idx = argv.index(name)
+        if idx + 1 < len(argv):
+            return argv[idx + 1].strip()
+    return default
 
 if __name__ == "__main__":
     import sys
     
+    # 적재 청크 크기, 테이블 동시 적재 수, 생성 버퍼와 거부 행 기록 파일 (모든 모드 공통, 지정하면 환경변수보다 우선)
+    batch_size_value = get_cli_option(sys.argv, "--batch-size")
+    if batch_size_value:
+        if not batch_size_value.isdigit() or int(batch_size_value) <= 0:
+            print(f"❌ 잘못된 청크 크기입니다 (--batch-size는 양의 정수): {batch_size_value}")
+            sys.exit(1)
+        os.environ['DB_BATCH_SIZE'] = batch_size_value
+    concurrency_value = get_cli_option(sys.argv, "--concurrency")
+    if concurrency_value:
+        if not concurrency_value.isdigit() or int(concurrency_value) <= 0:
+            print(f"❌ 잘못된 동시 적재 수입니다 (--concurrency는 양의 정수): {concurrency_value}")
+            sys.exit(1)
+        os.environ['DB_LOAD_CONCURRENCY'] = concurrency_value
+    buffer_days_value = get_cli_option(sys.argv, "--buffer-days")
+    if buffer_days_value:
+        if not buffer_days_value.isdigit() or int(buffer_days_value) <= 0:
+            print(f"❌ 잘못된 버퍼 크기입니다 (--buffer-days는 양의 정수): {buffer_days_value}")
+            sys.exit(1)
+        os.environ['PIPELINE_BUFFER_DAYS'] = buffer_days_value
+    dead_letter_value = get_cli_option(sys.argv, "--dead-letter")
+    if dead_letter_value:
+        os.environ['DEAD_LETTER_FILE'] = dead_letter_value
+    if "--upsert" in sys.argv:
+        os.environ['DB_UPSERT'] = '1'
+    
+    # 증분 생성 워터마크 파일 (지정하지 않으면 --incremental 실행마다 DB에서 테이블별 MAX(CRTN_TM/TM) 조회)
+    watermark_file_value = get_cli_option(sys.argv, "--watermark-file")
+    if watermark_file_value:
+        os.environ['WATERMARK_FILE'] = watermark_file_value
+    
+    # 테이블 범위 분할 (새로 만드는 테이블만 분할, 적재할 때 필요한 파티션과 앞으로의 파티션을 자동 생성)
+    partition_value = get_cli_option(sys.argv, "--partition")
+    if partition_value:
+        os.environ['DB_PARTITION'] = partition_value
+    partition_ahead_value = get_cli_option(sys.argv, "--partition-ahead")
+    if partition_ahead_value:
+        if not partition_ahead_value.isdigit():
+            print(f"❌ 잘못된 파티션 수입니다 (--partition-ahead는 0 이상의 정수): {partition_ahead_value}")
+            sys.exit(1)
+        os.environ['DB_PARTITION_AHEAD'] = partition_ahead_value
+    keep_days_value = get_cli_option(sys.argv, "--keep-days")
+    if keep_days_value:
+        if not keep_days_value.isdigit():
+            print(f"❌ 잘못된 보존 일수입니다 (--keep-days는 0 이상의 정수): {keep_days_value}")
+            sys.exit(1)
+        os.environ['DB_RETENTION_DAYS'] = keep_days_value
+    try:
+        get_partition_granularity()
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    
+    # NWP 지점 수 (참조 덤프의 37개보다 크게 주면 가상 지점을 덧붙여 격자 규모로 생성)
+    nwp_sites_value = get_cli_option(sys.argv, "--nwp-sites")
+    if nwp_sites_value:
+        if not nwp_sites_value.isdigit() or int(nwp_sites_value) <= 0:
+            print(f"❌ 잘못된 NWP 지점 수입니다 (--nwp-sites는 양의 정수): {nwp_sites_value}")
+            sys.exit(1)
+        os.environ['NWP_SITE_COUNT'] = nwp_sites_value
+    
+    # 시간대 프로파일 파일 (시간대별 값 범위를 24/288슬롯 등의 표로 교체, 시작할 때 한 번 읽고 확인)
+    profile_file_value = get_cli_option(sys.argv, "--profile-file")
+    if profile_file_value:
+        os.environ['HOUR_PROFILE_FILE'] = profile_file_value
+    try:
+        get_hour_profiles()
+    except (OSError, ValueError) as e:
+        print(f"❌ 시간대 프로파일을 읽을 수 없습니다 ({get_hour_profile_path()}): {e}")
+        sys.exit(1)
+    
+    # 단계별 지표 내보내기 (파일: 실행/작업이 끝날 때마다 갱신, HTTP: 스케줄링/실시간 피드 모드에서 수집)
+    metrics_file_value = get_cli_option(sys.argv, "--metrics-file")
+    if metrics_file_value:
+        os.environ['METRICS_FILE'] = metrics_file_value
+    metrics_port_value = get_cli_option(sys.argv, "--metrics-port", os.getenv('METRICS_PORT'))
+    if metrics_port_value:
+        if not metrics_port_value.isdigit():
+            print(f"❌ 잘못된 지표 포트입니다 (--metrics-port는 정수): {metrics_port_value}")
+            sys.exit(1)
+        start_metrics_server(int(metrics_port_value))
+    
     if len(sys.argv) > 1:
         if sys.argv[1] == "--manual":
             # 수동 실행 모드
@@ -1192,35 +4292,278 @@ if __name__ == "__main__":
                     only_tables = [t.strip().upper() for t in only_value.split(',')]
                     print(f"선택된 테이블만 생성: {', '.join(only_tables)}")
             
-            run_daily_simulation(next_day=next_day, only_tables=only_tables)
+            # --loader 옵션 처리
+            loader = get_cli_option(sys.argv, "--loader", 'copy').lower()
+            if loader not in LOADERS:
+                print(f"❌ 지원하지 않는 적재 방식입니다: {loader} (가능한 값: {', '.join(LOADERS)})")
+                sys.exit(1)
+            
+            # --engine 옵션 처리
+            engine = get_cli_option(sys.argv, "--engine", 'python').lower()
+            if engine not in ENGINES:
+                print(f"❌ 지원하지 않는 생성 엔진입니다: {engine} (가능한 값: {', '.join(ENGINES)})")
+                sys.exit(1)
+            print(f"생성 엔진: {engine}, 적재 방식: {loader}")
+            
+            # --seed 옵션 처리 (하루치 실행과 기간 백필 공통)
+            try:
+                seed = parse_seed(get_cli_option(sys.argv, "--seed"))
+            except ValueError as e:
+                print(f"❌ 잘못된 시드입니다 (--seed는 0 이상의 정수): {e}")
+                sys.exit(1)
+            
+            # --from/--to 옵션이 있으면 기간 백필 모드 (--incremental이면 워터마크 이후만 증분 생성)
+            from_value = get_cli_option(sys.argv, "--from")
+            to_value = get_cli_option(sys.argv, "--to")
+            if "--incremental" in sys.argv:
+                try:
+                    start_date = datetime.datetime.strptime(from_value, "%Y%m%d").date() if from_value else None
+                    end_date = datetime.datetime.strptime(to_value, "%Y%m%d").date() if to_value else None
+                except ValueError as e:
+                    print(f"❌ 잘못된 증분 생성 옵션입니다 (--from/--to는 YYYYMMDD): {e}")
+                    sys.exit(1)
+                if end_date is None and next_day:
+                    end_date = datetime.date.today() + datetime.timedelta(days=1)
+                run_incremental(start_date=start_date, end_date=end_date, only_tables=only_tables, loader=loader, engine=engine, seed=seed)
+            elif from_value or to_value:
+                try:
+                    start_date = datetime.datetime.strptime(from_value or to_value, "%Y%m%d").date()
+                    end_date = datetime.datetime.strptime(to_value or from_value, "%Y%m%d").date()
+                    batch_days = int(get_cli_option(sys.argv, "--batch-days", 7))
+                    workers = int(get_cli_option(sys.argv, "--workers", 1))
+                except ValueError as e:
+                    print(f"❌ 잘못된 백필 옵션입니다 (--from/--to는 YYYYMMDD, --batch-days/--workers는 정수): {e}")
+                    sys.exit(1)
+                run_backfill(start_date, end_date, only_tables=only_tables, loader=loader, engine=engine, batch_days=batch_days, workers=workers, seed=seed)
+            else:
+                run_daily_simulation(next_day=next_day, only_tables=only_tables, loader=loader, engine=engine, seed=seed)
+        elif sys.argv[1] == "--stream":
+            # 실시간 피드 모드
+            print("실시간 피드 모드")
+            try:
+                stream_tables = [t.strip().upper() for t in get_cli_option(sys.argv, "--only", ','.join(STREAM_TABLES)).split(',')]
+                interval_minutes = int(get_cli_option(sys.argv, "--interval", 5))
+                speed = float(get_cli_option(sys.argv, "--speed", 1))
+                start_value = get_cli_option(sys.argv, "--start")
+                start = datetime.datetime.strptime(start_value, "%Y%m%d%H%M") if start_value else None
+                slots_value = get_cli_option(sys.argv, "--slots")
+                max_slots = int(slots_value) if slots_value else None
+                seed = parse_seed(get_cli_option(sys.argv, "--seed"))
+            except ValueError as e:
+                print(f"❌ 잘못된 실시간 피드 옵션입니다: {e}")
+                sys.exit(1)
+            unknown_tables = [t for t in stream_tables if t not in STREAM_TABLES]
+            if unknown_tables or interval_minutes <= 0 or speed <= 0:
+                print(f"❌ 잘못된 실시간 피드 옵션입니다 (--only 가능한 값: {', '.join(STREAM_TABLES)}, --interval/--speed는 0보다 커야 함)")
+                sys.exit(1)
+            loader = get_cli_option(sys.argv, "--loader", 'copy').lower()
+            if loader not in LOADERS:
+                print(f"❌ 지원하지 않는 적재 방식입니다: {loader} (가능한 값: {', '.join(LOADERS)})")
+                sys.exit(1)
+            run_stream(tables=stream_tables, interval_minutes=interval_minutes, speed=speed, start=start, max_slots=max_slots, loader=loader, seed=seed, resume="--incremental" in sys.argv)
+        elif sys.argv[1] == "--schedule":
+            # 옵션을 지정한 스케줄링 모드 (--loader, --engine, --metrics-port 등)
+            loader = get_cli_option(sys.argv, "--loader", 'copy').lower()
+            engine = get_cli_option(sys.argv, "--engine", 'python').lower()
+            if loader not in LOADERS or engine not in ENGINES:
+                print(f"❌ 잘못된 스케줄링 옵션입니다 (--loader 가능한 값: {', '.join(LOADERS)}, --engine 가능한 값: {', '.join(ENGINES)})")
+                sys.exit(1)
+            try:
+                seed = parse_seed(get_cli_option(sys.argv, "--seed"))
+            except ValueError as e:
+                print(f"❌ 잘못된 시드입니다 (--seed는 0 이상의 정수): {e}")
+                sys.exit(1)
+            print(f"스케줄링 모드 - 생성 엔진: {engine}, 적재 방식: {loader}" + (f", 시드: {seed}" if seed is not None else ""))
+            print("프로그램을 종료하려면 Ctrl+C를 누르세요.")
+            scheduler_loop(loader=loader, engine=engine, seed=seed, incremental="--incremental" in sys.argv)
+        elif sys.argv[1] == "--export":
+            # 파일 내보내기 모드
+            print("파일 내보내기 모드")
+            only_tables = None
+            only_value = get_cli_option(sys.argv, "--only")
+            if only_value:
+                only_tables = [t.strip().upper() for t in only_value.split(',')]
+            export_format = get_cli_option(sys.argv, "--format", 'csv').lower()
+            engine = get_cli_option(sys.argv, "--engine", 'python').lower()
+            if export_format not in EXPORT_FORMATS or engine not in ENGINES:
+                print(f"❌ 잘못된 내보내기 옵션입니다 (--format 가능한 값: {', '.join(EXPORT_FORMATS)}, --engine 가능한 값: {', '.join(ENGINES)})")
+                sys.exit(1)
+            try:
+                from_value = get_cli_option(sys.argv, "--from")
+                to_value = get_cli_option(sys.argv, "--to")
+                start_date = datetime.datetime.strptime(from_value or to_value, "%Y%m%d").date() if (from_value or to_value) else None
+                end_date = datetime.datetime.strptime(to_value or from_value, "%Y%m%d").date() if (from_value or to_value) else None
+                seed = parse_seed(get_cli_option(sys.argv, "--seed"))
+            except ValueError as e:
+                print(f"❌ 잘못된 내보내기 옵션입니다 (--from/--to는 YYYYMMDD, --seed는 0 이상의 정수): {e}")
+                sys.exit(1)
+            try:
+                run_export(get_cli_option(sys.argv, "--output", 'export'), fmt=export_format, start_date=start_date, end_date=end_date, only_tables=only_tables, engine=engine, seed=seed)
+            except RuntimeError as e:
+                print(f"❌ {e}")
+                sys.exit(1)
+        elif sys.argv[1] == "--replay":
+            # 덤프 재생 모드
+            print("덤프 재생 모드")
+            files_value = get_cli_option(sys.argv, "--files")
+            replay_files = [f.strip() for f in files_value.split(',')] if files_value else None
+            only_value = get_cli_option(sys.argv, "--only")
+            only_tables = [t.strip().upper() for t in only_value.split(',')] if only_value else None
+            loader = get_cli_option(sys.argv, "--loader", 'copy').lower()
+            if loader not in LOADERS:
+                print(f"❌ 지원하지 않는 적재 방식입니다: {loader} (가능한 값: {', '.join(LOADERS)})")
+                sys.exit(1)
+            try:
+                shift_value = get_cli_option(sys.argv, "--shift-to")
+                shift_to = datetime.datetime.strptime(shift_value, "%Y%m%d").date() if shift_value else None
+                if "--shift" in sys.argv:
+                    shift_to = datetime.date.today()
+                speed_value = get_cli_option(sys.argv, "--speed")
+                speed = float(speed_value) if speed_value else None
+                if speed is not None and speed <= 0:
+                    raise ValueError(f"배속은 0보다 커야 합니다: {speed}")
+                run_replay(files=replay_files, shift_to=shift_to, only_tables=only_tables, loader=loader, speed=speed)
+            except ValueError as e:
+                print(f"❌ 잘못된 재생 옵션입니다 (--shift-to는 YYYYMMDD, --speed는 양수, 파일명은 rep_data_..._YYYYMMDDHHMI.csv): {e}")
+                sys.exit(1)
         elif sys.argv[1] == "--truncate":
             # 테이블 데이터 삭제 모드
             print("테이블 데이터 삭제 모드")
-            connection = get_db_connection()
-            if connection:
-                create_table_if_not_exists(connection)
-                truncate_all_tables(connection)
-                connection.close()
-            else:
-                print("❌ 데이터베이스 연결에 실패했습니다.")
+            with db_session() as connection:
+                if connection:
+                    ensure_schema(connection)
+                    truncate_all_tables(connection)
+                else:
+                    print("❌ 데이터베이스 연결에 실패했습니다.")
+        elif sys.argv[1] == "--purge":
+            # 선택 삭제 모드 (--only 테이블, --from/--to 기간만 삭제)
+            print("선택 삭제 모드")
+            only_value = get_cli_option(sys.argv, "--only")
+            only_tables = [t.strip().upper() for t in only_value.split(',')] if only_value else None
+            from_value = get_cli_option(sys.argv, "--from")
+            to_value = get_cli_option(sys.argv, "--to")
+            try:
+                unknown = [label for label in only_tables or [] if label not in LABEL_TABLES]
+                if unknown:
+                    raise ValueError(f"알 수 없는 테이블: {', '.join(unknown)} (가능한 값: {', '.join(LABEL_TABLES)})")
+                start_date = datetime.datetime.strptime(from_value, "%Y%m%d").date() if from_value else None
+                end_date = datetime.datetime.strptime(to_value, "%Y%m%d").date() if to_value else None
+                if start_date and end_date and end_date < start_date:
+                    raise ValueError(f"종료일({end_date:%Y%m%d})이 시작일({start_date:%Y%m%d})보다 앞섭니다.")
+            except ValueError as e:
+                print(f"❌ 잘못된 삭제 옵션입니다 (--only는 테이블 라벨, --from/--to는 YYYYMMDD): {e}")
+                sys.exit(1)
+            range_label = f"{start_date:%Y%m%d}" if start_date else "처음"
+            range_label += f" ~ {end_date:%Y%m%d}" if end_date else " ~ 끝"
+            print(f"대상: {', '.join(only_tables) if only_tables else '모든 테이블'}, 기간: {range_label if start_date or end_date else '전체 (TRUNCATE)'}")
+            with db_session() as connection:
+                if connection:
+                    ensure_schema(connection)
+                    started = time.perf_counter()
+                    purged = purge_tables(connection, only_tables=only_tables, start_date=start_date, end_date=end_date)
+                    deleted = sum(rows for rows in purged.values() if rows)
+                    print(f"\n✅ 선택 삭제 완료 - {len(purged)}개 테이블, {deleted:,}행, {time.perf_counter() - started:.1f}초 - {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+                else:
+                    print("❌ 데이터베이스 연결에 실패했습니다.")
+        elif sys.argv[1] == "--retention":
+            # 파티션 보존 기간 정리 모드
+            print("파티션 보존 기간 정리 모드")
+            retention_days = get_retention_days()
+            if retention_days is None:
+                print("❌ 보존 일수를 지정하세요. (예: --retention --keep-days 90)")
+                sys.exit(1)
+            only_value = get_cli_option(sys.argv, "--only")
+            only_tables = [t.strip().upper() for t in only_value.split(',')] if only_value else None
+            with db_session() as connection:
+                if connection:
+                    ensure_schema(connection)
+                    dropped = drop_expired_partitions(connection, retention_days, only_tables=only_tables)
+                    print(f"\n✅ 보존 기간({retention_days}일)이 지난 파티션 {sum(dropped.values())}개를 삭제했습니다. - {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+                else:
+                    print("❌ 데이터베이스 연결에 실패했습니다.")
         elif sys.argv[1] == "--help":
             # 도움말 표시
             print("에너지 데이터 시뮬레이터")
             print("=" * 50)
             print("사용법:")
-            print("  python energy_data_simulator.py                              # 스케줄링 모드 (매일 24시 자동 실행)")
+            print("  python energy_data_simulator.py                              # 스케줄링 모드 (매일 24시 예측, 5분 KPX, 1시간 HG_MEAS)")
             print("  python energy_data_simulator.py --manual                     # 수동 실행 모드 (오늘 데이터, 모든 테이블)")
             print("  python energy_data_simulator.py --manual --next-day          # 수동 실행 모드 (다음날 데이터)")
             print("  python energy_data_simulator.py --manual --only HG_GEN,HG_MEAS # 특정 테이블만 생성")
+            print("  python energy_data_simulator.py --manual --loader row        # 적재 방식 선택 (copy|executemany|row)")
+            print("  python energy_data_simulator.py --manual --engine numpy      # 생성 엔진 선택 (python|numpy|model)")
+            print("  python energy_data_simulator.py --manual --from 20250801 --to 20250831 # 기간 백필")
+            print("  python energy_data_simulator.py --manual --batch-size 1000   # 1000행 단위 청크 적재")
+            print("  python energy_data_simulator.py --manual --concurrency 4     # 테이블마다 별도 연결로 최대 4개 동시 적재")
+            print("  python energy_data_simulator.py --manual --upsert            # 같은 날짜를 다시 적재해도 중복 없이 덮어쓰기")
+            print("  python energy_data_simulator.py --manual --incremental --seed 42 # 테이블별 마지막 적재 시각 이후만 생성/적재")
+            print("  python energy_data_simulator.py --schedule --metrics-port 9108 # 스케줄링 모드 + Prometheus 지표 (/metrics)")
+            print("  python energy_data_simulator.py --stream                     # 실시간 피드 모드 (KPX, HG_MEAS 5분 간격)")
+            print("  python energy_data_simulator.py --stream --speed 1440        # 가속 시계 (실제 1분에 하루)")
+            print("  python energy_data_simulator.py --export --format csv --from 20250801 --to 20250831 # 파일 내보내기")
+            print("  python energy_data_simulator.py --replay --shift             # rep_data_*.csv 덤프를 오늘 날짜로 옮겨 일괄 적재")
+            print("  python energy_data_simulator.py --replay --shift --speed 1440 # 덤프를 가속 시계에 맞춰 스트리밍")
             print("  python energy_data_simulator.py --truncate                   # 모든 테이블 데이터 삭제")
+            print("  python energy_data_simulator.py --manual --partition day     # 일 단위로 범위 분할한 테이블로 생성/적재")
+            print("  python energy_data_simulator.py --retention --keep-days 90   # 90일이 지난 파티션 삭제")
+            print("  python energy_data_simulator.py --purge --only GEN,NWP --from 20250801 --to 20250807  # 테이블/기간만 삭제")
             print("  python energy_data_simulator.py --help                       # 도움말 표시")
             print("")
             print("옵션 설명:")
             print("  --manual     : 수동으로 데이터를 생성합니다.")
             print("  --next-day   : 다음날 데이터를 생성합니다. (--manual과 함께 사용)")
             print("  --only       : 특정 테이블만 생성합니다. (예: --only HG_GEN,HG_MEAS)")
-            print("                가능한 값: HG_GEN, HG_MEAS")
+            print(f"                가능한 값: {', '.join(LABEL_TABLES)}")
+            print("  --loader     : 적재 방식을 선택합니다. (기본값: copy)")
+            print("                copy        - COPY ... FROM STDIN 일괄 적재")
+            print("                executemany - 여러 행을 묶어서 INSERT")
+            print("                row         - 행마다 INSERT (기존 방식)")
+            print("  --engine     : 데이터 생성 엔진을 선택합니다. (기본값: python)")
+            print("                python - 행 단위 random 생성 (기존 방식)")
+            print("                numpy  - 테이블별 배열 단위 생성 (numpy 필요)")
+            print("                model  - rep_data_*.csv 덤프에서 학습한 시간대/연료별 분포와 상관관계로 생성 (numpy 필요, 학습 결과는 .model_cache에 저장)")
+            print("  --from       : 백필 시작일 (YYYYMMDD, --manual과 함께 사용)")
+            print("  --to         : 백필 종료일 (YYYYMMDD, 포함)")
+            print("  --batch-days : 백필 시 한 트랜잭션으로 묶을 일수 (기본값: 7)")
+            print("  --workers    : 백필 병렬 워커 프로세스 수 (기본값: 1, 워커마다 별도 DB 연결)")
+            print("  --buffer-days: 백필/내보내기에서 적재보다 미리 생성해 둘 최대 일수 (기본값: 2, 생성과 적재를 겹쳐서 실행)")
+            print("  --partition  : 테이블을 CRTN_TM/TM 범위로 분할하여 생성 (day | month, 새로 만드는 테이블만, 적재할 때 파티션 자동 생성)")
+            print("  --partition-ahead: 미리 만들어 둘 앞으로의 파티션 수 (기본값: 3)")
+            print("  --keep-days  : 파티션 보존 일수 (--retention 모드, 스케줄링 모드에서는 매일 자정에 정리)")
+            print("  --seed       : 기준 난수 시드 (0 이상의 정수, 같은 시드와 날짜는 워커 수/테이블 조합과 관계없이 같은 데이터 생성)")
+            print("                --manual/--export/--stream/--schedule 공통, 지정하지 않으면 현재 시각을 시드로 쓰고 출력")
+            print("  --batch-size : 적재 청크 크기 (기본값: 5000행, 청크마다 세이브포인트/커밋)")
+            print("  --concurrency: 하루치 적재 시 동시에 적재할 테이블 수 (기본값: 1, 2 이상이면 테이블마다 별도 연결)")
+            print("  --dead-letter: 적재에 실패한 행을 기록할 파일 (기본값: dead_letter.jsonl)")
+            print("  --incremental: 테이블별 워터마크(마지막 적재 시각) 이후의 시점만 생성/적재합니다. (같은 --seed를 지정하면 중단 전과 이어지는 데이터)")
+            print("                --manual: 워터마크가 있는 날부터 오늘(--to/--next-day)까지, 워터마크가 없는 테이블은 --from부터")
+            print("                --stream: 워터마크 이후 빠진 5분 시점을 대기 없이 먼저 채운 뒤 실시간으로 계속")
+            print("                --schedule: 시작할 때 워터마크 이후 빠진 날짜부터 오늘까지 예측 테이블을 따라잡고, 일일 예측도 워터마크 이후만 적재")
+            print("  --watermark-file: 워터마크 파일 (JSON, 커밋마다 갱신, 없으면 DB에서 MAX(CRTN_TM/TM) 조회)")
+            print("  --upsert     : 모든 테이블을 기본키(LFD는 CRTN_TM, FCST_TM) 기준으로 병합 적재 (같은 날짜 재실행 가능)")
+            print("  --profile-file: 시간대 프로파일 JSON ({이름: [[하한, 상한], ...]}, 슬롯 수 24=1시간, 288=5분 등)")
+            print("                이름: " + ', '.join(HOUR_PROFILE_RANGES) + " (지정하지 않은 프로파일은 기본값)")
+            print("  --nwp-sites  : NWP 지점 수 (기본값: 참조 덤프의 37개, 더 크면 같은 형식의 가상 지점을 덧붙임)")
+            print("  --metrics-file: 단계별 지표 파일 (.prom/.txt는 Prometheus 텍스트, 그 외는 JSON)")
+            print("  --metrics-port: 단계별 지표 HTTP 포트 (/metrics, /metrics.json)")
+            print("  --stream     : 실시간 피드 모드로 KPX/HG_MEAS 데이터를 계속 생성합니다.")
+            print("                --only KPX,HG_MEAS : 내보낼 테이블 (기본값: 둘 다)")
+            print("                --interval 5       : 생성 간격 (시뮬레이션 기준 분)")
+            print("                --speed 1440       : 시계 배속 (1440이면 실제 1분에 하루)")
+            print("                --start 202508010000 : 시뮬레이션 시작 시각 (기본값: 현재 시각)")
+            print("                --slots 288        : 내보낼 시점 수 (기본값: 무제한)")
+            print("  --schedule   : 옵션(--loader, --engine, --metrics-port 등)을 지정해서 스케줄링 모드로 실행합니다.")
+            print("  --export     : DB 없이 테이블별 파일로 내보냅니다. (--from/--to/--only/--engine/--seed 함께 사용)")
+            print("                --format csv     : csv(덤프 형식) | sql(여러 행 INSERT) | copy(psql COPY 스크립트) | parquet(pyarrow 필요)")
+            print("                --output export  : 출력 디렉터리 (기본값: export)")
+            print("  --replay     : rep_data_*.csv 덤프를 데이터베이스에 재생합니다.")
+            print("                --files a.csv,b.csv : 재생할 덤프 (기본값: 스크립트 디렉터리의 rep_data_*.csv)")
+            print("                --only LFD,KPX      : 재생할 테이블")
+            print("                --shift             : 가장 이른 날짜가 오늘이 되도록 일시 이동 (--shift-to YYYYMMDD로 날짜 지정)")
+            print("                --speed 1440        : 기준 시각(CRTN_TM/TM)에 맞춰 스트리밍 (없으면 일괄 적재)")
             print("  --truncate   : 모든 테이블의 데이터를 삭제합니다.")
+            print("  --purge      : 선택한 테이블(--only)의 기간(--from/--to, 양 끝 포함) 데이터만 삭제합니다. (파티션은 DROP, 나머지는 배치 DELETE)")
+            print("  --retention  : 보존 기간(--keep-days)이 지난 파티션을 DROP합니다. (--partition으로 만든 테이블, --only로 테이블 선택)")
             print("  --help       : 이 도움말을 표시합니다.")
         else:
             print("사용법:")
@@ -1231,7 +4574,7 @@ if __name__ == "__main__":
             print("  python energy_data_simulator.py --help            # 도움말 표시")
     else:
         # 스케줄링 모드 (24시에 자동 실행)
-        print("스케줄링 모드 - 매일 24시(자정)에 자동 실행됩니다.")
+        print("스케줄링 모드 - 매일 24시(자정)에 예측 데이터, 5분마다 KPX, 1시간마다 HG_MEAS 데이터를 생성합니다.")
         print("수동 실행을 원하시면 'python energy_data_simulator.py --manual' 명령어를 사용하세요.")
         print("다음날 데이터를 생성하려면 'python energy_data_simulator.py --manual --next-day' 명령어를 사용하세요.")
         print("테이블 데이터를 삭제하려면 'python energy_data_simulator.py --truncate' 명령어를 사용하세요.")
@@ -0,0 +1,55 @@
+"""
+시드 재현성 테스트 - 같은 시드는 같은 행을, 테이블 선택(--only)은 다른 테이블 값을 바꾸지 않음 (DB 없이 실행)
+"""
+import datetime
+
+import pytest
+
+import energy_data_simulator as sim
+
+DAY = datetime.date(2025, 8, 1)
+SEED = 42
+ENGINES = ['python', 'numpy', 'model']
+
+
+@pytest.fixture(autouse=True)
+def model_cache_dir(tmp_path, monkeypatch):
+    # model 엔진의 학습 캐시를 저장소가 아닌 임시 디렉터리에 저장
+    monkeypatch.setenv('MODEL_CACHE_DIR', str(tmp_path))
+
+
+def _values(cases):
+    """
+    TableData의 컬럼별 값 (NaN은 None으로 바꿔 비교 가능하게)
+    """
+    return {
+        column: [None if value != value else value for value in cases.column(column)]
+        for column in cases.columns
+    }
+
+
+def _generate(engine, only_tables=None):
+    if engine != 'python' and sim.np is None:
+        pytest.skip("numpy가 필요합니다.")
+    return sim.generate_random_test_cases(only_tables=only_tables, engine=engine, target_date=DAY, seed=SEED)
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_same_seed_generates_same_rows(engine):
+    first = _generate(engine)
+    second = _generate(engine)
+    for first_cases, second_cases in zip(first, second):
+        assert first_cases.columns == second_cases.columns
+        assert len(first_cases) > 0
+        assert _values(first_cases) == _values(second_cases), first_cases.table_name
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_only_tables_does_not_change_selected_table(engine):
+    full = _generate(engine)
+    gen_index = list(sim.TABLE_SPECS).index('REP_DATA_RE_FCST_GEN_DA')
+    only_gen = _generate(engine, only_tables=['GEN'])
+    assert _values(only_gen[gen_index]) == _values(full[gen_index])
+    for index, cases in enumerate(only_gen):
+        if index != gen_index:
+            assert len(cases) == 0, cases.table_name
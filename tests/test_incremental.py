@@ -0,0 +1,70 @@
+"""
+증분 생성(--incremental)의 워터마크 처리 테스트 (DB 없이 실행)
+"""
+import datetime
+
+import energy_data_simulator as sim
+
+D = datetime.date(2025, 8, 10)
+
+
+def _kpx_day(day):
+    return sim.generate_random_test_cases(only_tables=['KPX'], target_date=day, seed=42)[3]
+
+
+def test_rows_after_keeps_only_rows_later_than_watermark():
+    cases = _kpx_day(D)
+    times = cases.column('TM')
+    
+    after = sim._rows_after(cases, times[9])
+    assert list(after.column('TM')) == list(times[10:])
+    
+    assert sim._rows_after(cases, None) is cases
+    assert len(sim._rows_after(cases, times[-1])) == 0
+    assert len(sim._rows_after(cases, f"{D - datetime.timedelta(days=1):%Y%m%d}2350")) == len(cases)
+
+
+def test_first_days_start_from_watermark_date_without_from():
+    watermarks = {'KPX': f"{D - datetime.timedelta(days=3):%Y%m%d}1200"}
+    first_days = sim.incremental_first_days(['KPX', 'GEN'], watermarks, None, D)
+    assert first_days == {'KPX': D - datetime.timedelta(days=3), 'GEN': D}
+
+
+def test_first_days_clamp_to_explicit_start_date():
+    watermarks = {'KPX': f"{D - datetime.timedelta(days=10):%Y%m%d}1200", 'GEN': f"{D:%Y%m%d}0000"}
+    start_date = D - datetime.timedelta(days=5)
+    first_days = sim.incremental_first_days(['KPX', 'GEN', 'NWP'], watermarks, start_date, D)
+    assert first_days == {'KPX': start_date, 'GEN': D, 'NWP': start_date}
+
+
+def test_first_days_skip_tables_loaded_past_end_date():
+    watermarks = {'KPX': f"{D + datetime.timedelta(days=1):%Y%m%d}0000"}
+    assert sim.incremental_first_days(['KPX'], watermarks, None, D) == {}
+
+
+def test_run_incremental_fills_every_day_after_watermark(monkeypatch):
+    watermark = f"{D - datetime.timedelta(days=3):%Y%m%d}2300"
+    loaded = []
+    
+    def fake_load(connection, *test_cases, only_tables=None, loader='copy'):
+        kpx = test_cases[3]
+        loaded.append(list(kpx.column('TM')))
+        return {label: len(kpx) if label == 'KPX' else 0 for label in only_tables}, {label: 0 for label in only_tables}
+    
+    monkeypatch.setattr(sim, 'acquire_connection', lambda: object())
+    monkeypatch.setattr(sim, 'release_connection', lambda connection: None)
+    monkeypatch.setattr(sim, 'ensure_schema', lambda connection: True)
+    monkeypatch.setattr(sim, 'get_watermarks', lambda connection, labels, path=None: {'KPX': watermark})
+    monkeypatch.setattr(sim, 'load_test_cases', fake_load)
+    monkeypatch.setattr(sim, 'commit_transaction', lambda connection: None)
+    monkeypatch.setattr(sim, 'update_watermark_file', lambda path, watermarks: None)
+    monkeypatch.setattr(sim, 'write_metrics_file', lambda: None)
+    
+    totals = sim.run_incremental(end_date=D, only_tables=['KPX'], seed=42)
+    
+    loaded_times = [tm for day_times in loaded for tm in day_times]
+    loaded_days = sorted({tm[:8] for tm in loaded_times})
+    expected_days = [f"{D - datetime.timedelta(days=offset):%Y%m%d}" for offset in (2, 1, 0)]
+    assert loaded_days == expected_days
+    assert all(tm > watermark for tm in loaded_times)
+    assert totals['KPX'] == len(loaded_times) == sum(len(_kpx_day(datetime.datetime.strptime(day, "%Y%m%d").date())) for day in expected_days)